@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# Description : 대시보드 데이터 경로 단계별 벤치마크 (헤드리스, 네트워크 불필요)
+#   - 합성 스냅샷(bench.synthetic)을 만들고 대시보드가 쓰는 단계 함수를 직접 호출해 시간 측정
+#   - 단계: 탐색(카탈로그) → 엑셀 파싱(사이드카가 없을 때의 경로) → 사이드카/부분 집계 로딩 → 합산
+#           → 추세 화면 → Top N 드릴다운 → 네트워크 좌표 → 글로벌 순위
+#   - 결과는 표로 출력하고, --record를 주면 JSONL로 누적 (회귀/개선 추적)
+# Usage : python -m bench.data_path [--weeks 52] [--keywords 200] [--rows 300] [--sources 150] [--repeat 3]
+#         python -m bench.data_path --root /tmp/kostec-synth   # 이미 생성된 루트 재사용 (없으면 생성)
+# License : MIT
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import unicodedata
+from datetime import datetime
+
+from bench.synthetic import generate_snapshots, working_dir
+from kostec.aggregates import combine_partials
+from kostec.drilldown import drilldown_display, drilldown_page, keyword_drilldown
+from kostec.network import network_payload
+from kostec.rankings import load_keyword_map, rank_tables
+from kostec.snapshot_catalog import SnapshotCatalog, open_catalog
+from kostec.snapshot_reader import SHEET_CACHE, SnapshotRange
+from kostec.snapshot_store import read_excel_sheets
+
+DRILLDOWN_COLUMNS = ("Keyword", "Short Summary", "Detailed Summary", "Source URL")
+NETWORK_TOP_K = 200
+
+
+def _key(entries):
+    return tuple((e["path"], e["sha256"]) for e in entries)
+
+
+def run_stages(skip_excel=False):
+    """단계 한 번 실행. 반환: [(단계, 초, 행 수)]. 각 실행은 시트 캐시를 비운 상태(cold)에서 시작."""
+    SHEET_CACHE.clear()
+    results, ctx = [], {}
+
+    def stage(name, func):
+        started = time.perf_counter()
+        rows = func()
+        results.append((name, time.perf_counter() - started, rows))
+
+    def discovery():
+        catalog = open_catalog()
+        ctx["cn"], ctx["en"] = catalog.entries("cn"), catalog.entries("en")
+        return len(ctx["cn"]) + len(ctx["en"])
+
+    def rescan():
+        # catalog.json 없이 디렉토리를 처음부터 훑는 경우
+        catalog = SnapshotCatalog(path=os.devnull)
+        catalog.refresh()
+        return len(catalog.entries("cn")) + len(catalog.entries("en"))
+
+    def excel():
+        return sum(len(read_excel_sheets(e["path"])["Summary Table"]) for e in ctx["cn"])
+
+    def load():
+        snapshot_range = SnapshotRange(_key(ctx["cn"]))
+        ctx["partials"], _ = snapshot_range.partials()
+        ctx["summary"], _ = snapshot_range.sheet("Summary Table", DRILLDOWN_COLUMNS)
+        return len(ctx["summary"])
+
+    def combine():
+        ctx["frames"] = combine_partials(ctx["partials"])
+        return len(ctx["frames"]["daily"])
+
+    def trend():
+        views = ctx["frames"]["series"].trend_views()
+        selected = views.keywords[:5]  # 탭 3 기본 선택
+        return sum(len(views.frame(name, selected)) for name in [*views.views, *views.ewm_spans])
+
+    def drilldown():
+        df = keyword_drilldown(ctx["summary"], ctx["frames"]["keyword_counts"])
+        drilldown_display(drilldown_page(df, 1, 20)).to_html(escape=False, index=False)
+        return len(df)
+
+    def network():
+        nodes, edges = network_payload(ctx["frames"]["cooccur_edges"], "shell", top_k=NETWORK_TOP_K)
+        return len(edges)
+
+    def ranking():
+        df_global, _ = SnapshotRange(_key(ctx["en"])).sheet("Summary Table", ("Keyword", "Keyword Count"))
+        df_china, df_global_rank = rank_tables(ctx["frames"]["keyword_counts"], df_global, load_keyword_map())
+        return len(df_china) + len(df_global_rank)
+
+    stage("탐색 (catalog.json)", discovery)
+    stage("탐색 (디렉토리 재스캔)", rescan)
+    if not skip_excel:
+        stage("엑셀 파싱 (요약표 전체)", excel)
+    stage("사이드카/부분 집계 로딩", load)
+    stage("부분 집계 합산", combine)
+    stage("추세 화면 (전체 기준)", trend)
+    stage("Top N 드릴다운", drilldown)
+    stage("네트워크 좌표", network)
+    stage("글로벌 순위", ranking)
+    return results
+
+
+def summarize(runs):
+    """반복 실행 결과 → [(단계, 중앙값 초, 최소 초, 행 수)]."""
+    table = []
+    for i, (name, _, rows) in enumerate(runs[0]):
+        seconds = [run[i][1] for run in runs]
+        table.append((name, statistics.median(seconds), min(seconds), rows))
+    return table
+
+
+def _pad(text, width, right=False):
+    # 한글은 터미널에서 두 칸 → 표시 폭 기준으로 맞춤
+    shown = sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+    fill = " " * max(width - shown, 0)
+    return fill + text if right else text + fill
+
+
+def print_table(table):
+    width = max(len(name) * 2 for name, *_ in table) // 2 + 12
+    print(_pad("단계", width) + _pad("중앙값(ms)", 12, True) + _pad("최소(ms)", 12, True) + _pad("행 수", 10, True))
+    for name, median, best, rows in table:
+        print(_pad(name, width) + f"{median * 1000:>12.1f}{best * 1000:>12.1f}{rows:>10}")
+    print(_pad("합계", width) + f"{sum(m for _, m, _, _ in table) * 1000:>12.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 데이터 경로 벤치마크 (합성 스냅샷)")
+    parser.add_argument("--root", help="합성 스냅샷 루트 (없으면 임시 디렉토리에 만들고 끝나면 삭제)")
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--keywords", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=300, help="스냅샷당 요약표 행 수")
+    parser.add_argument("--sources", type=int, default=150, help="스냅샷당 출처 행 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-excel", action="store_true", help="엑셀 파싱 단계 생략 (규모가 클 때)")
+    parser.add_argument("--record", help="결과를 JSONL로 추가 기록할 경로")
+    args = parser.parse_args(argv)
+
+    root = args.root or tempfile.mkdtemp(prefix="kostec-bench-")
+    scale = {"weeks": args.weeks, "keywords": args.keywords, "rows": args.rows, "sources": args.sources}
+    try:
+        if not os.path.exists(os.path.join(root, "assets", "data", "catalog.json")):
+            print(f"합성 스냅샷 생성: {scale} → {root}")
+            started = time.perf_counter()
+            generate_snapshots(root, args.weeks, args.keywords, args.rows, args.sources, seed=args.seed)
+            print(f"  생성 {time.perf_counter() - started:.1f}초")
+        else:
+            print(f"기존 합성 스냅샷 사용: {root}")
+        with working_dir(root):
+            runs = [run_stages(args.skip_excel) for _ in range(args.repeat)]
+    finally:
+        if not args.root:
+            shutil.rmtree(root, ignore_errors=True)
+
+    table = summarize(runs)
+    print_table(table)
+    if args.record:
+        record = {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "scale": scale if not args.root else {"root": args.root},
+            "repeat": args.repeat,
+            "stages": [{"stage": name, "median": round(m, 4), "min": round(b, 4), "rows": rows} for name, m, b, rows in table],
+        }
+        with open(args.record, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
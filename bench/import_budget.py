@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# Description : 대시보드 시작 시 import 확인 (새 인터프리터에서 최상위 import 문만 실행)
+#   - 기능 안에서만 import해야 하는 무거운 모듈(DEFERRED_MODULES)이 시작 시 sys.modules에 있으면 실패
+#     → tests/test_import_budget.py가 같은 검사를 테스트로 실행
+#   - 시간은 고정 ms가 아니라 같은 프로세스에서 먼저 import한 pandas+streamlit 대비 비율로 확인
+#     (기계/디스크 캐시에 따라 pandas+streamlit만 0.5~1초로 흔들리므로)
+#   - 반복 측정의 중앙값 사용, -X importtime으로 누적 시간이 큰 모듈을 함께 출력
+# Usage : python -m bench.import_budget [--budget-ratio 0.25] [--repeat 5] [--top 10]
+# License : MIT
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+APP_PATH = "streamlitdashboard.py"
+BASELINE_IMPORTS = ["import pandas", "import streamlit"]
+DEFAULT_BUDGET_RATIO = 0.25
+# 렌더링 경로에서 쓰지 않거나 특정 탭/기능에서만 쓰는 모듈 (해당 함수 안에서 import)
+DEFERRED_MODULES = [
+    "matplotlib", "matplotlib_venn", "sumy", "scipy", "networkx", "altair", "streamlit_agraph",
+    "anthropic", "github",
+]
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+{baseline}
+baseline_done = time.perf_counter()
+{statements}
+done = time.perf_counter()
+print(json.dumps({{
+    "baseline_ms": (baseline_done - started) * 1000,
+    "app_ms": (done - baseline_done) * 1000,
+    "loaded": sorted(m for m in {deferred!r} if m in sys.modules),
+}}))
+"""
+
+
+def top_level_imports(path=APP_PATH):
+    """앱 파일의 최상위 import 문 (함수 안 import는 제외)."""
+    with open(path, "r", encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source)
+    return [ast.get_source_segment(source, node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def probe(statements, importtime=False):
+    """새 인터프리터에서 pandas+streamlit → 앱 import 순으로 실행.
+    반환: ({"baseline_ms", "app_ms", "loaded"}, [(모듈, 누적 us, 깊이)] — importtime일 때만)."""
+    code = _PROBE.format(baseline="\n".join(BASELINE_IMPORTS), statements="\n".join(statements),
+                         deferred=DEFERRED_MODULES)
+    result = subprocess.run(
+        [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", code],
+        capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(APP_PATH)) or ".",
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(cumulative_us), (len(name) - len(name.lstrip(" ")) - 1) // 2))
+    return json.loads(result.stdout), rows
+
+
+def eager_modules(path=APP_PATH):
+    """시작 시 로드되면 안 되는데 로드된 모듈 목록 (비어 있어야 정상)."""
+    return probe(top_level_imports(path))[0]["loaded"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 시작 import 확인")
+    parser.add_argument("--budget-ratio", type=float, default=DEFAULT_BUDGET_RATIO,
+                        help="앱 import 시간 / pandas+streamlit import 시간 상한")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="누적 시간이 큰 모듈 출력 개수")
+    args = parser.parse_args(argv)
+
+    statements = top_level_imports()
+    results = [probe(statements)[0] for _ in range(args.repeat)]
+    baseline_ms = statistics.median(r["baseline_ms"] for r in results)
+    app_ms = statistics.median(r["app_ms"] for r in results)
+    ratio = app_ms / baseline_ms
+
+    print(f"최상위 import {len(statements)}줄, {args.repeat}회 중앙값")
+    print(f"  pandas+streamlit {baseline_ms:8.1f} ms")
+    print(f"  그 밖의 import   {app_ms:8.1f} ms  ({ratio:.0%}, 상한 {args.budget_ratio:.0%})")
+    # pandas+streamlit 이후에 새로 import된 모듈 중 누적 시간이 큰 것
+    _, rows = probe(statements, importtime=True)
+    baseline_roots = {name.split()[-1] for name in BASELINE_IMPORTS}
+    last = max(i for i, (name, _, depth) in enumerate(rows) if depth == 0 and name in baseline_roots)
+    roots = sorted(((c, name) for name, c, depth in rows[last + 1:] if depth == 0), reverse=True)
+    for cumulative, name in roots[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    eager = sorted({m for r in results for m in r["loaded"]})
+    if eager:
+        print(f"❌ 시작 시 로드되면 안 되는 모듈: {', '.join(eager)}")
+    if ratio > args.budget_ratio:
+        print(f"❌ 앱 import 시간이 pandas+streamlit 대비 {ratio:.0%} (상한 {args.budget_ratio:.0%})")
+    ok = not eager and ratio <= args.budget_ratio
+    if ok:
+        print("✅ import 예산 이내")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# Description : 마크다운 표 파서 마이크로벤치마크 (기존 정규식 + read_csv(engine="python") 대비)
+#   - 입력: assets/data 스냅샷의 요약표/출처를 응답과 같은 마크다운 표로 되돌린 것
+#           + assets/cache/responses의 원본 응답(있으면)
+#   - 두 방식의 셀 내용이 같은지 확인한 뒤 반복 실행 시간을 비교
+# Usage : python -m bench.markdown_table [--repeat 20]
+# License : MIT
+
+import argparse
+import glob
+import re
+import time
+from io import StringIO
+
+import pandas as pd
+
+from kostec.markdown_table import parse_markdown_table
+from kostec.report_parser import parse_report
+from kostec.response_cache import ResponseCache
+from kostec.snapshot_reader import SnapshotReader
+
+
+def legacy_read_table(sheet_text):
+    # 변경 전 collector의 표 파싱 (정규식으로 표 추출 → read_csv → 빈 열 제거)
+    table_match = re.search(r"(\|.+?\|\n\|[-|]+\|\n(.+?))$", sheet_text, re.DOTALL)
+    table_md = table_match.group(1).strip() if table_match else ""
+    if not table_md:
+        return pd.DataFrame()
+    return pd.read_csv(StringIO(table_md), sep="|", engine="python").dropna(axis=1, how="all")
+
+
+def _pad(value):
+    text = "" if pd.isna(value) else str(value)
+    return text if text.startswith(" ") else f" {text} "
+
+
+def to_markdown(df):
+    lines = ["|" + "|".join(_pad(c) for c in df.columns) + "|", "|" + "|".join("---" for _ in df.columns) + "|"]
+    lines += ["|" + "|".join(_pad(v) for v in row) + "|" for row in df.itertuples(index=False)]
+    return "\n" + "\n".join(lines) + "\n"
+
+
+def load_inputs():
+    tables = []
+    for path in sorted(glob.glob("assets/data/*.xlsx")):
+        reader = SnapshotReader(path)
+        tables += [to_markdown(reader.sheet("Summary Table")), to_markdown(reader.sheet("Sources"))]
+    cache = ResponseCache()
+    for meta in cache.entries():
+        text = "".join(cache.iter_text(meta["key"]))
+        sheet1, sheet2, _ = parse_report(text)
+        tables += [sheet1, sheet2]
+    return tables
+
+
+def same_cells(legacy, parsed):
+    # 기존 방식은 구분선이 첫 행으로 남으므로 제외하고, 숫자 열은 문자열로 맞춰 비교
+    legacy = legacy.iloc[1:].reset_index(drop=True)
+    if list(legacy.columns) != list(parsed.columns) or len(legacy) != len(parsed):
+        return False
+    for name in legacy.columns:
+        left = legacy[name].map(lambda v: "" if pd.isna(v) else str(v).strip())
+        right = parsed[name].map(lambda v: "" if pd.isna(v) else str(v).strip())
+        if not left.equals(right):
+            return False
+    return True
+
+
+def timed(func, tables, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for table in tables:
+            func(table)
+    return (time.perf_counter() - started) / repeat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="마크다운 표 파서 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    tables = load_inputs()
+    rows = sum(table.count("\n") for table in tables)
+    mismatched = sum(not same_cells(legacy_read_table(t), parse_markdown_table(t)[0]) for t in tables)
+    print(f"표 {len(tables)}개, 약 {rows}줄, 셀 내용 불일치 {mismatched}개")
+
+    legacy = timed(legacy_read_table, tables, args.repeat)
+    current = timed(parse_markdown_table, tables, args.repeat)
+    print(f"regex + read_csv(python) : {legacy * 1000:8.1f} ms / 전체")
+    print(f"parse_markdown_table     : {current * 1000:8.1f} ms / 전체  ({legacy / current:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Description : 대시보드 첫 로딩 측정 (헤드리스 AppTest)
+#   - 새 세션마다 첫 로딩에 걸린 시간과 스크립트 실행 횟수(session_state["script_runs"])를 출력
+#   - 첫 세션은 캐시가 비어 있는 상태(cold), 이후 세션은 같은 프로세스의 캐시를 공유(warm)
+#   - 새 세션의 첫 로딩은 스크립트 1회 실행이어야 함 (st.rerun()으로 전체를 다시 돌리지 않음)
+#   - 기간을 주지 않으면 카탈로그의 마지막 스냅샷 주간을 선택 (대시보드 기본값인 최근 7일은 데이터가 없을 수 있음)
+# Usage : python -m bench.startup [--sessions 3] [--start 2025-04-01 --end 2025-06-30]
+# License : MIT
+
+import argparse
+import os
+import time
+from datetime import date, datetime, timedelta
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from kostec.snapshot_catalog import open_catalog
+
+APP_PATH = "streamlitdashboard.py"
+
+
+def latest_week():
+    """카탈로그의 마지막 스냅샷 날짜까지 7일 (카탈로그가 비어 있으면 (None, None))."""
+    dates = open_catalog().dates()
+    if not dates:
+        return None, None
+    end = datetime.strptime(dates[-1], "%Y%m%d").date()
+    return end - timedelta(days=6), end
+
+
+def run_session(start=None, end=None, timeout=300):
+    at = AppTest.from_file(os.path.abspath(APP_PATH), default_timeout=timeout)
+    started = time.perf_counter()
+    at.run()
+    if start and end:
+        # 기간 변경은 사용자 조작에 의한 두 번째 실행
+        at.date_input(key="start_date").set_value(start)
+        at.date_input(key="end_date").set_value(end)
+        at.run()
+    elapsed = time.perf_counter() - started
+    return at, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="대시보드 첫 로딩 측정")
+    parser.add_argument("--sessions", type=int, default=3)
+    parser.add_argument("--start", type=date.fromisoformat)
+    parser.add_argument("--end", type=date.fromisoformat)
+    args = parser.parse_args(argv)
+    if not (args.start and args.end):
+        args.start, args.end = latest_week()
+    print(f"기간: {args.start} ~ {args.end}" if args.start else "기간: 대시보드 기본값 (카탈로그 비어 있음)")
+
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    expected_runs = 2 if args.start and args.end else 1
+    ok = True
+    for i in range(args.sessions):
+        at, elapsed = run_session(args.start, args.end)
+        runs = at.session_state["script_runs"]
+        label = "cold" if i == 0 else "warm"
+        print(f"세션 {i + 1} ({label}): {elapsed:6.2f}초, 스크립트 실행 {runs}회, 예외 {len(at.exception)}건")
+        ok = ok and runs == expected_runs and not at.exception
+    print("✅ 새 세션당 스크립트 실행 횟수 정상" if ok else f"❌ 새 세션당 실행 횟수가 {expected_runs}회가 아님")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
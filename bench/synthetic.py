@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Description : 합성 스냅샷 생성기 (규모 측정용)
+#   - 실제와 같은 다섯 시트(Summary Table, Sources, Executive Summary, Cooccurrence, Associations)의
+#     *_trend_summary.xlsx / *_trend_summary_en.xlsx 를 주 단위로 생성
+#   - 수집과 같은 저장 경로(collector.save_snapshot) 사용 → Parquet 사이드카, 부분 집계, 카탈로그까지 생성
+#   - 모든 경로가 작업 디렉토리 기준(assets/...)이므로 별도 루트 디렉토리에 만들고 그 안에서 실행
+#   - 키워드 등장 빈도는 Zipf 분포, 요약문에는 다른 키워드를 섞어 동시출현이 생기도록 함
+# Usage : python -m bench.synthetic --root /tmp/kostec-synth [--weeks 52] [--keywords 200] [--rows 300] [--sources 150]
+# License : MIT
+
+import argparse
+import contextlib
+import os
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from kostec.collector import save_snapshot
+from kostec.cooccurrence import analyze_cooccurrence
+from kostec.rankings import EN_KEYWORDS_PATH, ZH_KEYWORDS_PATH
+from kostec.snapshot_catalog import snapshot_path
+
+DEFAULT_END = date(2025, 6, 27)
+LOCALE_PREFIX = {"cn": "技术", "en": "tech-"}
+
+
+@contextlib.contextmanager
+def working_dir(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+
+
+def vocabulary(locale, n_keywords):
+    # 고정 폭 번호 → 어떤 키워드도 다른 키워드의 부분 문자열이 아님
+    return [f"{LOCALE_PREFIX[locale]}{i:04d}" for i in range(n_keywords)]
+
+
+def _zipf_weights(n, exponent=1.1):
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def synthetic_sheets(locale, snapshot_date, n_keywords, n_rows, n_sources, rng):
+    """한 스냅샷의 다섯 시트 (Cooccurrence/Associations는 수집과 같이 요약표에서 계산)."""
+    words = vocabulary(locale, n_keywords)
+    weights = _zipf_weights(n_keywords)
+    published = [snapshot_date - timedelta(days=int(d)) for d in rng.integers(0, 7, n_sources)]
+    urls = [f"https://example.{locale}/{snapshot_date:%Y%m%d}/{j}.html" for j in range(n_sources)]
+    df_sources = pd.DataFrame({
+        "Source Name": [f"source {j % 25}" for j in range(n_sources)],
+        "URL": urls,
+        "Publication Date": [d.isoformat() for d in published],
+    })
+
+    keywords = rng.choice(words, size=n_rows, p=weights)
+    mentions = rng.choice(words, size=(n_rows, 2), p=weights)
+    short = [f"{kw} 관련 동향 {i}" for i, kw in enumerate(keywords)]
+    detailed = [f"{kw} 및 {a}, {b} 관련 상세 요약 {i}" for i, (kw, (a, b)) in enumerate(zip(keywords, mentions))]
+    df_summary = pd.DataFrame({
+        "Keyword": keywords,
+        "Keyword Count": rng.integers(1, 50, n_rows),
+        "Short Summary": short,
+        "Source URL": rng.choice(urls, size=n_rows),
+        "Detailed Summary": detailed,
+    })
+    df_exec = pd.DataFrame({"Executive Summary": [
+        "Five Most Impactful News Summaries:\n\n" + "\n".join(f"{i}. {s}" for i, s in enumerate(short[:5], 1))
+    ]})
+    df_cooccur, df_assoc = analyze_cooccurrence(df_summary)
+    return {
+        "Summary Table": df_summary,
+        "Sources": df_sources,
+        "Executive Summary": df_exec,
+        "Cooccurrence": df_cooccur,
+        "Associations": df_assoc,
+    }
+
+
+def write_keyword_files(n_keywords):
+    os.makedirs(os.path.dirname(ZH_KEYWORDS_PATH), exist_ok=True)
+    for path, locale in ((ZH_KEYWORDS_PATH, "cn"), (EN_KEYWORDS_PATH, "en")):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(vocabulary(locale, n_keywords)) + "\n")
+
+
+def generate_snapshots(root, weeks=52, n_keywords=200, n_rows=300, n_sources=150, end=DEFAULT_END,
+                       locales=("cn", "en"), seed=0, progress=print):
+    """root/assets/data 아래에 weeks주 x locales 스냅샷 생성. 반환: 생성한 xlsx 경로 목록."""
+    rng = np.random.default_rng(seed)
+    paths = []
+    with working_dir(root):
+        os.makedirs("assets/data", exist_ok=True)
+        write_keyword_files(n_keywords)
+        started = time.perf_counter()
+        for week in range(weeks):
+            snapshot_date = end - timedelta(weeks=weeks - 1 - week)
+            for locale in locales:
+                path = snapshot_path(snapshot_date.strftime("%Y%m%d"), locale)
+                save_snapshot(path, synthetic_sheets(locale, snapshot_date, n_keywords, n_rows, n_sources, rng))
+                paths.append(path)
+            if progress and (week + 1) % 10 == 0:
+                progress(f"  {week + 1}/{weeks}주 생성 ({time.perf_counter() - started:.0f}초)")
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 스냅샷 생성")
+    parser.add_argument("--root", required=True, help="생성할 루트 디렉토리 (assets/data가 그 아래에 만들어짐)")
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--keywords", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=300, help="스냅샷당 요약표 행 수")
+    parser.add_argument("--sources", type=int, default=150, help="스냅샷당 출처 행 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.root, exist_ok=True)
+    paths = generate_snapshots(args.root, args.weeks, args.keywords, args.rows, args.sources, seed=args.seed)
+    print(f"✅ 스냅샷 {len(paths)}개 생성: {os.path.join(args.root, 'assets', 'data')}")
+
+
+if __name__ == "__main__":
+    main()
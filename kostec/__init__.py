@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+# Description : KOSTEC 키워드 대시보드의 데이터 처리 모듈 모음
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Description : 선택 기간(스냅샷 묶음)에 대한 집계 계층
+#   - 스냅샷별 부분 집계(일자별 키워드 수, Keyword Count 합, 동시출현/연관어 수)를 수집 시 계산
+#   - 기간 조회는 부분 집계를 합산 → 키워드별 일자 누적합(kostec.timeseries)
+#   - 대시보드는 (스냅샷 경로, sha256) 묶음을 키로 결과 전체를 캐시
+#   - 동시출현/연관어 시트가 주어지지 않으면 요약표에서 바로 다시 계산 (로딩 시 재계산)
+# License : MIT
+
+import pandas as pd
+
+from kostec.cooccurrence import analyze_cooccurrence
+from kostec.timeseries import KeywordSeries
+
+REQUIRED_SOURCE_COLS = {"URL", "Publication Date"}
+
+
+def strip_columns(df):
+    df.columns = [str(col).strip() for col in df.columns]
+    return df
+
+
+def merge_publication_dates(df_summary, df_sources):
+    # URL 기준으로 날짜 매핑
+    df_merged = df_summary.merge(
+        df_sources[["URL", "Publication Date"]],
+        how="left",
+        left_on="Source URL",
+        right_on="URL"
+    )
+    df_merged["Publication Date"] = pd.to_datetime(df_merged["Publication Date"])
+    df_merged["Keyword"] = df_merged["Keyword"].astype(str)
+    return df_merged
+
+
+def daily_counts(df_summary, df_sources):
+    # 일자별 키워드 등장 횟수 집계
+    df_merged = merge_publication_dates(df_summary, df_sources)
+    return df_merged.groupby(["Publication Date", "Keyword"]).size().reset_index(name="count")
+
+
+# --- 스냅샷별 부분 집계 (수집/변환 시 한 번 계산해 사이드카로 저장)
+PARTIALS_VERSION = 1
+PARTIAL_COLUMNS = {
+    "daily": ["Publication Date", "Keyword", "count"],
+    "keyword_counts": ["Keyword", "Keyword Count"],
+    "cooccur_edges": ["source", "target", "count"],
+    "assoc_counts": ["term", "count"],
+}
+
+
+def _stripped(df):
+    return None if df is None else df.rename(columns=lambda c: str(c).strip())
+
+
+def _sum_by(df, keys, value):
+    if df is None or not set(keys + [value]) <= set(df.columns):
+        return pd.DataFrame(columns=keys + [value])
+    return df.groupby(keys, as_index=False)[value].sum()
+
+
+def build_snapshot_partials(df_summary, df_sources, df_exec=None, df_cooccur=None, df_assoc=None):
+    """스냅샷 하나의 부분 집계: 일자별 키워드 수, 키워드별 Keyword Count 합, 동시출현 엣지 수, 연관어 수.
+    df_cooccur/df_assoc가 None이면 요약표에서 계산."""
+    df_summary, df_sources = _stripped(df_summary), _stripped(df_sources)
+    if (df_cooccur is None or df_assoc is None) and "Keyword" in df_summary.columns:
+        computed_cooccur, computed_assoc = analyze_cooccurrence(df_summary)
+        df_cooccur = computed_cooccur if df_cooccur is None else df_cooccur
+        df_assoc = computed_assoc if df_assoc is None else df_assoc
+
+    if REQUIRED_SOURCE_COLS <= set(df_sources.columns) and {"Source URL", "Keyword"} <= set(df_summary.columns):
+        df_daily = daily_counts(df_summary, df_sources)
+    else:
+        df_daily = pd.DataFrame(columns=PARTIAL_COLUMNS["daily"])
+
+    return {
+        "daily": df_daily,
+        "keyword_counts": _sum_by(df_summary, ["Keyword"], "Keyword Count"),
+        "cooccur_edges": _sum_by(_stripped(df_cooccur), ["source", "target"], "count"),
+        "assoc_counts": _sum_by(_stripped(df_assoc), ["term"], "count"),
+    }
+
+
+def combine_partials(partials_list):
+    """부분 집계를 합산해 기간 결과를 만듦. 비용은 원본 행 수가 아니라 스냅샷(주) 수에 비례.
+    일자별 수는 하나의 달력 위 키워드별 누적합(series)으로 합치므로, 주 경계를 넘는 이동평균 창도
+    직전 주의 날짜를 그대로 이어받음."""
+    combined = {}
+    for name, columns in PARTIAL_COLUMNS.items():
+        parts = [p[name] for p in partials_list if p.get(name) is not None and not p[name].empty]
+        if parts:
+            df = pd.concat(parts, ignore_index=True)
+            combined[name] = df.groupby(columns[:-1], as_index=False)[columns[-1]].sum()
+        else:
+            combined[name] = pd.DataFrame(columns=columns)
+    combined["series"] = KeywordSeries.from_daily(combined["daily"])
+    return combined
+
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+# Description : 백그라운드 수집 작업 실행기
+#   - 중국/글로벌, 여러 날짜(백필)를 스레드 풀에서 동시에 실행 (동시 실행 수 제한)
+#   - 작업 상태는 assets/jobs/<작업ID>.json에 기록 → 새로고침/세션 종료 후에도 조회 가능
+#   - 조회는 메모리 색인에서 (파일은 시작할 때 한 번만 읽음), 끝난 작업은 MAX_FINISHED_JOBS개만 남기고 삭제
+#   - 스트리밍 중 완성된 표 행은 assets/jobs/<작업ID>.rows.jsonl에 바로 기록
+#   - 수집은 kostec.pipeline을 그대로 실행하고 단계별 소요 시간을 작업에 기록
+#   - 한 번에 등록한 작업 묶음(batch)은 모두 끝난 뒤 결과물을 한 커밋으로 GitHub에 업로드
+#   - API 토큰은 메모리로만 전달하고 파일에 남기지 않음
+# License : MIT
+
+import copy
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from kostec.collector import LOCALES
+from kostec.pipeline import COLLECT_PIPELINE, collection_context, publish_message
+from kostec.publisher import publish_snapshots
+
+JOBS_DIR = "assets/jobs"
+MAX_PARALLEL_JOBS = 2
+MAX_FINISHED_JOBS = 20
+ACTIVE_STATUSES = ("queued", "running")
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class JobRunner:
+    def __init__(self, jobs_dir=JOBS_DIR, max_workers=MAX_PARALLEL_JOBS, pipeline=COLLECT_PIPELINE, publish=publish_snapshots):
+        self.jobs_dir = jobs_dir
+        self._pipeline = pipeline
+        self._publish = publish
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="collect")
+        self._lock = threading.Lock()
+        self._batch_lock = threading.Lock()
+        self._batches = {}  # 묶음 ID → 남은 작업 수, 작업 목록, GitHub 토큰 (메모리에만 보관)
+        os.makedirs(jobs_dir, exist_ok=True)
+        self._jobs = {job["id"]: job for job in self._load_all()}  # 작업 ID → 작업 (_save가 갱신)
+        self._mark_interrupted()
+        self._prune()
+
+    # --- 저장/조회
+    def _job_path(self, job_id):
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def _spool_path(self, job_id):
+        return os.path.join(self.jobs_dir, f"{job_id}.rows.jsonl")
+
+    def _save(self, job):
+        with self._lock:
+            self._jobs[job["id"]] = job
+            tmp_path = self._job_path(job["id"]) + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(job, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self._job_path(job["id"]))
+
+    def _load_all(self):
+        jobs = []
+        for name in os.listdir(self.jobs_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.jobs_dir, name), "r", encoding="utf-8") as f:
+                    jobs.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return jobs
+
+    def _mark_interrupted(self):
+        # 이전 서버 프로세스에서 실행 중이던 작업은 더 이상 진행되지 않으므로 중단으로 표시
+        for job in list(self._jobs.values()):
+            if job["status"] in ACTIVE_STATUSES and job.get("pid") != os.getpid():
+                job.update(status="interrupted", finished_at=_now())
+                self._save(job)
+
+    def _prune(self):
+        # 끝난 작업은 최근 MAX_FINISHED_JOBS개만 남기고 상태 파일과 행 스풀을 함께 삭제 (업로드 대기 묶음은 제외)
+        with self._batch_lock:
+            pending = set(self._batches)
+        with self._lock:
+            finished = [job for job in self._jobs.values()
+                        if job["status"] not in ACTIVE_STATUSES and job.get("batch") not in pending]
+            finished.sort(key=lambda j: j["created_at"], reverse=True)
+            for job in finished[MAX_FINISHED_JOBS:]:
+                del self._jobs[job["id"]]
+                for path in (self._job_path(job["id"]), self._spool_path(job["id"])):
+                    if os.path.exists(path):
+                        os.remove(path)
+
+    def _snapshot(self, predicate=None):
+        # 작업 스레드가 고치는 중인 dict를 화면에 넘기지 않도록 복사본을 반환
+        with self._lock:
+            return [copy.deepcopy(job) for job in self._jobs.values() if predicate is None or predicate(job)]
+
+    def jobs(self, limit=20):
+        return sorted(self._snapshot(), key=lambda j: j["created_at"], reverse=True)[:limit]
+
+    def active_jobs(self):
+        return self._snapshot(lambda job: job["status"] in ACTIVE_STATUSES)
+
+    # --- 실행
+    def submit_batch(self, locales, dates, api_token, github_token=None, use_cache=True):
+        """날짜 x 언어 작업을 한 묶음으로 등록. 같은 언어/날짜 작업이 이미 대기/실행 중이면
+        새로 만들지 않고 그 작업을 반환 (그 작업은 이 묶음의 업로드에 포함되지 않음)."""
+        batch_id = uuid.uuid4().hex[:8]
+        active = {(job["locale"], job["date"]): job for job in self.active_jobs()}
+        jobs, new_jobs = [], []
+        for current_date in dates:
+            for locale in locales:
+                if (locale, current_date) in active:
+                    jobs.append(active[(locale, current_date)])
+                    continue
+                job = {
+                    "id": f"{current_date}_{locale}_{uuid.uuid4().hex[:8]}",
+                    "batch": batch_id,
+                    "locale": locale,
+                    "label": LOCALES[locale]["label"],
+                    "date": current_date,
+                    "status": "queued",
+                    "pid": os.getpid(),
+                    "created_at": _now(),
+                    "started_at": None,
+                    "finished_at": None,
+                    "log": [],
+                    "output": None,
+                    "error": None,
+                    "publish": None,
+                    "metrics": [],
+                }
+                self._save(job)
+                jobs.append(job)
+                new_jobs.append(job)
+
+        if new_jobs:
+            with self._batch_lock:
+                self._batches[batch_id] = {"pending": len(new_jobs), "jobs": new_jobs, "github_token": github_token}
+            for job in new_jobs:
+                self._pool.submit(self._run, job, api_token, use_cache)
+        return jobs
+
+    def _log(self, job, message):
+        job["log"].append(message)
+        self._save(job)
+
+    def _run(self, job, api_token, use_cache=True):
+        job.update(status="running", started_at=_now())
+        self._save(job)
+        # 작업별 업로드는 하지 않음 (github_token 없이 실행) → 묶음이 끝나면 _finish에서 한 번에
+        ctx = collection_context(
+            job["locale"], job["date"], api_token, use_cache=use_cache,
+            progress=lambda m: self._log(job, m),
+            spool_path=self._spool_path(job["id"]),
+        )
+        try:
+            self._pipeline.run(ctx)
+            job.update(status="succeeded", output=ctx["output"], metrics=ctx["metrics"], finished_at=_now())
+        except Exception as e:
+            job.update(status="failed", error=f"❌ 수집 중 오류 발생: {e}", metrics=ctx["metrics"], finished_at=_now())
+        self._finish(job)
+
+    def _finish(self, job):
+        with self._batch_lock:
+            batch = self._batches[job["batch"]]
+            batch["pending"] -= 1
+            done = batch["pending"] == 0
+            if done:
+                del self._batches[job["batch"]]
+
+        if batch["github_token"] and job["status"] == "succeeded":
+            job["publish"] = "⏳ GitHub 업로드 중..." if done else "⏳ 같은 묶음의 다른 작업이 끝나면 한 번에 업로드합니다."
+        self._save(job)
+        if done and batch["github_token"]:
+            self._publish_batch(batch)
+        self._prune()
+
+    def _publish_batch(self, batch):
+        succeeded = [job for job in batch["jobs"] if job["status"] == "succeeded"]
+        if not succeeded:
+            return
+        label = ", ".join(sorted({job["date"] for job in succeeded}))
+        message = publish_message(label, self._publish, [job["output"] for job in succeeded], batch["github_token"])
+        for job in succeeded:
+            job["publish"] = message
+            self._save(job)
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+# Description : 주간 동향 수집 단계 구현 (Claude 호출 → 태그/표 파싱 → 엑셀/사이드카 저장)
+#   - 단계 연결, 시간 측정, CLI는 kostec.pipeline / GitHub 업로드는 kostec.publisher
+#   - 중국(cn)/글로벌(en) 수집이 같은 함수를 사용
+#   - 응답은 스트리밍으로 받아 <excel_report> 구간을 수신 즉시 파싱 (완성된 행 수를 실시간 표시)
+#   - 진행 상황은 progress 콜백으로 전달 (대시보드 작업 목록, 콘솔 등)
+#   - 원본 응답은 프롬프트 기준으로 캐시되어, 같은 입력은 API 호출 없이 재사용
+# License : MIT
+
+import json
+
+import pandas as pd
+
+from kostec.aggregates import build_snapshot_partials
+from kostec.markdown_table import parse_markdown_table
+from kostec.report_parser import ReportStreamParser
+from kostec.snapshot_catalog import register_snapshot
+from kostec.snapshot_store import SHEET_NAMES, write_partials, write_sidecars
+
+MODEL = "claude-3-7-sonnet-20250219"
+MAX_TOKENS = 20000
+PROGRESS_EVERY_ROWS = 5
+PROMPT_PATH = "assets/input/prompt.txt"
+
+LOCALES = {
+    "cn": {"label": "중국", "keywords": "assets/input/keywords.txt", "sites": "assets/input/sites.txt"},
+    "en": {"label": "글로벌", "keywords": "assets/input/en_keywords.txt", "sites": None},
+}
+
+
+def _read_text(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+# --- 1. 프롬프트
+def build_prompt(locale, current_date):
+    inputs = LOCALES[locale]
+    return _read_text(PROMPT_PATH).format(
+        keywords=_read_text(inputs["keywords"]).strip(),    # 문자열 또는 리스트 join한 값
+        current_date=current_date,                           # '20250518' 같은 문자열
+        source_sites=_read_text(inputs["sites"]).strip() if inputs["sites"] else "*"  # 사이트 목록 또는 글로벌
+    )
+
+
+# --- 2. Claude API 호출 (스트리밍: 텍스트 조각마다 on_text 호출, stop_reason 반환)
+def request_report(prompt, api_token, on_text):
+    import anthropic
+
+    client = anthropic.Anthropic(api_key=api_token)
+    stream = client.messages.create(
+        model=MODEL,
+        max_tokens=MAX_TOKENS,
+        temperature=1,
+        messages=[
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": prompt
+                    }
+                ]
+            }
+        ],
+        stream=True,
+    )
+    stop_reason = None
+    for event in stream:
+        if event.type == "content_block_delta" and getattr(event.delta, "type", None) == "text_delta":
+            on_text(event.delta.text)
+        elif event.type == "message_delta":
+            stop_reason = event.delta.stop_reason
+    return stop_reason
+
+
+def stream_report(prompt, api_token, progress=print, spool_path=None, cache=None, use_cache=True, meta=None):
+    """응답을 스트리밍으로 받으며 파싱. 완성된 행은 spool_path(JSONL)에 바로 기록.
+    같은 프롬프트의 완전한 응답이 캐시에 있으면 API를 호출하지 않고 캐시를 재생.
+    응답이 잘리거나 중간에 끊겨도 완성된 요약표 행이 있으면 그 행들로 계속 진행."""
+    spool = open(spool_path, "a", encoding="utf-8") if spool_path else None
+
+    def on_row(section, cells):
+        if spool:
+            spool.write(json.dumps({"sheet": section, "cells": cells}, ensure_ascii=False) + "\n")
+            spool.flush()
+        if parser.rows[section] % PROGRESS_EVERY_ROWS == 0:
+            progress(f"수신 중: 요약표 {parser.rows['sheet1']}행, 출처 {parser.rows['sheet2']}행")
+
+    parser = ReportStreamParser(on_row=on_row)
+    key = cache.key(prompt, MODEL, MAX_TOKENS) if cache else None
+    cached = cache.get(key) if cache and use_cache else None
+    try:
+        if cached and cached.get("complete"):
+            progress("♻️ 동일한 입력의 캐시된 응답을 사용합니다 (API 호출 생략).")
+            for chunk in cache.iter_text(key):
+                parser.feed(chunk)
+            return parser
+
+        writer = cache.writer(key, dict(meta or {}, model=MODEL, max_tokens=MAX_TOKENS)) if cache else None
+
+        def on_text(text):
+            if writer:
+                writer.write(text)
+            parser.feed(text)
+
+        try:
+            stop_reason = request_report(prompt, api_token, on_text)
+        except Exception as e:
+            if not parser.rows["sheet1"]:
+                if writer:
+                    writer.discard()
+                raise
+            progress(f"⚠️ 응답 수신 중 오류({e}) → 완성된 {parser.rows['sheet1']}행으로 계속합니다.")
+            stop_reason = "error"
+        if writer:
+            writer.commit(stop_reason, complete=parser.complete and stop_reason == "end_turn")
+    finally:
+        if spool:
+            spool.close()
+
+    if stop_reason == "max_tokens" or not parser.complete:
+        progress(f"⚠️ 응답이 잘렸습니다. 완성된 요약표 {parser.rows['sheet1']}행, 출처 {parser.rows['sheet2']}행만 저장합니다.")
+    return parser
+
+
+# --- 3. 표 파싱 (구분선은 제외, 형식 오류 줄은 (시트, 줄 번호, 사유)로 반환)
+def parse_sheet_tables(sheet1_text, sheet2_text):
+    df_sheet1, problems1 = parse_markdown_table(sheet1_text)
+    df_sheet2, problems2 = parse_markdown_table(sheet2_text)
+    problems = [("sheet1",) + p for p in problems1] + [("sheet2",) + p for p in problems2]
+    return df_sheet1, df_sheet2, problems
+
+
+# --- 4. 저장 (엑셀 + Parquet 사이드카 + 부분 집계 + 카탈로그)
+def save_snapshot(excel_path, sheets):
+    with pd.ExcelWriter(excel_path, engine="openpyxl", mode="w") as writer:
+        for name in SHEET_NAMES:
+            sheets[name].to_excel(writer, index=False, sheet_name=name)
+
+    write_sidecars(excel_path, sheets)
+    write_partials(excel_path, build_snapshot_partials(*(sheets[name] for name in SHEET_NAMES)))
+    register_snapshot(excel_path, sheets)
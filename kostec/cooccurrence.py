@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+# Description : 키워드 동시출현/연관어 분석 (벡터화)
+#   - 요약문(상세+짧은 요약, 소문자) x 키워드 포함 여부 행렬을 만들고 (키워드마다 str.contains 한 번)
+#   - 행마다 함께 나온 키워드 쌍을 한 번에 펼쳐 쌍별 건수와 처음 함께 나온 행을 구함, 연관어 수는 열 합
+#   - 결과(행 순서, 부분 문자열 일치 규칙)는 기존 iterrows 구현과 동일
+# License : MIT
+
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+
+def _summary_texts(df_summary):
+    # 기존 구현과 같은 규칙: str(상세) + " " + str(짧은), 결측치는 "nan", 컬럼이 없으면 ""
+    def column(name):
+        if name in df_summary.columns:
+            return [str(v) for v in df_summary[name].tolist()]
+        return [""] * len(df_summary)
+
+    return [f"{d} {s}".lower() for d, s in zip(column("Detailed Summary"), column("Short Summary"))]
+
+
+def keyword_incidence(df_summary):
+    """(keywords_list, 정렬된 고유 키워드, 행 x 고유 키워드 bool 행렬).
+    keywords_list는 기존과 같이 중복(공백 제거 후 같은 키워드)을 포함할 수 있음."""
+    keywords_list = [kw.strip() for kw in df_summary["Keyword"].dropna().unique().tolist()]
+    unique = sorted(set(keywords_list))
+    texts = pd.Series(_summary_texts(df_summary), dtype="string")
+    matrix = np.zeros((len(texts), len(unique)), dtype=bool)
+    for j, kw in enumerate(unique):
+        matrix[:, j] = texts.str.contains(kw.lower(), regex=False).to_numpy(dtype=bool, na_value=False)
+    return keywords_list, unique, matrix
+
+
+def _first_rows(matrix):
+    # 각 열이 처음 True가 되는 행 번호 (없으면 행 수)
+    if not len(matrix):
+        return np.zeros(matrix.shape[1], dtype=np.int64)
+    return np.where(matrix.any(axis=0), matrix.argmax(axis=0), len(matrix))
+
+
+def _row_pairs(matrix):
+    # 행마다 함께 True인 열 쌍 (i < j)을 (행, i, j) 배열로 펼침 — 행 순서대로
+    rows, cols = np.nonzero(matrix)
+    row_end = np.cumsum(np.bincount(rows, minlength=len(matrix)))[rows]
+    later = row_end - np.arange(len(rows)) - 1  # 같은 행에서 뒤에 오는 True 수
+    left = np.repeat(np.arange(len(rows)), later)
+    starts = np.cumsum(later) - later
+    right = left + 1 + np.arange(len(left)) - np.repeat(starts, later)
+    return rows[left], cols[left], cols[right]
+
+
+def analyze_cooccurrence(df_summary):
+    keywords_list, unique, matrix = keyword_incidence(df_summary)
+    position = {kw: j for j, kw in enumerate(unique)}
+
+    # 연관어: 행마다 keywords_list 순서로 세던 것과 같음
+    #   → 중복 키워드는 중복 횟수만큼 더하고, 처음 나온 행 → keywords_list 위치 순으로 정렬
+    col_counts, col_first = matrix.sum(axis=0), _first_rows(matrix)
+    multiplicity, list_pos = Counter(keywords_list), {}
+    for pos, kw in enumerate(keywords_list):
+        list_pos.setdefault(kw, pos)
+    assoc_rows = sorted(
+        (kw for kw in list_pos if col_counts[position[kw]]),
+        key=lambda kw: (col_first[position[kw]], list_pos[kw]),
+    )
+
+    # 동시출현: 정렬된 고유 키워드 쌍 (i < j), 처음 함께 나온 행 → 그 행의 조합 순서대로
+    #   np.unique의 return_index는 처음 나온 위치 → 행 순서로 펼쳤으므로 처음 함께 나온 행
+    pair_rows, pair_src, pair_dst = _row_pairs(matrix)
+    keys, first_pos, pair_counts = np.unique(
+        pair_src * len(unique) + pair_dst, return_index=True, return_counts=True
+    )
+    src, dst, first = keys // len(unique), keys % len(unique), pair_rows[first_pos]
+    order = np.lexsort((dst, src, first))
+
+    if len(order):
+        df_cooccur = pd.DataFrame({
+            "source": [unique[i] for i in src[order]],
+            "target": [unique[j] for j in dst[order]],
+            "count": pair_counts[order],
+        })
+    else:
+        df_cooccur = pd.DataFrame()
+    if assoc_rows:
+        df_association = pd.DataFrame({
+            "term": assoc_rows,
+            "count": np.array([col_counts[position[kw]] * multiplicity[kw] for kw in assoc_rows], dtype=np.int64),
+        })
+    else:
+        df_association = pd.DataFrame()
+    return df_cooccur, df_association
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Description : 키워드 드릴다운 표 (탭 4)
+#   - 전체 키워드를 Keyword Count 내림차순으로 한 번에 정리 (그룹별 Python 람다 없이 first/drop_duplicates)
+#   - 키워드별 대표 요약(처음 나온 비어 있지 않은 값)과 중복 없는 출처 링크 전체
+#   - HTML 행도 열 단위 문자열 연산으로 한 번에 생성 → 페이지(슬라이스) 단위로 표시
+# License : MIT
+
+import math
+
+import pandas as pd
+
+DRILLDOWN_COLUMNS = ["Keyword", "Keyword Count", "Short Summary", "Detailed Summary", "Source URL"]
+DISPLAY_COLUMNS = ["Keyword", "Count", "Summary", "Sources"]
+
+
+def _escape(series):
+    # html.escape(quote=True)와 같은 치환을 열 단위로
+    return (
+        series.str.replace("&", "&amp;", regex=False)
+        .str.replace("<", "&lt;", regex=False)
+        .str.replace(">", "&gt;", regex=False)
+        .str.replace('"', "&quot;", regex=False)
+        .str.replace("'", "&#x27;", regex=False)
+    )
+
+
+def keyword_drilldown(df_summary, df_keyword_counts):
+    """키워드별 (Keyword, Keyword Count, Short/Detailed Summary, Source URL 목록). Keyword Count 내림차순."""
+    counts = df_keyword_counts[["Keyword", "Keyword Count"]].sort_values("Keyword Count", ascending=False, kind="stable")
+    df = counts.reset_index(drop=True)
+    if df_summary is None or df_summary.empty:
+        df["Short Summary"], df["Detailed Summary"] = "", ""
+        df["Source URL"] = [[] for _ in range(len(df))]
+        return df[DRILLDOWN_COLUMNS]
+
+    # groupby.first는 그룹별로 처음 나온 결측이 아닌 값
+    summaries = df_summary.groupby("Keyword", sort=False)[["Short Summary", "Detailed Summary"]].first()
+    df = df.join(summaries, on="Keyword")
+    df[["Short Summary", "Detailed Summary"]] = df[["Short Summary", "Detailed Summary"]].fillna("").astype(str)
+
+    urls = df_summary[["Keyword", "Source URL"]].dropna()
+    urls = urls.assign(**{"Source URL": urls["Source URL"].astype(str).str.strip()}).drop_duplicates()
+    urls = urls[urls["Source URL"] != ""]
+    url_lists = urls.groupby("Keyword", sort=False)["Source URL"].agg(list)
+    df["Source URL"] = df["Keyword"].map(url_lists)
+    df["Source URL"] = [u if isinstance(u, list) else [] for u in df["Source URL"]]
+    return df[DRILLDOWN_COLUMNS]
+
+
+def page_count(total, page_size):
+    return max(1, math.ceil(total / page_size))
+
+
+def drilldown_page(df_drilldown, page, page_size):
+    """1부터 시작하는 page번째 페이지의 행."""
+    start = (page - 1) * page_size
+    return df_drilldown.iloc[start:start + page_size]
+
+
+def drilldown_display(df_page):
+    """표시용 (Keyword, Count, Summary, Sources) — 요약은 마우스를 올리면 상세 요약, 출처는 링크 전체."""
+    summary = '<span title="' + _escape(df_page["Detailed Summary"]) + '">' + _escape(df_page["Short Summary"]) + "</span>"
+
+    links = df_page[["Keyword", "Source URL"]].explode("Source URL").dropna(subset=["Source URL"])
+    if links.empty:
+        sources = pd.Series("", index=df_page.index)
+    else:
+        # 링크가 하나면 "🔗 link", 여러 개면 "🔗 1", "🔗 2", ... (주소는 title로 표시)
+        number = links.groupby(level=0).cumcount() + 1
+        several = links.groupby(level=0)["Source URL"].transform("size") > 1
+        label = ("🔗 " + number.astype(str)).where(several, "🔗 link")
+        href = _escape(links["Source URL"].astype(str))
+        anchors = '<a href="' + href + '" title="' + href + '" target="_blank">' + label + "</a>"
+        sources = anchors.groupby(level=0).agg(" ".join).reindex(df_page.index, fill_value="")
+
+    return pd.DataFrame({
+        "Keyword": df_page["Keyword"].to_numpy(),
+        "Count": df_page["Keyword Count"].to_numpy(),
+        "Summary": summary.to_numpy(),
+        "Sources": sources.to_numpy(),
+    }, columns=DISPLAY_COLUMNS)
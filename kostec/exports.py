@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# Description : 기간 일괄 내보내기 (탭 1)
+#   - 원본 묶음: 기간 내 중국/글로벌 스냅샷 xlsx를 ZIP 하나로 (파일 단위로 디스크에서 복사, 메모리에 모으지 않음)
+#   - 통합 엑셀: 언어 x 시트별 시트 하나에 모든 스냅샷 행을 이어 붙인 워크북 (openpyxl write-only, 스냅샷 하나씩 기록)
+#   - Parquet 묶음: 언어 x 시트별 Parquet 파일을 ZIP으로 (시트 하나씩 합쳐서 기록)
+#   - 결과물은 assets/exports/에 (기간 첫날_마지막날_내용 해시) 이름으로 저장 → 같은 기간은 한 번만 생성
+#   - 임시 파일에 쓴 뒤 이름을 바꿔 확정, 오래된 결과물은 MAX_EXPORTS개만 남기고 삭제
+# License : MIT
+
+import hashlib
+import os
+import tempfile
+import threading
+import zipfile
+
+import pandas as pd
+
+from kostec.snapshot_reader import SheetCache, SnapshotReader
+from kostec.snapshot_store import SHEET_NAMES, sheet_slug, write_parquet
+
+EXPORTS_DIR = "assets/exports"
+MAX_EXPORTS = 20
+DATE_COLUMN = "Snapshot Date"
+LOCALE_LABELS = {"cn": "CN", "en": "EN"}
+EXPORT_KINDS = {  # 종류: (확장자, MIME)
+    "zip": (".zip", "application/zip"),
+    "workbook": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "parquet": ("_parquet.zip", "application/zip"),
+}
+_BUILD_LOCK = threading.Lock()  # 여러 세션이 같은 결과물을 동시에 만들지 않도록
+
+
+# --- 1. 경로
+def export_path(kind, entries, exports_dir=EXPORTS_DIR):
+    """entries: 카탈로그 항목 목록 (중국+글로벌). 파일 내용(sha256)이 같으면 같은 경로."""
+    digest = hashlib.sha256(kind.encode("utf-8"))
+    for e in sorted(entries, key=lambda e: e["path"]):
+        digest.update(f"\n{e['path']}:{e['sha256']}".encode("utf-8"))
+    dates = sorted(e["date"] for e in entries)
+    return os.path.join(exports_dir, f"{dates[0]}_{dates[-1]}_{digest.hexdigest()[:12]}{EXPORT_KINDS[kind][0]}")
+
+
+def file_reader(path):
+    """download_button(data=...)용: 클릭했을 때만 파일을 열어 핸들을 넘김 (내용을 미리 bytes로 읽어 두지 않음)."""
+    def open_file():
+        return open(path, "rb")
+    return open_file
+
+
+def _prune(exports_dir, keep):
+    files = [os.path.join(exports_dir, name) for name in os.listdir(exports_dir) if not name.endswith(".tmp")]
+    files.sort(key=os.path.getmtime, reverse=True)
+    for path in files[MAX_EXPORTS:]:
+        if path != keep:
+            os.remove(path)
+
+
+# --- 2. 생성
+def _readers(entries):
+    # 대시보드의 시트 캐시를 밀어내지 않도록 한 장짜리 캐시 사용 (시트를 하나씩 읽고 버림)
+    cache = SheetCache(max_bytes=0)
+    return [(e["date"], SnapshotReader(e["path"], e["sha256"], cache)) for e in entries]
+
+
+def _union_columns(readers, sheet_name):
+    # 데이터를 읽지 않고 스키마만 조회 → 스냅샷마다 컬럼이 달라도 머리글 한 줄로 맞춤
+    columns = []
+    for _, reader in readers:
+        columns += [c for c in reader.columns(sheet_name) if c not in columns]
+    return columns
+
+
+def _write_zip(out_path, entries):
+    # xlsx는 이미 압축된 형식이므로 다시 압축하지 않고 저장만
+    with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_STORED) as zf:
+        for e in entries:
+            zf.write(e["path"], arcname=os.path.basename(e["path"]))
+
+
+def _write_workbook(out_path, entries):
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for locale, label in LOCALE_LABELS.items():
+        locale_entries = [e for e in entries if e["locale"] == locale]
+        if not locale_entries:
+            continue
+        readers = _readers(locale_entries)
+        for sheet_name in SHEET_NAMES:
+            ws = wb.create_sheet(f"{label} {sheet_name}"[:31])
+            columns = _union_columns(readers, sheet_name)
+            ws.append([DATE_COLUMN] + columns)
+            for snapshot_date, reader in readers:
+                df = reader.sheet(sheet_name).reindex(columns=columns)
+                for row in df.astype(object).where(df.notna(), None).itertuples(index=False):
+                    ws.append([snapshot_date, *row])
+    wb.save(out_path)
+
+
+def _write_parquet_bundle(out_path, entries):
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for locale in LOCALE_LABELS:
+            readers = _readers([e for e in entries if e["locale"] == locale])
+            if not readers:
+                continue
+            for sheet_name in SHEET_NAMES:
+                df = pd.concat(
+                    [reader.sheet(sheet_name).assign(**{DATE_COLUMN: snapshot_date}) for snapshot_date, reader in readers],
+                    ignore_index=True,
+                )
+                name = f"{locale}_{sheet_slug(sheet_name)}.parquet"
+                write_parquet(df, os.path.join(tmp_dir, name))
+                zf.write(os.path.join(tmp_dir, name), arcname=name)
+                del df
+
+
+_WRITERS = {"zip": _write_zip, "workbook": _write_workbook, "parquet": _write_parquet_bundle}
+
+
+def build_export(kind, entries, exports_dir=EXPORTS_DIR):
+    """kind("zip"/"workbook"/"parquet") 결과물 경로. 이미 있으면 만들지 않고 그대로 반환."""
+    out_path = export_path(kind, entries, exports_dir)
+    with _BUILD_LOCK:
+        if os.path.exists(out_path):
+            os.utime(out_path)  # 최근 사용 → 정리 대상에서 뒤로
+            return out_path
+        os.makedirs(exports_dir, exist_ok=True)
+        tmp_path = out_path + ".tmp"
+        try:
+            _WRITERS[kind](tmp_path, sorted(entries, key=lambda e: (e["locale"], e["date"])))
+            os.replace(tmp_path, out_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        _prune(exports_dir, keep=out_path)
+    return out_path
+
+
+def export_reader(kind, entries, exports_dir=EXPORTS_DIR):
+    """download_button(data=...)용: 클릭했을 때 (없으면 생성 후) 결과물 파일 핸들을 넘김."""
+    def open_export():
+        return open(build_export(kind, entries, exports_dir), "rb")
+    return open_export
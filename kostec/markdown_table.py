@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Description : LLM 응답의 마크다운 표 파서 (한 번 훑어서 DataFrame 생성)
+#   - 헤더 + 구분선(|---|:--:|) 다음 줄부터를 데이터 행으로 읽음 (구분선은 데이터에 넣지 않음)
+#   - 셀 안의 \| 는 문자 | 로 처리
+#   - 열이 모자란 행은 빈 값으로 채우고, 넘치는 행은 초과분을 마지막 열에 합침 (요약문 속 | 대응)
+#   - 형식 오류는 예외 대신 (줄 번호, 사유) 목록으로 반환
+#   - 셀 문자열은 기존 스냅샷과 같게 앞뒤 공백을 그대로 두고, 정수/실수로만 된 열은 숫자형으로 변환
+# License : MIT
+
+import re
+
+import numpy as np
+import pandas as pd
+
+_SEPARATOR = re.compile(r"\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?")
+_INT = re.compile(r"[+-]?\d+")
+_FLOAT = re.compile(r"[+-]?(\d+\.\d*|\.\d+|\d+)([eE][+-]?\d+)?")
+_ESCAPED_PIPE, _PLACEHOLDER = "\\|", "\x00"
+
+
+def split_row(line):
+    """'| a | b\\|c |' → [' a ', ' b|c ']. 양끝의 | 는 셀 경계로만 취급."""
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith(_ESCAPED_PIPE):
+        line = line[:-1]
+    if _ESCAPED_PIPE not in line:
+        return line.split("|")
+    return [cell.replace(_PLACEHOLDER, "|") for cell in line.replace(_ESCAPED_PIPE, _PLACEHOLDER).split("|")]
+
+
+def is_separator(line):
+    """헤더 구분선(|---|, | --- |, |:--:| 등)인지. 스트리밍 파서(kostec.report_parser)와 같은 규칙."""
+    line = line.strip()
+    return "-" in line and _SEPARATOR.fullmatch(line) is not None
+
+
+def _unique_names(names):
+    # read_csv와 같은 중복 열 이름 처리: a, a.1, a.2 ...
+    seen, result = {}, []
+    for name in names:
+        if name in seen:
+            seen[name] += 1
+            result.append(f"{name}.{seen[name]}")
+        else:
+            seen[name] = 0
+            result.append(name)
+    return result
+
+
+def _typed(values):
+    present = [v.strip() for v in values if v is not None]
+    if present and all(_INT.fullmatch(v) for v in present):
+        if len(present) == len(values):
+            return np.array([int(v) for v in present], dtype=np.int64)
+        return np.array([float(v) if v is not None else np.nan for v in values], dtype=np.float64)
+    if present and all(_FLOAT.fullmatch(v) for v in present):
+        return np.array([float(v) if v is not None else np.nan for v in values], dtype=np.float64)
+    return values
+
+
+def parse_markdown_table(text):
+    """(DataFrame, [(줄 번호, 사유), ...]). 표가 없으면 빈 DataFrame."""
+    lines = text.split("\n")
+    start = None
+    for i in range(1, len(lines)):
+        if lines[i - 1].strip().startswith("|") and is_separator(lines[i]):
+            start = i
+            break
+    if start is None:
+        return pd.DataFrame(), []
+
+    header = _unique_names(split_row(lines[start - 1]))
+    width = len(header)
+    columns = [[] for _ in range(width)]
+    problems = []
+    for number, line in enumerate(lines[start + 1:], start=start + 2):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if not stripped.startswith("|"):
+            problems.append((number, "표 행이 아님"))
+            continue
+        cells = split_row(stripped)
+        if len(cells) > width:
+            problems.append((number, f"열 {len(cells)}개 (헤더 {width}개) → 초과분을 마지막 열에 합침"))
+            cells = cells[:width - 1] + ["|".join(cells[width - 1:])]
+        elif len(cells) < width:
+            problems.append((number, f"열 {len(cells)}개 (헤더 {width}개) → 빈 값으로 채움"))
+            cells = cells + [None] * (width - len(cells))
+        for column, cell in zip(columns, cells):
+            column.append(cell if cell != "" else None)
+
+    return pd.DataFrame({name: _typed(values) for name, values in zip(header, columns)}), problems
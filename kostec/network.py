@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Description : 동시출현 네트워크 데이터 준비 (탭 2)
+#   - 기간 내 엣지를 (source, target) 쌍별로 합산하고 최소 빈도/상위 k개로 정리
+#   - 노드 좌표를 서버에서 networkx로 한 번 계산 → 브라우저는 물리 시뮬레이션 없이 바로 그림
+# License : MIT
+
+import math
+
+import networkx as nx
+import pandas as pd
+
+EDGE_COLUMNS = ["source", "target", "count"]
+LAYOUT_SEED = 42
+NODE_SPACING = 90  # vis.js 좌표(px) 기준 노드 간 간격
+
+
+def prune_edges(df_edges, min_count=1, top_k=None):
+    """쌍별 합산 → count >= min_count → count 내림차순 상위 top_k개."""
+    if df_edges is None or df_edges.empty:
+        return pd.DataFrame(columns=EDGE_COLUMNS)
+    df = df_edges.groupby(["source", "target"], as_index=False)["count"].sum()
+    df = df[df["count"] >= min_count]
+    df = df.sort_values(["count", "source", "target"], ascending=[False, True, True], kind="stable")
+    if top_k:
+        df = df.head(top_k)
+    return df.reset_index(drop=True)
+
+
+def build_graph(df_edges):
+    graph = nx.Graph()
+    for source, target, count in df_edges[EDGE_COLUMNS].itertuples(index=False):
+        weight = graph[source][target]["weight"] if graph.has_edge(source, target) else 0
+        graph.add_edge(source, target, weight=weight + int(count))
+    return graph
+
+
+def node_order(graph):
+    # 가중 연결 수가 큰 노드부터 (같으면 이름순) → 색상/격자/동심원 배치 순서
+    return sorted(graph.nodes, key=lambda n: (-graph.degree(n, weight="weight"), str(n)))
+
+
+# --- 레이아웃 (좌표는 대략 -1~1, 마지막에 화면 크기로 확대)
+def _grid(graph):
+    order = node_order(graph)
+    cols = max(1, math.ceil(math.sqrt(len(order))))
+    return {node: ((i % cols) / max(cols - 1, 1) * 2 - 1, (i // cols) / max(cols - 1, 1) * 2 - 1) for i, node in enumerate(order)}
+
+
+def _circular(graph):
+    ordered = nx.Graph()
+    ordered.add_nodes_from(node_order(graph))
+    return nx.circular_layout(ordered)
+
+
+def _shell(graph):
+    # 연결이 많은 노드를 안쪽 원에 배치 (바깥으로 갈수록 원이 커지며 노드 수 증가)
+    order, shells, size = node_order(graph), [], 1
+    while order:
+        shells.append(order[:size])
+        order, size = order[size:], size + 6
+    return nx.shell_layout(graph, nlist=shells)
+
+
+def _hierarchical(graph, direction):
+    # 컴포넌트마다 가장 연결이 많은 노드를 뿌리로 BFS 층을 나누고, 컴포넌트는 옆으로 나란히
+    positions, offset = {}, 0
+    rank = {node: i for i, node in enumerate(node_order(graph))}
+    roots = [min(component, key=rank.get) for component in nx.connected_components(graph)]
+    for root in sorted(roots, key=rank.get):
+        layers = list(nx.bfs_layers(graph, root))
+        width = max(len(layer) for layer in layers)
+        for depth, layer in enumerate(layers):
+            for i, node in enumerate(sorted(layer, key=rank.get)):
+                positions[node] = (depth, offset + i + (width - len(layer)) / 2)
+        offset += width + 1
+    if not positions:
+        return positions
+    span = max(max(abs(d), abs(b)) for d, b in positions.values()) or 1
+    sign = -1 if direction in ("RL", "BT") else 1  # 뿌리가 오른쪽/아래에서 시작
+    scaled = {node: (sign * (d / span * 2 - 1), b / span * 2 - 1) for node, (d, b) in positions.items()}
+    if direction in ("TB", "BT"):
+        scaled = {node: (b, d) for node, (d, b) in scaled.items()}
+    return scaled
+
+
+LAYOUTS = {
+    "shell": _shell,
+    "circular": _circular,
+    "spring": lambda g: nx.spring_layout(g, weight="weight", seed=LAYOUT_SEED),
+    "random": lambda g: {n: tuple(p * 2 - 1) for n, p in nx.random_layout(g, seed=LAYOUT_SEED).items()},
+    "grid": _grid,
+    "hierarchical-LR": lambda g: _hierarchical(g, "LR"),
+    "hierarchical-RL": lambda g: _hierarchical(g, "RL"),
+    "hierarchical-TB": lambda g: _hierarchical(g, "TB"),
+    "hierarchical-BT": lambda g: _hierarchical(g, "BT"),
+}
+
+
+def layout_positions(graph, layout):
+    """{노드: (x, y)} (vis.js 픽셀 좌표). 노드 수에 비례해 전체 크기를 키움."""
+    if graph.number_of_nodes() == 0:
+        return {}
+    if graph.number_of_nodes() == 1:
+        return {node: (0.0, 0.0) for node in graph.nodes}
+    raw = LAYOUTS[layout](graph)
+    scale = NODE_SPACING * math.sqrt(graph.number_of_nodes())
+    return {node: (float(x) * scale, float(y) * scale) for node, (x, y) in raw.items()}
+
+
+def network_payload(df_edges, layout="spring", min_count=1, top_k=None, palette=None):
+    """agraph에 바로 넘길 (노드 dict 목록, 엣지 dict 목록). 좌표가 고정되어 있어 물리 계산이 필요 없음."""
+    pruned = prune_edges(df_edges, min_count=min_count, top_k=top_k)
+    graph = build_graph(pruned)
+    positions = layout_positions(graph, layout)
+    palette = palette or ["#1f77b4", "#ff7f0e", "#2ca02c"]
+    nodes = [
+        {"id": node, "label": node, "color": palette[i % len(palette)], "font": {"color": "darkgray"},
+         "x": positions[node][0], "y": positions[node][1]}
+        for i, node in enumerate(node_order(graph))
+    ]
+    edges = [
+        {"source": source, "target": target, "label": str(count)}
+        for source, target, count in pruned[EDGE_COLUMNS].itertuples(index=False)
+    ]
+    return nodes, edges
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# Description : 주간 동향 수집 파이프라인 (브라우저 없이 실행 가능)
+#   - 단계: prompt → fetch → parse → enrich → persist → publish
+#   - 단계마다 소요 시간과 행 수를 metrics에 기록하고 progress로 알림
+#   - 단계 함수는 교체/생략 가능 (예: replay는 fetch를 캐시 재생으로 바꾸고 prompt/publish 생략)
+#   - 대시보드 수집 버튼(백그라운드 작업)과 CLI/cron이 같은 파이프라인을 사용
+# Usage : python -m kostec.pipeline collect --locale cn --date 20250620 [--weeks 4] [--no-cache] [--publish]
+#         python -m kostec.pipeline replay [--locale cn|en] [--date YYYYMMDD ...]
+#   - 토큰은 환경 변수 ANTHROPIC_API_KEY, GITHUB_TOKEN에서 읽음
+# License : MIT
+
+import argparse
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from kostec.collector import LOCALES, build_prompt, parse_sheet_tables, save_snapshot, stream_report
+from kostec.cooccurrence import analyze_cooccurrence
+from kostec.publisher import describe_result, publish_snapshots
+from kostec.report_parser import ReportStreamParser
+from kostec.response_cache import ResponseCache
+from kostec.snapshot_catalog import snapshot_path
+
+STAGES = ("prompt", "fetch", "parse", "enrich", "persist", "publish")
+TABLE_LABELS = {"sheet1": "요약표", "sheet2": "출처"}
+MAX_REPORTED_PROBLEMS = 3
+
+
+# --- 1. 단계 (ctx를 읽고 채움, 처리한 행 수 반환)
+def stage_prompt(ctx):
+    ctx["prompt"] = build_prompt(ctx["locale"], ctx["date"])
+    return None
+
+
+def stage_fetch(ctx):
+    ctx["parser"] = stream_report(
+        ctx["prompt"], ctx["api_token"], ctx["progress"], ctx["spool_path"],
+        cache=ctx["cache"], use_cache=ctx["use_cache"],
+        meta={"locale": ctx["locale"], "date": ctx["date"]},
+    )
+    ctx["progress"]("Step 1: RAG 수행 완료.")
+    return ctx["parser"].rows["sheet1"]
+
+
+def stage_replay(ctx):
+    """fetch 대체: 캐시된 원본 응답(ctx["cache_key"])을 파서에 다시 흘려 넣음."""
+    parser = ReportStreamParser()
+    for chunk in ctx["cache"].iter_text(ctx["cache_key"]):
+        parser.feed(chunk)
+    ctx["parser"] = parser
+    return parser.rows["sheet1"]
+
+
+def stage_parse(ctx):
+    sheet1_text, sheet2_text, executive_summary_text = ctx["parser"].finish()
+    ctx["progress"]("Step 2: 메시지 파싱 완료.")
+
+    df_summary, df_sheet2, problems = parse_sheet_tables(sheet1_text, sheet2_text)
+    if df_summary.empty:
+        raise ValueError("응답에서 요약표(sheet1)를 찾을 수 없습니다.")
+    ctx["parse_problems"] = problems
+    if problems:
+        shown = ", ".join(f"{TABLE_LABELS[sheet]} {line}번째 줄: {reason}" for sheet, line, reason in problems[:MAX_REPORTED_PROBLEMS])
+        ctx["progress"](f"⚠️ 표 형식 오류 {len(problems)}줄 ({shown})")
+    ctx["progress"]("Step 3: 엑셀 시트 파싱 완료")
+
+    df_summary.columns = [col.strip() for col in df_summary.columns]
+    ctx["sheets"] = {
+        "Summary Table": df_summary,
+        "Sources": df_sheet2,
+        "Executive Summary": pd.DataFrame({"Executive Summary": [executive_summary_text]}),
+    }
+    return len(df_summary)
+
+
+def stage_enrich(ctx):
+    sheets = ctx["sheets"]
+    sheets["Cooccurrence"], sheets["Associations"] = analyze_cooccurrence(sheets["Summary Table"])
+    ctx["progress"]("Step 4: 동시출현 및 연관어 분석 완료")
+    return len(sheets["Cooccurrence"])
+
+
+def stage_persist(ctx):
+    ctx["output"] = snapshot_path(ctx["date"], ctx["locale"])
+    save_snapshot(ctx["output"], ctx["sheets"])
+    ctx["progress"](f"{ctx['date']} 기준 주간 {LOCALES[ctx['locale']]['label']} 동향 수집 및 저장 완료!")
+    return sum(len(df) for df in ctx["sheets"].values())
+
+
+def stage_publish(ctx):
+    # 업로드 실패는 수집 실패로 보지 않음 (저장된 파일은 그대로 유지)
+    if not ctx["github_token"]:
+        ctx["publish"] = None
+        return None
+    ctx["publish"] = publish_message(ctx["date"], ctx["publisher"], [ctx["output"]], ctx["github_token"], ctx["progress"])
+    return 1
+
+
+def publish_message(label, publisher, outputs, github_token, progress=print):
+    try:
+        result = publisher(outputs, github_token, progress=progress)
+        return f"{label} 기준 주간 동향 수집, 저장 및 GitHub 업로드 완료! {describe_result(result)}"
+    except Exception as upload_err:
+        return f"⚠️ 수집은 완료되었으나 GitHub 업로드 실패: {upload_err}"
+
+
+DEFAULT_STAGES = {
+    "prompt": stage_prompt,
+    "fetch": stage_fetch,
+    "parse": stage_parse,
+    "enrich": stage_enrich,
+    "persist": stage_persist,
+    "publish": stage_publish,
+}
+
+
+# --- 2. 실행
+def collection_context(locale, current_date, api_token=None, github_token=None, use_cache=True,
+                       progress=print, spool_path=None, cache=None, publisher=publish_snapshots):
+    return {
+        "locale": locale,
+        "date": current_date,
+        "api_token": api_token,
+        "github_token": github_token,
+        "use_cache": use_cache,
+        "progress": progress,
+        "spool_path": spool_path,
+        "cache": cache or ResponseCache(),
+        "publisher": publisher,
+        "output": None,
+        "publish": None,
+        "metrics": [],
+    }
+
+
+def format_metrics(metrics):
+    parts = []
+    for m in metrics:
+        rows = f", {m['rows']}행" if m["rows"] is not None else ""
+        parts.append(f"{m['stage']} {m['seconds']:.1f}초{rows}" + ("" if m["status"] == "ok" else f" ({m['status']})"))
+    return " · ".join(parts)
+
+
+class CollectionPipeline:
+    """stages: {단계 이름: 함수 또는 None(생략)}으로 기본 단계를 교체."""
+
+    def __init__(self, stages=None):
+        self.stages = dict(DEFAULT_STAGES, **(stages or {}))
+
+    def run(self, ctx):
+        """ctx(collection_context)를 단계별로 채워 반환. 실패해도 ctx["metrics"]에는 실패한 단계까지 기록됨."""
+        for name in STAGES:
+            stage = self.stages.get(name)
+            if stage is None:
+                continue
+            started = time.perf_counter()
+            metric = {"stage": name, "seconds": 0.0, "rows": None, "status": "ok"}
+            ctx["metrics"].append(metric)
+            try:
+                metric["rows"] = stage(ctx)
+            except Exception:
+                metric["status"] = "failed"
+                raise
+            finally:
+                metric["seconds"] = round(time.perf_counter() - started, 3)
+        ctx["progress"](f"⏱ {format_metrics(ctx['metrics'])}")
+        return ctx
+
+
+COLLECT_PIPELINE = CollectionPipeline()
+REPLAY_PIPELINE = CollectionPipeline({"prompt": None, "fetch": stage_replay, "publish": None})
+
+
+def collect_snapshot(locale, current_date, api_token, progress=print, spool_path=None, use_cache=True, cache=None):
+    """한 언어/날짜의 주간 스냅샷을 수집해 저장하고 xlsx 경로를 반환 (업로드 없음)."""
+    ctx = collection_context(locale, current_date, api_token, use_cache=use_cache,
+                             progress=progress, spool_path=spool_path, cache=cache)
+    return COLLECT_PIPELINE.run(ctx)["output"]
+
+
+def replay_snapshots(locale=None, dates=None, cache=None, progress=print):
+    """캐시된 원본 응답으로 xlsx/사이드카/부분 집계/카탈로그를 다시 생성 (네트워크 불필요)."""
+    cache = cache or ResponseCache()
+    rebuilt, failed = [], []
+    for meta in cache.latest(locale=locale, dates=dates):
+        ctx = collection_context(meta["locale"], meta["date"], progress=progress, cache=cache)
+        ctx["cache_key"] = meta["key"]
+        try:
+            rebuilt.append(REPLAY_PIPELINE.run(ctx)["output"])
+        except Exception as e:
+            failed.append((meta["locale"], meta["date"], str(e)))
+            progress(f"❌ {meta['date']} {meta['locale']} 재생 실패: {e}")
+    return rebuilt, failed
+
+
+# --- 3. CLI / cron
+def _append_metrics(path, ctx, error=None):
+    record = {
+        "at": datetime.now().isoformat(timespec="seconds"),
+        "locale": ctx["locale"],
+        "date": ctx["date"],
+        "output": ctx["output"],
+        "error": error,
+        "metrics": ctx["metrics"],
+    }
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주간 동향 수집 파이프라인")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    collect = commands.add_parser("collect", help="수집 → 저장 (→ 전체를 한 커밋으로 GitHub 업로드)")
+    collect.add_argument("--locale", choices=sorted(LOCALES), nargs="+", default=sorted(LOCALES), help="언어 (기본: 전체)")
+    collect.add_argument("--date", default=datetime.now().strftime("%Y%m%d"), help="YYYYMMDD (기본: 오늘)")
+    collect.add_argument("--weeks", type=int, default=1, help="선택 날짜부터 1주 간격으로 수집할 주 수")
+    collect.add_argument("--no-cache", action="store_true", help="캐시된 응답을 쓰지 않고 새로 호출")
+    collect.add_argument("--publish", action="store_true", help="GITHUB_TOKEN으로 업로드")
+    collect.add_argument("--metrics", help="단계별 지표를 JSONL로 추가 기록할 경로")
+
+    replay = commands.add_parser("replay", help="캐시된 응답으로 스냅샷 재생성 (오프라인)")
+    replay.add_argument("--locale", choices=sorted(LOCALES), help="언어 (기본: 전체)")
+    replay.add_argument("--date", nargs="*", help="YYYYMMDD (기본: 캐시된 전체 날짜)")
+    args = parser.parse_args(argv)
+
+    if args.command == "replay":
+        rebuilt, failed = replay_snapshots(locale=args.locale, dates=args.date)
+        print(f"✅ {len(rebuilt)}건 재생성, ❌ {len(failed)}건 실패")
+        return 1 if failed else 0
+
+    api_token = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_token:
+        parser.error("ANTHROPIC_API_KEY 환경 변수가 필요합니다.")
+    github_token = os.environ.get("GITHUB_TOKEN") if args.publish else None
+    if args.publish and not github_token:
+        parser.error("--publish에는 GITHUB_TOKEN 환경 변수가 필요합니다.")
+
+    start = datetime.strptime(args.date, "%Y%m%d")
+    failures, outputs = 0, []
+    for week in range(args.weeks):
+        current_date = (start - timedelta(weeks=week)).strftime("%Y%m%d")
+        for locale in args.locale:
+            # 업로드는 모든 날짜/언어를 수집한 뒤 한 커밋으로
+            ctx = collection_context(locale, current_date, api_token, use_cache=not args.no_cache)
+            error = None
+            try:
+                outputs.append(COLLECT_PIPELINE.run(ctx)["output"])
+            except Exception as e:
+                error = str(e)
+                failures += 1
+                print(f"❌ {current_date} {locale} 수집 중 오류 발생: {e}")
+            if args.metrics:
+                _append_metrics(args.metrics, ctx, error)
+    if github_token and outputs:
+        print(publish_message(args.date, publish_snapshots, outputs, github_token))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
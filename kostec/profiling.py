@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Description : 대시보드 구간별 프로파일링 (선택 사항, 기본 꺼짐)
+#   - Profiler: 이름 붙인 구간의 실행 시간, 캐시 적중 여부, 행 수, DataFrame 메모리를 기록
+#   - 현재 프로파일러는 스레드별로 보관 → 스크립트 실행 스레드만 기록 (인접 탭 미리 계산 스레드는 제외)
+#   - profiled_cache: st.cache_data 함수를 감싸 호출마다 적중(hit)/계산(miss)을 구분
+#   - 꺼져 있으면 section()은 아무것도 하지 않고 캐시 함수는 그대로 호출
+# License : MIT
+
+import contextlib
+import functools
+import json
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+_local = threading.local()
+
+
+# --- 1. 구간 기록
+class Profiler:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.records = []
+        self._depth = 0
+
+    @contextlib.contextmanager
+    def section(self, name):
+        """with 블록 하나를 구간으로 기록. 바깥 구간 안에서 열린 구간은 depth가 1 큼."""
+        record = {"section": name, "depth": self._depth, "seconds": 0.0,
+                  "cache": None, "rows": None, "bytes": None, "status": "ok"}
+        self.records.append(record)
+        self._depth += 1
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            # st.stop()/st.rerun()은 BaseException으로 전달되므로 이름만 남기고 다시 올림
+            record["status"] = type(e).__name__
+            raise
+        finally:
+            record["seconds"] = time.perf_counter() - started
+            self._depth -= 1
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def frame(self):
+        """패널 표시용: 구간(들여쓰기) / ms / 캐시 / 행 수 / 메모리(MB)."""
+        return pd.DataFrame({
+            "구간": ["　" * r["depth"] + r["section"] for r in self.records],
+            "ms": [round(r["seconds"] * 1000, 1) for r in self.records],
+            "캐시": [r["cache"] or "" for r in self.records],
+            "행 수": pd.array([r["rows"] for r in self.records], dtype="Int64"),
+            "메모리(MB)": [None if r["bytes"] is None else round(r["bytes"] / 2**20, 2) for r in self.records],
+        })
+
+    def append_jsonl(self, path, **meta):
+        record = {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            **meta,
+            "total_seconds": round(self.elapsed(), 4),
+            "sections": [dict(r, seconds=round(r["seconds"], 4)) for r in self.records],
+        }
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+def activate(profiler):
+    """현재 스레드의 프로파일러 지정 (None이면 끔). 매 스크립트 실행 시작 시 호출."""
+    _local.profiler = profiler
+
+
+def current():
+    return getattr(_local, "profiler", None)
+
+
+def section(name):
+    profiler = current()
+    return profiler.section(name) if profiler else contextlib.nullcontext({})
+
+
+# --- 2. 결과 크기 (행 수, 메모리)
+def measure(value, depth=0):
+    """(행 수, 바이트). DataFrame/Series/ndarray를 튜플·리스트·dict·객체 속성까지 찾아 합산."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value), int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return None, value.nbytes
+    if isinstance(value, str):
+        return None, len(value.encode("utf-8"))
+    if depth >= 3:
+        return None, None
+    if isinstance(value, dict):
+        items = value.values()
+    elif isinstance(value, (tuple, list)):
+        items = value
+    elif hasattr(value, "__dict__") and not callable(value):
+        items = vars(value).values()
+    else:
+        return None, None
+    rows = nbytes = None
+    for item in items:
+        item_rows, item_bytes = measure(item, depth + 1)
+        if item_rows is not None:
+            rows = (rows or 0) + item_rows
+        if item_bytes is not None:
+            nbytes = (nbytes or 0) + item_bytes
+    return rows, nbytes
+
+
+# --- 3. 캐시 함수 적중/계산 구분
+def profiled_cache(cache_decorator):
+    """@profiled_cache(st.cache_data(...)) — 함수 본문이 실행되면 miss, 아니면 hit.
+
+    본문 실행 여부는 스레드별 카운터로 판단 (미리 계산 스레드의 계산과 섞이지 않음).
+    functools.wraps로 원래 이름/소스를 유지 → st.cache_data의 캐시 키는 그대로.
+    """
+    def decorate(func):
+        name = func.__name__
+
+        @functools.wraps(func)
+        def body(*args, **kwargs):
+            computed = getattr(_local, "computed", None)
+            if computed is not None:
+                computed[name] = computed.get(name, 0) + 1
+            return func(*args, **kwargs)
+
+        cached = cache_decorator(body)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            profiler = current()
+            if profiler is None:
+                return cached(*args, **kwargs)
+            if getattr(_local, "computed", None) is None:
+                _local.computed = {}
+            before = _local.computed.get(name, 0)
+            with profiler.section(name) as record:
+                result = cached(*args, **kwargs)
+            record["cache"] = "miss" if _local.computed.get(name, 0) > before else "hit"
+            record["rows"], record["bytes"] = measure(result)
+            return result
+
+        call.clear = cached.clear
+        return call
+
+    return decorate
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+# Description : 스냅샷 산출물 GitHub 업로드 (git tree API로 한 번에 한 커밋)
+#   - 업로드 대상: xlsx + Parquet 사이드카/부분 집계 + 카탈로그 (원본 응답 캐시는 로컬에만 보관)
+#   - 원격 트리의 blob SHA와 같은 파일은 건너뜀 (바뀐 파일이 없으면 커밋하지 않음)
+#   - API 호출은 일시적 오류(5xx, 429, API 한도, 네트워크)만 지수 백오프로 재시도, 그 밖의 오류는 바로 올림
+#   - 브랜치가 그 사이에 움직였으면(BranchMoved) 최신 head 기준으로 다시 계산해 커밋, 인증 오류 등은 바로 올림
+#   - GitHubTreeAPI(PyGithub)와 LocalGitAPI(로컬 git 저장소)가 같은 인터페이스 → 로컬에서 동작 확인 가능
+# Usage : python -m kostec.publisher [--local REPO_DIR] [--dry-run] [xlsx ...]
+#   - GitHub 업로드는 환경 변수 GITHUB_TOKEN 사용
+# License : MIT
+
+import argparse
+import base64
+import glob
+import hashlib
+import os
+import subprocess
+import tempfile
+import time
+
+from kostec.snapshot_catalog import CATALOG_PATH, parse_snapshot_name
+from kostec.snapshot_store import DATA_DIR, sidecar_dir
+
+REPO_NAME = "kostec-stat/streamlit"
+MAX_ATTEMPTS = 4
+BACKOFF_SECONDS = 1.0
+
+
+# --- 1. 업로드 대상
+def git_blob_sha(content):
+    """git이 blob에 매기는 SHA-1 (원격 트리 항목의 sha와 비교용)."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def snapshot_artifacts(xlsx_path):
+    """xlsx와 그 사이드카/부분 집계 파일."""
+    paths = [xlsx_path]
+    folder = sidecar_dir(xlsx_path)
+    if os.path.isdir(folder):
+        paths += [os.path.join(folder, name) for name in sorted(os.listdir(folder)) if not name.endswith(".tmp")]
+    return paths
+
+
+def collect_artifacts(xlsx_paths):
+    paths = []
+    for xlsx_path in xlsx_paths:
+        paths += [p for p in snapshot_artifacts(xlsx_path) if p not in paths]
+    if os.path.exists(CATALOG_PATH):
+        paths.append(CATALOG_PATH)
+    return paths
+
+
+def _repo_path(path):
+    return os.path.relpath(path).replace("\\", "/")
+
+
+# --- 2. 재시도
+class BranchMoved(Exception):
+    """브랜치 갱신 시점에 head가 기대한 커밋이 아님 (다른 커밋이 먼저 올라옴)."""
+
+
+def _is_transient(error):
+    """네트워크 오류, 429, 5xx, API 한도 초과만 재시도. 설정 오류나 코드 버그는 바로 드러나도록 False."""
+    import requests
+    import urllib3.exceptions
+    from github import GithubException, RateLimitExceededException
+
+    if isinstance(error, (requests.ConnectionError, requests.Timeout,
+                          urllib3.exceptions.ProtocolError, urllib3.exceptions.TimeoutError)):
+        return True
+    if isinstance(error, RateLimitExceededException):
+        return True
+    return isinstance(error, GithubException) and error.status is not None and (error.status == 429 or error.status >= 500)
+
+
+def with_retry(call, *args, attempts=MAX_ATTEMPTS, backoff=BACKOFF_SECONDS):
+    for attempt in range(attempts):
+        try:
+            return call(*args)
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_transient(e):
+                raise
+            time.sleep(backoff * 2 ** attempt)
+
+
+# --- 3. 저장소 접근 (같은 인터페이스의 두 구현)
+class GitHubTreeAPI:
+    def __init__(self, repo):
+        self.repo = repo
+        self.default_branch = repo.default_branch
+
+    @classmethod
+    def connect(cls, github_token, repo_name=REPO_NAME):
+        from github import Github
+
+        return cls(with_retry(Github(github_token).get_repo, repo_name))
+
+    def head(self, branch):
+        ref = self.repo.get_git_ref(f"heads/{branch}")
+        commit = self.repo.get_git_commit(ref.object.sha)
+        return commit.sha, commit.tree.sha
+
+    def blob_shas(self, tree_sha):
+        tree = self.repo.get_git_tree(tree_sha, recursive=True)
+        return {entry.path: entry.sha for entry in tree.tree if entry.type == "blob"}
+
+    def create_blob(self, content):
+        return self.repo.create_git_blob(base64.b64encode(content).decode("ascii"), "base64").sha
+
+    def create_tree(self, base_tree_sha, files):
+        from github import InputGitTreeElement
+
+        elements = [InputGitTreeElement(path, "100644", "blob", sha=sha) for path, sha in files.items()]
+        return self.repo.create_git_tree(elements, self.repo.get_git_tree(base_tree_sha)).sha
+
+    def create_commit(self, message, tree_sha, parent_sha):
+        tree = self.repo.get_git_tree(tree_sha)
+        return self.repo.create_git_commit(message, tree, [self.repo.get_git_commit(parent_sha)]).sha
+
+    def update_branch(self, branch, commit_sha, expected_sha):
+        # force=False: 다른 커밋이 먼저 올라왔으면 fast-forward가 아니므로 422
+        from github import GithubException
+
+        ref = self.repo.get_git_ref(f"heads/{branch}")
+        if ref.object.sha != expected_sha:
+            raise BranchMoved(f"{branch}: {ref.object.sha[:7]} (기대 {expected_sha[:7]})")
+        try:
+            ref.edit(commit_sha, force=False)
+        except GithubException as e:
+            if e.status == 422:
+                raise BranchMoved(f"{branch}: fast-forward 아님") from e
+            raise
+
+
+class LocalGitAPI:
+    """로컬 git 저장소를 GitHub 대신 쓰는 대역. 업로드 동작을 네트워크 없이 확인할 때 사용."""
+
+    def __init__(self, repo_dir, default_branch="main"):
+        self.repo_dir = repo_dir
+        self.default_branch = default_branch
+
+    def _git(self, *args, data=None, env=None):
+        result = subprocess.run(
+            ["git", "-C", self.repo_dir, *args], input=data, capture_output=True, check=True,
+            env=dict(os.environ, **(env or {})),
+        )
+        return result.stdout.decode("utf-8").strip()
+
+    def head(self, branch):
+        commit_sha = self._git("rev-parse", f"refs/heads/{branch}")
+        return commit_sha, self._git("rev-parse", f"{commit_sha}^{{tree}}")
+
+    def blob_shas(self, tree_sha):
+        shas = {}
+        for entry in self._git("ls-tree", "-r", "-z", tree_sha).split("\0"):
+            if entry:
+                info, path = entry.split("\t", 1)
+                _, kind, sha = info.split()
+                if kind == "blob":
+                    shas[path] = sha
+        return shas
+
+    def create_blob(self, content):
+        return self._git("hash-object", "-w", "--stdin", data=content)
+
+    def create_tree(self, base_tree_sha, files):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {"GIT_INDEX_FILE": os.path.join(tmp, "index")}
+            self._git("read-tree", base_tree_sha, env=env)
+            for path, sha in files.items():
+                self._git("update-index", "--add", "--cacheinfo", f"100644,{sha},{path}", env=env)
+            return self._git("write-tree", env=env)
+
+    def create_commit(self, message, tree_sha, parent_sha):
+        env = {
+            "GIT_AUTHOR_NAME": os.environ.get("GIT_AUTHOR_NAME", "kostec-publisher"),
+            "GIT_AUTHOR_EMAIL": os.environ.get("GIT_AUTHOR_EMAIL", "publisher@localhost"),
+            "GIT_COMMITTER_NAME": os.environ.get("GIT_COMMITTER_NAME", "kostec-publisher"),
+            "GIT_COMMITTER_EMAIL": os.environ.get("GIT_COMMITTER_EMAIL", "publisher@localhost"),
+        }
+        return self._git("commit-tree", tree_sha, "-p", parent_sha, "-m", message, env=env)
+
+    def update_branch(self, branch, commit_sha, expected_sha):
+        # 기대한 head일 때만 갱신 (GitHub의 force=False와 같은 효과)
+        try:
+            self._git("update-ref", f"refs/heads/{branch}", commit_sha, expected_sha)
+        except subprocess.CalledProcessError:
+            current_sha, _ = self.head(branch)
+            if current_sha != expected_sha:
+                raise BranchMoved(f"{branch}: {current_sha[:7]} (기대 {expected_sha[:7]})")
+            raise
+
+
+# --- 4. 업로드
+def _commit_message(xlsx_paths):
+    names = [parse_snapshot_name(p) for p in xlsx_paths]
+    labels = sorted(f"{d} {locale}" for d, locale in (n for n in names if n))
+    if len(labels) == 1:
+        return f"update snapshot {labels[0]}"
+    return f"update {len(labels)} snapshots ({labels[0]} ~ {labels[-1]})" if labels else "update snapshots"
+
+
+def publish_files(paths, api, message, branch=None, progress=print):
+    """바뀐 파일만 한 커밋으로 올림. 반환: {"commit": sha 또는 None, "changed": [...], "unchanged": 개수}."""
+    branch = branch or api.default_branch
+    contents = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            contents[_repo_path(path)] = f.read()
+    local_shas = {path: git_blob_sha(content) for path, content in contents.items()}
+
+    for attempt in range(MAX_ATTEMPTS):
+        head_sha, tree_sha = with_retry(api.head, branch)
+        remote_shas = with_retry(api.blob_shas, tree_sha)
+        changed = sorted(path for path, sha in local_shas.items() if remote_shas.get(path) != sha)
+        result = {"commit": None, "changed": changed, "unchanged": len(local_shas) - len(changed)}
+        if not changed:
+            return result
+
+        files = {}
+        for path in changed:
+            files[path] = with_retry(api.create_blob, contents[path])
+        new_tree = with_retry(api.create_tree, tree_sha, files)
+        commit_sha = with_retry(api.create_commit, message, new_tree, head_sha)
+        try:
+            api.update_branch(branch, commit_sha, head_sha)
+        except Exception as e:
+            # 경합(BranchMoved)과 일시적 오류만 최신 head 기준으로 다시 시도 (인증/404/검증 오류는 바로 올림)
+            moved = isinstance(e, BranchMoved)
+            if attempt == MAX_ATTEMPTS - 1 or not (moved or _is_transient(e)):
+                raise
+            progress(f"⚠️ 브랜치가 갱신되어 다시 시도합니다 ({e})" if moved else f"⚠️ 일시적 오류로 다시 시도합니다 ({e})")
+            time.sleep(BACKOFF_SECONDS * 2 ** attempt)
+            continue
+        result["commit"] = commit_sha
+        return result
+
+
+def publish_snapshots(xlsx_paths, github_token=None, api=None, message=None, progress=print):
+    """스냅샷 여러 개의 산출물을 한 커밋으로 업로드."""
+    api = api or GitHubTreeAPI.connect(github_token)
+    return publish_files(collect_artifacts(xlsx_paths), api, message or _commit_message(xlsx_paths), progress=progress)
+
+
+def describe_result(result):
+    if not result["commit"]:
+        return f"변경된 파일이 없어 업로드를 건너뜀 ({result['unchanged']}개 동일)"
+    return f"파일 {len(result['changed'])}개를 커밋 {result['commit'][:7]}로 업로드 ({result['unchanged']}개 동일)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스냅샷 산출물을 한 커밋으로 업로드")
+    parser.add_argument("paths", nargs="*", help="xlsx 경로 (기본: assets/data/*_trend_summary*.xlsx)")
+    parser.add_argument("--local", help="GitHub 대신 업로드할 로컬 git 저장소 경로")
+    parser.add_argument("--branch", help="브랜치 (기본: 저장소 기본 브랜치)")
+    parser.add_argument("--dry-run", action="store_true", help="바뀐 파일 목록만 출력")
+    args = parser.parse_args(argv)
+
+    xlsx_paths = args.paths or sorted(glob.glob(os.path.join(DATA_DIR, "*_trend_summary*.xlsx")))
+    if args.local:
+        api = LocalGitAPI(args.local, default_branch=args.branch or "main")
+    else:
+        github_token = os.environ.get("GITHUB_TOKEN")
+        if not github_token:
+            parser.error("GITHUB_TOKEN 환경 변수가 필요합니다 (또는 --local).")
+        api = GitHubTreeAPI.connect(github_token)
+
+    paths = collect_artifacts(xlsx_paths)
+    if args.dry_run:
+        branch = args.branch or api.default_branch
+        _, tree_sha = api.head(branch)
+        remote_shas = api.blob_shas(tree_sha)
+        for path in paths:
+            with open(path, "rb") as f:
+                if remote_shas.get(_repo_path(path)) != git_blob_sha(f.read()):
+                    print(_repo_path(path))
+        return
+
+    result = publish_files(paths, api, _commit_message(xlsx_paths), branch=args.branch)
+    print(describe_result(result))
+    for path in result["changed"]:
+        print(f"  {path}")
+
+
+if __name__ == "__main__":
+    main()
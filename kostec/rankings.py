@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Description : 중국 vs 글로벌 키워드 순위 (탭 5)
+#   - 중국 순위: 키워드별 Keyword Count 합 (부분 집계)
+#   - 글로벌 순위: 영문 키워드를 키워드 목록 파일의 같은 줄 중문 키워드로 매핑한 뒤 합산
+#   - 순위는 동점이면 같은 순위(method="min")
+# License : MIT
+
+ZH_KEYWORDS_PATH = "assets/input/keywords.txt"
+EN_KEYWORDS_PATH = "assets/input/en_keywords.txt"
+
+
+def _read_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def load_keyword_map(zh_path=ZH_KEYWORDS_PATH, en_path=EN_KEYWORDS_PATH):
+    """{영문 키워드(소문자): 중문 키워드} — 두 파일의 같은 줄끼리 대응."""
+    return {en.strip().lower(): zh.strip() for en, zh in zip(_read_lines(en_path), _read_lines(zh_path))}
+
+
+def _ranked(df, rank_column):
+    return (
+        df.assign(**{rank_column: df["Keyword Count"].rank(ascending=False, method="min").astype(int)})
+        .sort_values(rank_column)
+        [[rank_column, "Keyword", "Keyword Count"]]
+        .reset_index(drop=True)
+    )
+
+
+def rank_tables(df_keyword_counts, df_global_summary, keyword_map):
+    """(중국 순위표, 글로벌 순위표). 글로벌은 매핑된 중문 키워드 기준."""
+    zh_keyword = df_global_summary["Keyword"].str.strip().str.lower().map(keyword_map)
+    df_global = (
+        df_global_summary.assign(zh_keyword=zh_keyword)
+        .groupby("zh_keyword", as_index=False)["Keyword Count"].sum()
+        .rename(columns={"zh_keyword": "Keyword"})
+    )
+    return _ranked(df_keyword_counts, "Rank_China"), _ranked(df_global, "Rank_Global")
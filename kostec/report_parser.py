@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# Description : Claude 응답의 <excel_report> 블록 파서
+#   - 스트리밍 토큰을 feed()로 받아 <sheet1>, <sheet2>, <executive_summary> 구간을 점진적으로 분리
+#   - <excel_report> 밖의 텍스트(전략 개요 등)는 보관하지 않음
+#   - 표의 행이 완성될 때마다 on_row 콜백 호출 → 진행률 표시, 중간 결과 기록
+#   - 응답이 잘려도 finish()는 그때까지 완성된 행까지만 돌려줌
+# License : MIT
+
+from kostec.markdown_table import is_separator, split_row
+
+REPORT_OPEN, REPORT_CLOSE = "<excel_report>", "</excel_report>"
+SECTIONS = ("sheet1", "sheet2", "executive_summary")
+TABLE_SECTIONS = ("sheet1", "sheet2")
+_OPEN_TAGS = [f"<{name}>" for name in SECTIONS] + [REPORT_CLOSE]
+_MAX_TAG = max(len(tag) for tag in _OPEN_TAGS + [REPORT_OPEN])
+
+
+class ReportStreamParser:
+    def __init__(self, on_row=None):
+        self.on_row = on_row
+        self.rows = {name: 0 for name in TABLE_SECTIONS}
+        self.report_started = False
+        self.report_closed = False
+        self._buf = ""
+        self._section = None
+        self._texts = {}
+        self._closed = set()
+        self._line = {name: "" for name in TABLE_SECTIONS}
+        self._header_seen = {name: False for name in TABLE_SECTIONS}
+        self._separator_seen = {name: False for name in TABLE_SECTIONS}
+
+    # --- 입력
+    def feed(self, chunk):
+        if self.report_closed:
+            return
+        self._buf += chunk
+        while self._step():
+            pass
+
+    def _keep_tail(self, size):
+        # 태그가 청크 경계에서 잘릴 수 있으므로 끝부분만 남기고 버림
+        consumed = self._buf[:-size] if len(self._buf) > size else ""
+        self._buf = self._buf[len(consumed):]
+        return consumed
+
+    def _step(self):
+        if not self.report_started:
+            idx = self._buf.find(REPORT_OPEN)
+            if idx == -1:
+                self._keep_tail(len(REPORT_OPEN) - 1)
+                return False
+            self._buf = self._buf[idx + len(REPORT_OPEN):]
+            self.report_started = True
+            return True
+
+        if self._section is None:
+            found = [(self._buf.find(tag), tag) for tag in _OPEN_TAGS]
+            found = [(idx, tag) for idx, tag in found if idx != -1]
+            if not found:
+                self._keep_tail(_MAX_TAG - 1)
+                return False
+            idx, tag = min(found)
+            self._buf = self._buf[idx + len(tag):]
+            if tag == REPORT_CLOSE:
+                self.report_closed = True
+                self._buf = ""
+                return False
+            self._section = tag[1:-1]
+            self._texts.setdefault(self._section, [])
+            return True
+
+        closing = f"</{self._section}>"
+        idx = self._buf.find(closing)
+        if idx == -1:
+            self._append(self._section, self._keep_tail(len(closing) - 1))
+            return False
+        self._append(self._section, self._buf[:idx])
+        self._close_section(self._section)
+        self._buf = self._buf[idx + len(closing):]
+        self._section = None
+        return True
+
+    # --- 구간 처리
+    def _append(self, section, text):
+        if not text:
+            return
+        self._texts[section].append(text)
+        if section not in TABLE_SECTIONS:
+            return
+        pending = self._line[section] + text
+        *lines, self._line[section] = pending.split("\n")
+        for line in lines:
+            self._on_line(section, line)
+
+    def _close_section(self, section):
+        self._closed.add(section)
+        if section in TABLE_SECTIONS and self._line[section]:
+            self._on_line(section, self._line[section])
+            self._line[section] = ""
+
+    def _on_line(self, section, line):
+        line = line.strip()
+        if not line.startswith("|"):
+            return
+        if not self._separator_seen[section]:
+            # 헤더 다음 줄이 구분선(|---|, | :--- | 등)이면 표 시작
+            if self._header_seen[section] and is_separator(line):
+                self._separator_seen[section] = True
+            else:
+                self._header_seen[section] = True
+            return
+        self.rows[section] += 1
+        if self.on_row:
+            self.on_row(section, [cell.strip() for cell in split_row(line)])
+
+    # --- 결과
+    @property
+    def complete(self):
+        return self.report_closed or all(name in self._closed for name in SECTIONS)
+
+    def section_text(self, section):
+        text = "".join(self._texts.get(section, []))
+        if section in TABLE_SECTIONS and section not in self._closed:
+            # 닫히지 않은(잘린) 표는 마지막 미완성 줄을 버림
+            text = text[:text.rfind("\n") + 1]
+        return text
+
+    def finish(self):
+        """(sheet1_text, sheet2_text, executive_summary_text) 반환."""
+        if not self.report_started:
+            raise ValueError("응답에서 <excel_report> 블록을 찾을 수 없습니다.")
+        return (
+            self.section_text("sheet1"),
+            self.section_text("sheet2"),
+            self.section_text("executive_summary").strip(),
+        )
+
+
+def parse_report(text_data):
+    parser = ReportStreamParser()
+    parser.feed(text_data)
+    return parser.finish()
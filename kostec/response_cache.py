@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# Description : Claude 원본 응답 캐시 (내용 주소 기반)
+#   - 키: sha256(모델, max_tokens, prompt_template.format(...) 결과)
+#   - assets/cache/responses/<키>.txt (원문), <키>.json (언어, 날짜, stop_reason 등)
+#   - 스트리밍 중에는 .tmp에 이어 쓰고, 수신이 끝나면 이름을 바꿔 확정
+# License : MIT
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+CACHE_DIR = "assets/cache/responses"
+READ_CHUNK = 8192
+
+
+class ResponseWriter:
+    def __init__(self, cache, key, meta):
+        self.cache = cache
+        self.key = key
+        self.meta = dict(meta, key=key)
+        self._tmp_path = cache.text_path(key) + ".tmp"
+        self._file = open(self._tmp_path, "w", encoding="utf-8")
+
+    def write(self, text):
+        self._file.write(text)
+
+    def commit(self, stop_reason, complete):
+        self._file.close()
+        os.replace(self._tmp_path, self.cache.text_path(self.key))
+        self.meta.update(
+            stop_reason=stop_reason,
+            complete=bool(complete),
+            created_at=datetime.now().isoformat(timespec="seconds"),
+        )
+        with open(self.cache.meta_path(self.key), "w", encoding="utf-8") as f:
+            json.dump(self.meta, f, ensure_ascii=False, indent=1)
+
+    def discard(self):
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class ResponseCache:
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key(prompt, model, max_tokens):
+        payload = f"{model}\n{max_tokens}\n{prompt}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def text_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.txt")
+
+    def meta_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """저장된 응답의 메타데이터. 없으면 None."""
+        if not os.path.exists(self.text_path(key)):
+            return None
+        try:
+            with open(self.meta_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def iter_text(self, key):
+        with open(self.text_path(key), "r", encoding="utf-8") as f:
+            while True:
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    return
+                yield chunk
+
+    def writer(self, key, meta):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        return ResponseWriter(self, key, meta)
+
+    def entries(self):
+        if not os.path.isdir(self.cache_dir):
+            return []
+        metas = []
+        for name in sorted(os.listdir(self.cache_dir)):
+            if name.endswith(".json"):
+                meta = self.get(name[:-len(".json")])
+                if meta:
+                    metas.append(meta)
+        return metas
+
+    def latest(self, locale=None, dates=None):
+        """(언어, 날짜)별 가장 최근 응답 메타. 재생(replay) 대상 선정용."""
+        latest = {}
+        for meta in self.entries():
+            if locale and meta.get("locale") != locale:
+                continue
+            if dates and meta.get("date") not in dates:
+                continue
+            slot = (meta.get("locale"), meta.get("date"))
+            if slot not in latest or meta["created_at"] > latest[slot]["created_at"]:
+                latest[slot] = meta
+        return [latest[slot] for slot in sorted(latest)]
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# Description : 주간 스냅샷 카탈로그 (assets/data/catalog.json)
+#   - 스냅샷별 날짜, 언어(cn/en), 경로, mtime, 시트별 행 수, 키워드 집합, sha256 기록
+#   - 수집 단계에서 register_snapshot()으로 갱신, 대시보드는 디렉토리를 다시 훑지 않고 조회
+#   - 기간 조회는 날짜 정렬 리스트에 대한 이진 탐색
+# Usage : python -m kostec.snapshot_catalog [--rebuild]
+# License : MIT
+
+import argparse
+import glob
+import json
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+from kostec.snapshot_store import DATA_DIR, file_sha256, read_snapshot
+
+CATALOG_PATH = os.path.join(DATA_DIR, "catalog.json")
+LOCALES = ("cn", "en")
+_SUFFIX = {"cn": "_trend_summary.xlsx", "en": "_trend_summary_en.xlsx"}
+_REGISTER_LOCK = threading.Lock()  # 동시 수집 작업이 카탈로그를 덮어쓰지 않도록
+
+
+# --- 1. 파일명 해석
+def parse_snapshot_name(path):
+    """'20250613_trend_summary_en.xlsx' → ('20250613', 'en'). 형식이 다르면 None."""
+    name = os.path.basename(path)
+    for locale, suffix in _SUFFIX.items():
+        if name.endswith(suffix):
+            snapshot_date = name[:-len(suffix)]
+            if snapshot_date.isdigit() and len(snapshot_date) == 8:
+                return snapshot_date, locale
+    return None
+
+
+def snapshot_path(snapshot_date, locale="cn", data_dir=DATA_DIR):
+    return os.path.join(data_dir, f"{snapshot_date}{_SUFFIX[locale]}")
+
+
+def _as_key(value):
+    # date/datetime/'YYYYMMDD' 모두 허용
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y%m%d")
+    return str(value)
+
+
+# --- 2. 카탈로그 항목 생성
+def build_entry(path, sheets=None, source_hash=None):
+    parsed = parse_snapshot_name(path)
+    if parsed is None:
+        raise ValueError(f"스냅샷 파일명이 아닙니다: {path}")
+    snapshot_date, locale = parsed
+    stat = os.stat(path)
+    source_hash = source_hash or file_sha256(path)
+    if sheets is None:
+        sheets = read_snapshot(path, source_hash=source_hash)
+
+    df_summary = sheets.get("Summary Table")
+    keywords = []
+    if df_summary is not None and "Keyword" in [str(c).strip() for c in df_summary.columns]:
+        col = next(c for c in df_summary.columns if str(c).strip() == "Keyword")
+        keywords = sorted({str(k).strip() for k in df_summary[col].dropna()})
+
+    return {
+        "date": snapshot_date,
+        "locale": locale,
+        "path": path.replace(os.sep, "/"),
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "sha256": source_hash,
+        "rows": {name: int(len(df)) for name, df in sheets.items()},
+        "keywords": keywords,
+    }
+
+
+# --- 3. 카탈로그
+class SnapshotCatalog:
+    def __init__(self, entries=None, path=CATALOG_PATH):
+        self.path = path
+        self._entries = {locale: {} for locale in LOCALES}
+        for entry in entries or []:
+            self._entries[entry["locale"]][entry["date"]] = entry
+        self._reindex()
+
+    def _reindex(self):
+        self._dates = {locale: sorted(items) for locale, items in self._entries.items()}
+
+    # 조회
+    def dates(self, locale="cn"):
+        return list(self._dates[locale])
+
+    def get(self, snapshot_date, locale="cn"):
+        return self._entries[locale].get(_as_key(snapshot_date))
+
+    def entries(self, locale="cn"):
+        return [self._entries[locale][d] for d in self._dates[locale]]
+
+    def in_range(self, locale, start, end):
+        dates = self._dates[locale]
+        lo = bisect_left(dates, _as_key(start))
+        hi = bisect_right(dates, _as_key(end))
+        return [self._entries[locale][d] for d in dates[lo:hi]]
+
+    # 갱신
+    def upsert(self, entry):
+        self._entries[entry["locale"]][entry["date"]] = entry
+        self._reindex()
+
+    def refresh(self, data_dir=DATA_DIR):
+        """디렉토리를 훑어 새 파일/변경된 파일만 다시 계산. 사라진 파일은 제거."""
+        seen = {locale: set() for locale in LOCALES}
+        changed = 0
+        for path in glob.glob(os.path.join(data_dir, "*_trend_summary*.xlsx")):
+            parsed = parse_snapshot_name(path)
+            if parsed is None:
+                continue
+            snapshot_date, locale = parsed
+            seen[locale].add(snapshot_date)
+            stat = os.stat(path)
+            current = self._entries[locale].get(snapshot_date)
+            if current and current["mtime"] == stat.st_mtime and current["size"] == stat.st_size:
+                continue
+            entry = build_entry(path)
+            # 체크아웃 등으로 mtime만 바뀐 경우 내용이 같으면 변경으로 세지 않음
+            if not (current and current["sha256"] == entry["sha256"]):
+                changed += 1
+            self._entries[locale][snapshot_date] = entry
+        for locale in LOCALES:
+            for snapshot_date in set(self._entries[locale]) - seen[locale]:
+                del self._entries[locale][snapshot_date]
+                changed += 1
+        self._reindex()
+        return changed
+
+    # 저장/로드
+    def to_dict(self):
+        return {
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+            "snapshots": [e for locale in LOCALES for e in self.entries(locale)],
+        }
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+    @classmethod
+    def load(cls, path=CATALOG_PATH):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls(path=path)
+        return cls(data.get("snapshots", []), path=path)
+
+
+def catalog_mtime(path=CATALOG_PATH):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def open_catalog(path=CATALOG_PATH, data_dir=DATA_DIR):
+    """카탈로그를 읽고, 파일이 없으면 디렉토리를 한 번 훑어 만든 뒤 저장."""
+    if catalog_mtime(path) is not None:
+        return SnapshotCatalog.load(path)
+    catalog = SnapshotCatalog(path=path)
+    catalog.refresh(data_dir)
+    catalog.save()
+    return catalog
+
+
+def register_snapshot(path, sheets=None, catalog_path=CATALOG_PATH):
+    """수집 직후 호출: 새 스냅샷 항목을 카탈로그에 반영하고 저장."""
+    entry = build_entry(path, sheets=sheets)
+    with _REGISTER_LOCK:
+        catalog = SnapshotCatalog.load(catalog_path)
+        catalog.upsert(entry)
+        catalog.save()
+    return entry
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스냅샷 카탈로그 갱신")
+    parser.add_argument("--rebuild", action="store_true", help="기존 카탈로그를 무시하고 새로 생성")
+    args = parser.parse_args(argv)
+
+    catalog = SnapshotCatalog() if args.rebuild else SnapshotCatalog.load()
+    changed = catalog.refresh()
+    catalog.save()
+    counts = ", ".join(f"{locale}={len(catalog.dates(locale))}" for locale in LOCALES)
+    print(f"✅ 카탈로그 갱신 완료: 변경 {changed}건 ({counts}) → {catalog.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+# Description : 스냅샷 지연 로더
+#   - SnapshotReader: 시트를 처음 접근할 때만 읽고, 필요한 컬럼만 읽음
+#   - SheetCache: (파일, 해시, 시트, 컬럼) 단위 LRU 캐시, 메모리 상한 초과 시 오래된 항목부터 제거
+#   - SnapshotRange: 기간 내 여러 스냅샷의 시트를 합치고, 사이드카 없는 엑셀은 프로세스 풀에서 병렬 파싱
+# License : MIT
+
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from kostec.aggregates import build_snapshot_partials, strip_columns
+from kostec.snapshot_store import (
+    SHEET_NAMES, has_fresh_partials, has_fresh_sidecars, read_excel_parallel, read_partials, sidecar_path,
+)
+
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+PARTIAL_SOURCE_SHEETS = ["Summary Table", "Sources"]
+
+
+# --- 1. 메모리 상한 LRU 캐시
+class SheetCache:
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key, df):
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            if key in self._items:
+                self.nbytes -= self._items.pop(key)[1]
+            self._items[key] = (df, size)
+            self.nbytes += size
+            # 방금 넣은 항목 하나는 상한을 넘더라도 유지
+            while self.nbytes > self.max_bytes and len(self._items) > 1:
+                _, (_, evicted_size) = self._items.popitem(last=False)
+                self.nbytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+
+    def __len__(self):
+        return len(self._items)
+
+
+SHEET_CACHE = SheetCache()
+
+
+def _select(df, columns):
+    if columns is None:
+        return df
+    return df[[c for c in columns if c in df.columns]]
+
+
+# --- 2. 스냅샷 하나
+class SnapshotReader:
+    def __init__(self, path, content_hash=None, cache=SHEET_CACHE):
+        self.path = path
+        self.content_hash = content_hash
+        self.cache = cache
+        self._fresh = None
+
+    def has_sidecars(self):
+        if self._fresh is None:
+            self._fresh = has_fresh_sidecars(self.path, SHEET_NAMES, self.content_hash)
+        return self._fresh
+
+    def _key(self, sheet_name, columns):
+        return (self.path, self.content_hash, sheet_name, tuple(columns) if columns is not None else None)
+
+    def cached(self, sheet_name, columns=None):
+        df = self.cache.get(self._key(sheet_name, columns))
+        if df is None and columns is not None:
+            full = self.cache.get(self._key(sheet_name, None))
+            if full is not None:
+                df = _select(full, columns)
+        return df
+
+    def store(self, sheet_name, df, columns=None):
+        df = _select(strip_columns(df), columns)
+        self.cache.put(self._key(sheet_name, columns), df)
+        return df
+
+    def columns(self, sheet_name):
+        """데이터를 읽지 않고 (공백 제거한) 컬럼명만 조회."""
+        if self.has_sidecars():
+            names = pq.read_schema(sidecar_path(self.path, sheet_name)).names
+        else:
+            names = pd.read_excel(self.path, sheet_name=sheet_name, nrows=0).columns
+        return [str(c).strip() for c in names]
+
+    def sheet(self, sheet_name, columns=None):
+        df = self.cached(sheet_name, columns)
+        if df is not None:
+            return df
+        if self.has_sidecars():
+            path = sidecar_path(self.path, sheet_name)
+            if columns is None:
+                df = pd.read_parquet(path)
+            else:
+                wanted = set(columns)
+                raw = [c for c in pq.read_schema(path).names if c.strip() in wanted]
+                df = pd.read_parquet(path, columns=raw)
+        else:
+            usecols = None if columns is None else (lambda c: str(c).strip() in set(columns))
+            df = pd.read_excel(self.path, sheet_name=sheet_name, usecols=usecols)
+        return self.store(sheet_name, df, columns)
+
+    def __getitem__(self, sheet_name):
+        return self.sheet(sheet_name)
+
+    def partials(self):
+        partials = read_partials(self.path, source_hash=self.content_hash)
+        if partials is None:
+            # 동시출현/연관어는 저장된 시트 대신 요약표에서 다시 계산
+            partials = build_snapshot_partials(*(self.sheet(name) for name in PARTIAL_SOURCE_SHEETS))
+        return partials
+
+
+# --- 3. 기간(여러 스냅샷)
+class SnapshotRange:
+    """snapshots: [(경로, sha256), ...]. 실패한 파일은 (경로, 오류 메시지)로 모아 반환."""
+
+    def __init__(self, snapshots, cache=SHEET_CACHE):
+        self.readers = [SnapshotReader(path, h, cache) for path, h in snapshots]
+
+    def _prefetch(self, sheet_names, readers=None):
+        # 사이드카 없이 엑셀만 있는 스냅샷은 프로세스 풀에서 한꺼번에 파싱해 캐시에 채움
+        cold = [
+            r for r in (readers if readers is not None else self.readers)
+            if not r.has_sidecars() and any(r.cached(name) is None for name in sheet_names)
+        ]
+        for reader, result in zip(cold, read_excel_parallel([r.path for r in cold], sheet_names)):
+            if isinstance(result, Exception):
+                continue  # 개별 로딩 단계에서 같은 오류를 다시 만나 실패로 기록됨
+            for name in sheet_names:
+                reader.store(name, result[name])
+
+    def columns(self, sheet_name):
+        seen = []
+        for reader in self.readers:
+            try:
+                seen += [c for c in reader.columns(sheet_name) if c not in seen]
+            except Exception:
+                continue
+        return seen
+
+    def sheet(self, sheet_name, columns=None):
+        self._prefetch([sheet_name])
+        frames, failures = [], []
+        for reader in self.readers:
+            try:
+                frames.append(reader.sheet(sheet_name, columns))
+            except Exception as e:
+                failures.append((reader.path, str(e)))
+        df = pd.concat(frames, ignore_index=True) if frames else None
+        return df, failures
+
+    def partials(self):
+        self._prefetch(PARTIAL_SOURCE_SHEETS, [r for r in self.readers if not has_fresh_partials(r.path, r.content_hash)])
+        partials, failures = [], []
+        for reader in self.readers:
+            try:
+                partials.append(reader.partials())
+            except Exception as e:
+                failures.append((reader.path, str(e)))
+        return partials, failures
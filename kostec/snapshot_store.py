@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# Description : 주간 스냅샷(.xlsx)의 시트별 Parquet 사이드카 저장소
+#   - assets/data/columnar/<스냅샷명>/<시트>.parquet 형태로 저장
+#   - 원본 xlsx의 sha256을 _source.json에 기록해 최신 여부 판단
+#   - 사이드카가 없거나 오래된 경우에만 openpyxl로 엑셀을 읽음
+#   - 스냅샷별 부분 집계(kostec.aggregates)도 partial_<이름>.parquet으로 함께 저장
+# Usage : python -m kostec.snapshot_store [--force] [xlsx 경로 ...]
+# License : MIT
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from kostec.aggregates import PARTIAL_COLUMNS, PARTIALS_VERSION, build_snapshot_partials
+
+DATA_DIR = "assets/data"
+COLUMNAR_DIR = os.path.join(DATA_DIR, "columnar")
+SHEET_NAMES = ["Summary Table", "Sources", "Executive Summary", "Cooccurrence", "Associations"]
+META_FILE = "_source.json"
+MAX_EXCEL_WORKERS = 4
+
+
+# --- 1. 경로 헬퍼
+def snapshot_stem(xlsx_path):
+    return os.path.splitext(os.path.basename(xlsx_path))[0]
+
+
+def sheet_slug(sheet_name):
+    return sheet_name.strip().lower().replace(" ", "_")
+
+
+def sidecar_dir(xlsx_path):
+    return os.path.join(COLUMNAR_DIR, snapshot_stem(xlsx_path))
+
+
+def sidecar_path(xlsx_path, sheet_name):
+    return os.path.join(sidecar_dir(xlsx_path), f"{sheet_slug(sheet_name)}.parquet")
+
+
+def partial_path(xlsx_path, name):
+    return os.path.join(sidecar_dir(xlsx_path), f"partial_{name}.parquet")
+
+
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# --- 2. 사이드카 상태 확인
+def _meta_path(xlsx_path):
+    return os.path.join(sidecar_dir(xlsx_path), META_FILE)
+
+
+def _read_meta(xlsx_path):
+    try:
+        with open(_meta_path(xlsx_path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def has_fresh_sidecars(xlsx_path, sheet_names=SHEET_NAMES, source_hash=None):
+    meta = _read_meta(xlsx_path)
+    if not meta:
+        return False
+    if source_hash is None:
+        source_hash = file_sha256(xlsx_path)
+    if meta.get("sha256") != source_hash:
+        return False
+    return all(os.path.exists(sidecar_path(xlsx_path, name)) for name in sheet_names)
+
+
+def has_fresh_partials(xlsx_path, source_hash=None):
+    meta = _read_meta(xlsx_path)
+    if not meta or meta.get("partials_version") != PARTIALS_VERSION:
+        return False
+    if source_hash is None:
+        source_hash = file_sha256(xlsx_path)
+    if meta.get("sha256") != source_hash:
+        return False
+    return all(os.path.exists(partial_path(xlsx_path, name)) for name in PARTIAL_COLUMNS)
+
+
+# --- 3. 쓰기
+def write_parquet(df, path):
+    """임시 파일에 쓴 뒤 이름을 바꿔 확정 (읽는 쪽이 쓰다 만 파일을 보지 않음)."""
+    tmp_path = path + ".tmp"
+    try:
+        df.to_parquet(tmp_path, index=False)
+    except (TypeError, ValueError):
+        # 숫자/문자가 섞인 object 컬럼은 Arrow가 거부하므로 값만 문자열로 맞춤
+        df = df.copy()
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+        df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def write_sidecars(xlsx_path, sheets, source_hash=None):
+    """sheets: {시트명: DataFrame}. xlsx를 먼저 저장한 뒤 호출해야 해시가 맞음."""
+    out_dir = sidecar_dir(xlsx_path)
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for name, df in sheets.items():
+        path = sidecar_path(xlsx_path, name)
+        write_parquet(df, path)
+        written.append(path)
+
+    meta = {
+        "source": os.path.basename(xlsx_path),
+        "sha256": source_hash or file_sha256(xlsx_path),
+        "sheets": list(sheets.keys()),
+    }
+    _write_meta(xlsx_path, meta)
+    written.append(_meta_path(xlsx_path))
+    return written
+
+
+def _write_meta(xlsx_path, meta):
+    with open(_meta_path(xlsx_path), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=1)
+
+
+def write_partials(xlsx_path, partials):
+    """write_sidecars() 이후 호출. 부분 집계를 저장하고 메타에 버전을 기록."""
+    meta = _read_meta(xlsx_path)
+    if meta is None:
+        raise FileNotFoundError(f"사이드카가 없습니다: {sidecar_dir(xlsx_path)}")
+    written = []
+    for name in PARTIAL_COLUMNS:
+        path = partial_path(xlsx_path, name)
+        write_parquet(partials[name], path)
+        written.append(path)
+    meta["partials_version"] = PARTIALS_VERSION
+    _write_meta(xlsx_path, meta)
+    return written
+
+
+# --- 4. 읽기
+def read_snapshot(xlsx_path, sheet_names=SHEET_NAMES, source_hash=None):
+    """{시트명: DataFrame} 반환. 사이드카가 최신이면 Parquet, 아니면 엑셀을 읽음."""
+    if has_fresh_sidecars(xlsx_path, sheet_names, source_hash):
+        return {name: pd.read_parquet(sidecar_path(xlsx_path, name)) for name in sheet_names}
+
+    return read_excel_sheets(xlsx_path, sheet_names)
+
+
+def read_excel_sheets(xlsx_path, sheet_names=SHEET_NAMES):
+    xls = pd.ExcelFile(xlsx_path)
+    return {name: pd.read_excel(xls, sheet_name=name) for name in sheet_names}
+
+
+def read_excel_parallel(paths, sheet_names=SHEET_NAMES, max_workers=MAX_EXCEL_WORKERS):
+    """여러 xlsx를 프로세스 풀에서 나눠 파싱. 결과는 paths 순서대로 {시트명: DataFrame} 또는 예외."""
+    def _serial():
+        results = []
+        for path in paths:
+            try:
+                results.append(read_excel_sheets(path, sheet_names))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    workers = min(len(paths), max_workers, os.cpu_count() or 1)
+    if workers < 2:
+        return _serial()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(read_excel_sheets, path, list(sheet_names)) for path in paths]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    results.append(e)
+            return results
+    except (BrokenProcessPool, OSError, NotImplementedError):
+        # 프로세스 생성이 막힌 환경에서는 순차 처리
+        return _serial()
+
+
+def read_partials(xlsx_path, source_hash=None):
+    """저장된 부분 집계 {이름: DataFrame}. 없거나 오래되었으면 None."""
+    if not has_fresh_partials(xlsx_path, source_hash):
+        return None
+    return {name: pd.read_parquet(partial_path(xlsx_path, name)) for name in PARTIAL_COLUMNS}
+
+
+# --- 5. 기존 xlsx 일괄 변환 (백필)
+def convert_snapshot(xlsx_path, force=False):
+    source_hash = file_sha256(xlsx_path)
+    sheets_fresh = not force and has_fresh_sidecars(xlsx_path, source_hash=source_hash)
+    if sheets_fresh and has_fresh_partials(xlsx_path, source_hash):
+        return False
+    if sheets_fresh:
+        sheets = read_snapshot(xlsx_path, source_hash=source_hash)
+    else:
+        sheets = read_excel_sheets(xlsx_path)
+        write_sidecars(xlsx_path, sheets, source_hash=source_hash)
+    write_partials(xlsx_path, build_snapshot_partials(*(sheets[name] for name in SHEET_NAMES)))
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="xlsx 스냅샷을 시트별 Parquet 사이드카로 변환")
+    parser.add_argument("paths", nargs="*", help="변환할 xlsx 경로 (기본: assets/data/*_trend_summary*.xlsx)")
+    parser.add_argument("--force", action="store_true", help="최신 사이드카가 있어도 다시 변환")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or sorted(glob.glob(os.path.join(DATA_DIR, "*_trend_summary*.xlsx")))
+    converted = 0
+    for path in paths:
+        try:
+            if convert_snapshot(path, force=args.force):
+                converted += 1
+                print(f"✅ {path} → {sidecar_dir(path)}")
+            else:
+                print(f"⏭ {path} (최신 상태)")
+        except Exception as e:
+            print(f"❌ {path} 변환 실패: {e}")
+    print(f"{converted}/{len(paths)}개 스냅샷 변환 완료")
+
+
+if __name__ == "__main__":
+    main()
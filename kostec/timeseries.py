@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Description : 키워드별 일자 시계열 저장소 (탭 3)
+#   - 모든 키워드가 같은 일 단위 달력(첫 게재일 ~ 마지막 게재일)을 공유, 키워드마다 연속 배열 한 줄
+#   - 누적합을 미리 계산 → 임의 구간 합계/이동평균이 배열 두 칸의 차 (구간 길이와 무관)
+#   - 일자 x 키워드 피벗(0으로 채운 DataFrame)을 만들지 않고, 선택한 키워드만 DataFrame으로 꺼냄
+#   - 추세 화면(7/14/28일 이동평균, EWMA, 주별/월별 합계)의 달력 구간은 한 번에 계산 (TrendViews)
+#     → 화면 전환 시 선택한 키워드의 누적합 차만 계산
+# License : MIT
+
+import numpy as np
+import pandas as pd
+
+DATE_COLUMN = "Publication Date"
+ROLLING_WINDOWS = (7, 14, 28)
+EWM_SPANS = (7,)
+PERIODS = {"weekly": "W", "monthly": "M"}
+
+
+class KeywordSeries:
+    """counts[i, t] = keywords[i]의 start + t일 등장 횟수. cumsum은 앞에 0 한 칸을 둔 누적합."""
+
+    def __init__(self, start, keywords, counts):
+        self.start = np.datetime64(start, "D")
+        self.keywords = list(keywords)
+        self.rows = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self.days = counts.shape[1] if counts.ndim == 2 else 0
+        self.cumsum = np.zeros((len(self.keywords), self.days + 1), dtype=np.int32)
+        np.cumsum(counts, axis=1, out=self.cumsum[:, 1:])
+
+    @classmethod
+    def from_daily(cls, df_daily):
+        """부분 집계의 daily(Publication Date, Keyword, count)에서 생성."""
+        df = df_daily.dropna(subset=[DATE_COLUMN]) if not df_daily.empty else df_daily
+        if df.empty:
+            return cls("1970-01-01", [], np.zeros((0, 0), dtype=np.int32))
+        days = pd.to_datetime(df[DATE_COLUMN]).to_numpy().astype("datetime64[D]")
+        start = days.min()
+        offsets = (days - start).astype(np.int64)
+        rows, keywords = pd.factorize(df["Keyword"].astype(str), sort=True)
+        width = int(offsets.max()) + 1
+        # (키워드, 날짜) 위치별 합산을 1차원 bincount 한 번으로
+        flat = np.bincount(rows * width + offsets, weights=df["count"].to_numpy(dtype=np.float64),
+                           minlength=len(keywords) * width)
+        return cls(start, keywords.tolist(), flat.astype(np.int32).reshape(len(keywords), width))
+
+    def _span(self, start=None, end=None):
+        # [start, end] 날짜(포함) → 배열 위치 [s, e)
+        s = 0 if start is None else int((np.datetime64(start, "D") - self.start).astype(np.int64))
+        e = self.days if end is None else int((np.datetime64(end, "D") - self.start).astype(np.int64)) + 1
+        return min(max(s, 0), self.days), min(max(e, 0), self.days)
+
+    def _select(self, keywords):
+        return self.cumsum[[self.rows[k] for k in keywords]]
+
+    def dates(self, start=None, end=None):
+        s, e = self._span(start, end)
+        return pd.DatetimeIndex(self.start + np.arange(s, e), name=DATE_COLUMN)
+
+    def trend_views(self, windows=ROLLING_WINDOWS, ewm_spans=EWM_SPANS, periods=PERIODS):
+        """추세 화면별 달력 구간(누적합 위치)만 한 번에 계산 → TrendViews. 키워드 값은 frame()에서 선택한 것만."""
+        dates = self.dates()
+        views = {}
+
+        # 이동평균: 날짜마다 [begin, end) 창 → 누적합 차 / 창 길이
+        ends = np.arange(1, self.days + 1)
+        for window in windows:
+            begins = np.maximum(ends - window, 0)
+            views[f"rolling{window}"] = (dates, begins, ends, ends - begins)
+
+        # 주별/월별 합계: 기간 경계의 누적합 차
+        for name, freq in periods.items():
+            labels = dates.to_period(freq)
+            starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]]) if len(labels) else np.array([], dtype=int)
+            stops = np.r_[starts[1:], self.days]
+            index = pd.DatetimeIndex(labels[starts].start_time, name=DATE_COLUMN)
+            views[name] = (index, starts, stops, None)
+        return TrendViews(self, views, {f"ewm{span}": span for span in ewm_spans})
+
+
+class TrendViews:
+    """{화면 이름: (날짜 인덱스, 구간 시작, 구간 끝, 나눌 값)} + EWMA span. frame()은 선택한 키워드만 계산."""
+
+    def __init__(self, series, views, ewm_spans):
+        self.series = series
+        self.keywords = series.keywords
+        self.views = views
+        self.ewm_spans = ewm_spans
+
+    def frame(self, name, keywords):
+        keywords = list(keywords)
+        columns = pd.Index(keywords, name="Keyword")
+        cumsum = self.series._select(keywords)
+        if name in self.ewm_spans:
+            # EWMA: 날짜 축 재귀는 pandas(Cython)가 선택한 키워드 열을 한 번에 처리
+            counts = pd.DataFrame(np.diff(cumsum, axis=1).T, index=self.series.dates(), columns=columns)
+            return counts.ewm(span=self.ewm_spans[name], adjust=False).mean()
+        index, begins, ends, divisor = self.views[name]
+        values = (cumsum[:, ends] - cumsum[:, begins]).astype(np.float64)
+        if divisor is not None:
+            values /= divisor
+        return pd.DataFrame(values.T, index=index, columns=columns)
@@ -11,24 +11,77 @@
 # --- 0. 라이브러리 임포트
 import streamlit as st
 import pandas as pd
-import altair as alt
-from streamlit_agraph import agraph, Node, Edge, Config
-from collections import defaultdict
-import os, io, zipfile
-from datetime import date, datetime
-import glob, time
-from matplotlib_venn import venn2
-import matplotlib.pyplot as plt
-import numpy as np
-from datetime import timedelta
-import html
-from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.tokenizers import Tokenizer
-from sumy.summarizers.text_rank import TextRankSummarizer
-import itertools
+import os
+import uuid
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+# 무거운 모듈(altair, streamlit_agraph, networkx)은 해당 탭의 함수 안에서 import
+# (시작 시 import 예산: python -m bench.import_budget)
+from kostec.snapshot_catalog import open_catalog, catalog_mtime
+from kostec.aggregates import combine_partials, REQUIRED_SOURCE_COLS
+from kostec.snapshot_reader import SnapshotRange, SHEET_CACHE
+from kostec.collection_jobs import JobRunner
+from kostec.pipeline import format_metrics
+from kostec.drilldown import keyword_drilldown, drilldown_page, drilldown_display, page_count
+from kostec.rankings import load_keyword_map, rank_tables
+from kostec.exports import EXPORT_KINDS, export_path, export_reader, file_reader
+from kostec import profiling
+from kostec.profiling import profiled_cache
 
 # --- 1. 설정
+NETWORK_TOP_K = 200  # 동시출현 네트워크 기본 엣지 수 상한
+DRILLDOWN_PAGE_SIZES = [10, 20, 50, 100]  # 탭 4 페이지당 키워드 수 선택지
+RANK_PAGE_SIZES = [20, 50, 100, 200]  # 탭 5 페이지당 순위 수 선택지
+TREND_VIEW_LABELS = {  # 탭 3 추세 기준 (kostec.timeseries.KeywordSeries.trend_views의 화면 이름)
+    "rolling7": "7일 이동 평균",
+    "rolling14": "14일 이동 평균",
+    "rolling28": "28일 이동 평균",
+    "ewm7": "지수가중 이동 평균(EWMA, span 7)",
+    "weekly": "주별 합계",
+    "monthly": "월별 합계",
+}
 st.set_page_config(page_title="한중과기협력센터 키워드 대시보드", layout="wide")
+
+# 세션별 스크립트 실행 횟수 (bench/startup.py가 새 세션의 첫 로딩이 1회 실행인지 확인)
+st.session_state["script_runs"] = st.session_state.get("script_runs", 0) + 1
+
+# 프로파일링 (기본 꺼짐): 주소에 ?profile=1 또는 secrets.toml에 profiling = true
+# → 사이드바에 구간별 시간/캐시 적중/행 수/메모리, profiling_log = "경로"가 있으면 JSONL로 누적
+def profiling_settings():
+    try:
+        secrets = {key: st.secrets[key] for key in ("profiling", "profiling_log") if key in st.secrets}
+    except FileNotFoundError:  # secrets.toml 없음
+        secrets = {}
+    enabled = st.query_params.get("profile") in ("1", "true") or bool(secrets.get("profiling"))
+    return enabled, secrets.get("profiling_log")
+
+profiling_enabled, profiling_log = profiling_settings()
+profiler = profiling.Profiler() if profiling_enabled else None
+profiling.activate(profiler)
+
+def render_profiling_panel():
+    """이번 실행의 구간 기록을 사이드바에 표시 (st.stop() 전에도 호출)."""
+    if not profiler:
+        return
+    with st.sidebar.expander("⏱ 프로파일링", expanded=True):
+        misses = sum(r["cache"] == "miss" for r in profiler.records)
+        st.caption(f"전체 {profiler.elapsed() * 1000:.0f} ms · 캐시 함수 계산 {misses}건 · "
+                   f"시트 캐시 {len(SHEET_CACHE)}개 {SHEET_CACHE.nbytes / 2**20:.1f} MB "
+                   f"(적중 {SHEET_CACHE.hits} / 읽기 {SHEET_CACHE.misses})")
+        st.dataframe(profiler.frame(), hide_index=True)
+        if profiling_log:
+            # 세션 구분용 임의 ID (세션 간 비교 분석용)
+            session_id = st.session_state.setdefault("profiling_session", uuid.uuid4().hex[:12])
+            profiler.append_jsonl(profiling_log, session=session_id, run=st.session_state["script_runs"],
+                                  start=st.session_state.get("start_date"), end=st.session_state.get("end_date"),
+                                  active_tab=st.session_state.get("active_tab"))
+            st.caption(f"📝 {profiling_log}에 기록")
+
+# 데이터 확인 실패 시 중단 (프로파일링 중이면 패널을 먼저 표시)
+def stop_run():
+    render_profiling_panel()
+    st.stop()
+
 col1, col2 = st.columns([2, 8])  # 로고:제목 비율 조정
 
 
@@ -128,631 +181,463 @@ st.sidebar.markdown("### 👉 스타일 및 기간 설정")
 selected_palette = st.sidebar.selectbox("🎨 색상 팔레트 선택", color_palettes, index=0)
 start_date = st.sidebar.date_input("🗓 시작일", value=date.today() - timedelta(days=7), key="start_date")
 end_date = st.sidebar.date_input("⏳ 종료일", value=date.today(), key="end_date")
+prefetch_neighbor_tabs = st.sidebar.checkbox("⚡ 인접 탭 미리 계산", value=False, key="prefetch_tabs",
+                                             help="선택한 탭 양옆 탭의 데이터를 백그라운드에서 미리 계산해 탭 전환을 빠르게 합니다.")
 
-# 파일 목록 필터링 (중국 버전 기준)
-snapshot_files = glob.glob("assets/data/*_trend_summary.xlsx")
-snapshot_files_global = glob.glob("assets/data/*_trend_summary_en.xlsx")
-snapshot_dates = [os.path.basename(f).split("_")[0] for f in snapshot_files]
-snapshot_dates = [d for d in snapshot_dates if d.isdigit() and len(d) == 8]
+# 스냅샷 카탈로그 (catalog.json 변경 시에만 다시 읽음)
+@profiled_cache(st.cache_data)
+def load_snapshot_catalog(mtime):
+    return open_catalog()
 
-# 날짜 필터링
-selected_files = [
-    f for f in snapshot_files
-    if start_date.strftime("%Y%m%d") <= os.path.basename(f).split("_")[0] <= end_date.strftime("%Y%m%d")
-]
-selected_files_global = [
-    f for f in snapshot_files_global
-    if start_date.strftime("%Y%m%d") <= os.path.basename(f).split("_")[0] <= end_date.strftime("%Y%m%d")
-]
+with profiling.section("탐색 (카탈로그)"):
+    catalog = load_snapshot_catalog(catalog_mtime())
+
+    # 날짜 필터링 (카탈로그 이진 탐색)
+    selected_entries = catalog.in_range("cn", start_date, end_date)
+    selected_entries_global = catalog.in_range("en", start_date, end_date)
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 👉 주간 동향 수집")
 
 input_date = st.sidebar.date_input("📆 수집 시작 날짜", value=date.today(), key="expander_date")
-current_date = input_date.strftime("%Y%m%d")
 api_token = st.sidebar.text_input("🔐 Claude API 토큰", type="password", key="expander_api")
 github_token = st.sidebar.text_input("🪪 GitHub Token", type="password", key="expander_git")
 
-if st.sidebar.button("수집 시작(중국) 🚀 ", key="expander_run1"):
-    with st.spinner(f"📡 {current_date} 기준 수집 중입니다... 최대 3~5분 소요."):
-        try:
-            import os
-            import anthropic
-            import re
-            from io import StringIO
-            from itertools import combinations
-            from openpyxl import load_workbook
-
-            client = anthropic.Anthropic(api_key=api_token)
-
-            with open("assets/input/keywords.txt", "r", encoding="utf-8") as f:
-                keywords = f.read().strip()
-            with open("assets/input/sites.txt", "r", encoding="utf-8") as f:
-                source_sites = f.read().strip()
-            with open("assets/input/prompt.txt", "r", encoding="utf-8") as f:
-                prompt_template = f.read()
-
-                            # 변수 정의
-            prompt1 = prompt_template.format(
-                keywords=keywords,        # 문자열 또는 리스트 join한 값
-                current_date=current_date,        # '20250518' 같은 문자열
-                source_sites=source_sites        # 문자열 또는 사이트 목록
-            )
-                        #st.write(prompt2)
-                            # Claude API 호출
-            message = client.messages.create(
-        model="claude-3-7-sonnet-20250219",
-        max_tokens=20000,
-        temperature=1,
-        messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": prompt1
-                            }
-                        ]
-                    }
-                ]
-      )
+backfill_weeks = st.sidebar.number_input("🔁 백필 주 수 (선택 날짜부터 1주 간격)", min_value=1, max_value=12, value=1, key="expander_weeks")
+collect_dates = [(input_date - timedelta(weeks=i)).strftime("%Y%m%d") for i in range(int(backfill_weeks))]
+use_response_cache = st.sidebar.checkbox("♻️ 동일 입력의 캐시된 응답 재사용", value=True, key="expander_cache")
 
-                        #st.write(prompt1)
-            st.write("Step 1: RAG 수행 완료.")
-                            # 결과 파싱
-            text_data = message.content[0].text if isinstance(message.content, list) else message.content.text
-            match = re.search(r"<excel_report>(.*?)</excel_report>", text_data, re.DOTALL)
-            text_block = match.group(0) if match else None
-            st.write("Step 2: 메시지 파싱 완료.")
-            sheet1_start = text_block.find("<sheet1>")
-            sheet1_end = text_block.find("</sheet1>")
-            sheet2_start = text_block.find("<sheet2>")
-            sheet2_end = text_block.find("</sheet2>")
-            summary_start = text_block.find("<executive_summary>")
-            summary_end = text_block.find("</executive_summary>")
-
-            sheet1_text = text_block[sheet1_start:sheet1_end]
-            sheet2_text = text_block[sheet2_start:sheet2_end]
-            executive_summary_text = text_block[summary_start + len("<executive_summary>"):summary_end].strip()
-
-            st.write("Step 3: 엑셀 시트 파싱 완료")
-
-            sheet1_table_match = re.search(r"(\|.+?\|\n\|[-|]+\|\n(.+?))$", sheet1_text, re.DOTALL)
-            sheet2_table_match = re.search(r"(\|.+?\|\n\|[-|]+\|\n(.+?))$", sheet2_text, re.DOTALL)
-
-            sheet1_table_md = sheet1_table_match.group(1).strip() if sheet1_table_match else ""
-            sheet2_table_md = sheet2_table_match.group(1).strip() if sheet2_table_match else ""
-
-            df_sheet1 = pd.read_csv(StringIO(sheet1_table_md), sep="|", engine="python").dropna(axis=1, how="all")
-            df_sheet2 = pd.read_csv(StringIO(sheet2_table_md), sep="|", engine="python").dropna(axis=1, how="all")
-                            # 저장
-            excel_path = f"assets/data/{current_date}_trend_summary.xlsx"
-                            # 동시출현 및 연관어 분석
-            df_summary = df_sheet1.iloc[1:].reset_index(drop=True)
-            df_summary.columns = [col.strip() for col in df_summary.columns]
-            keywords_list = [kw.strip() for kw in df_summary["Keyword"].dropna().unique().tolist()]
-
-            cooccur_counter = defaultdict(int)
-            association_counter = defaultdict(int)
-            for _, row in df_summary.iterrows():
-                text = (str(row.get("Detailed Summary", "")) + " " + str(row.get("Short Summary", ""))).lower()
-                present_keywords = [kw for kw in keywords_list if kw.lower() in text]
-                for kw1, kw2 in combinations(sorted(set(present_keywords)), 2):
-                    cooccur_counter[(kw1, kw2)] += 1
-                for kw in present_keywords:
-                    association_counter[kw] += 1
-
-            df_cooccur = pd.DataFrame([{"source": k1, "target": k2, "count": v} for (k1, k2), v in cooccur_counter.items()])
-            df_association = pd.DataFrame([{"term": k, "count": v} for k, v in association_counter.items()])
-            st.write("Step 4: 동시출현 및 연관어 분석 완료")
-
-            with pd.ExcelWriter(excel_path, engine="openpyxl", mode="w") as writer:
-                df_summary.to_excel(writer, index=False, sheet_name="Summary Table")
-                df_sheet2.to_excel(writer, index=False, sheet_name="Sources")
-                pd.DataFrame({"Executive Summary": [executive_summary_text]}).to_excel(writer, index=False, sheet_name="Executive Summary")
-                df_cooccur.to_excel(writer, index=False, sheet_name="Cooccurrence")
-                df_association.to_excel(writer, index=False, sheet_name="Associations")
-
-            st.sidebar.success(f"{current_date} 기준 주간 중국 동향 수집 및 저장 완료!")
-
-        except Exception as e:
-            st.sidebar.error(f"❌ 수집 중 오류 발생: {e}")
-
-        from github import Github
-        repo_name = "kostec-stat/streamlit"
-        file_path = f"assets/data/{current_date}_trend_summary.xlsx"
-
-        try:
-            g = Github(github_token)
-            repo = g.get_repo(repo_name)
-
-            with open(file_path, "rb") as f:
-                content = f.read()
-                path_in_repo = f"assets/data/{current_date}_trend_summary.xlsx"
-
-            try:
-                existing_file = repo.get_contents(path_in_repo)
-                repo.update_file(existing_file.path, f"update {path_in_repo}", content, existing_file.sha)
-            except Exception:
-                repo.create_file(path_in_repo, f"add {path_in_repo}", content)
-
-            st.success(f" {current_date} 기준 주간 동향 수집, 저장 및 GitHub 업로드 완료!")
-        except Exception as upload_err:
-            st.warning(f"⚠️ 수집은 완료되었으나 GitHub 업로드 실패: {upload_err}")
+# 수집은 서버의 백그라운드 작업으로 실행: 수집 중에도 대시보드 조회 가능, 새로고침해도 작업 유지
+@st.cache_resource
+def get_job_runner():
+    return JobRunner()
 
+job_runner = get_job_runner()
+run_locales = []
+if st.sidebar.button("수집 시작(중국) 🚀 ", key="expander_run1"):
+    run_locales = ["cn"]
 if st.sidebar.button("수집 시작(글로벌) 🚀 ", key="expander_run2"):
-    with st.spinner("⏳ 수집 중입니다. 최대 3~5분 소요..."):
-        try:
-            import os
-            import anthropic
-            import re
-            from io import StringIO
-            from itertools import combinations
-            from openpyxl import load_workbook
-                            # API 연결
-            client = anthropic.Anthropic(api_key=api_token)
-            with open("assets/input/en_keywords.txt", "r", encoding="utf-8") as f:
-                en_keywords = f.read().strip()
-            with open("assets/input/prompt.txt", "r", encoding="utf-8") as f:
-                prompt_template = f.read()
-                            # 변수 정의
-            prompt2 = prompt_template.format(
-                keywords=en_keywords,        # 문자열 또는 리스트 join한 값
-                current_date=current_date,        # '20250518' 같은 문자열
-                source_sites="*"        # 문자열 또는 사이트 목록
-            )
-                        #st.write(prompt2)
-                            # Claude API 호출
-            message = client.messages.create(
-        model="claude-3-7-sonnet-20250219",
-        max_tokens=20000,
-        temperature=1,
-        messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": prompt2
-                            }
-                        ]
-                    }
-                ]
-      )
+    run_locales = ["en"]
+if st.sidebar.button("수집 시작(중국+글로벌) 🚀 ", key="expander_run3"):
+    run_locales = ["cn", "en"]
 
-                        #st.write(prompt1)
-            st.write("Step 1: RAG 수행 완료.")
-
-                            # 결과 파싱
-            text_data = message.content[0].text if isinstance(message.content, list) else message.content.text
-            match = re.search(r"<excel_report>(.*?)</excel_report>", text_data, re.DOTALL)
-            text_block = match.group(0) if match else None
-            st.write("Step 2: 메시지 파싱 완료.")
-            sheet1_start = text_block.find("<sheet1>")
-            sheet1_end = text_block.find("</sheet1>")
-            sheet2_start = text_block.find("<sheet2>")
-            sheet2_end = text_block.find("</sheet2>")
-            summary_start = text_block.find("<executive_summary>")
-            summary_end = text_block.find("</executive_summary>")
-
-            sheet1_text = text_block[sheet1_start:sheet1_end]
-            sheet2_text = text_block[sheet2_start:sheet2_end]
-            executive_summary_text = text_block[summary_start + len("<executive_summary>"):summary_end].strip()
-            sheet1_table_match = re.search(r"(\|.+?\|\n\|[-|]+\|\n(.+?))$", sheet1_text, re.DOTALL)
-            sheet2_table_match = re.search(r"(\|.+?\|\n\|[-|]+\|\n(.+?))$", sheet2_text, re.DOTALL)
-
-            sheet1_table_md = sheet1_table_match.group(1).strip() if sheet1_table_match else ""
-            sheet2_table_md = sheet2_table_match.group(1).strip() if sheet2_table_match else ""
-
-            df_sheet1 = pd.read_csv(StringIO(sheet1_table_md), sep="|", engine="python").dropna(axis=1, how="all")
-            df_sheet2 = pd.read_csv(StringIO(sheet2_table_md), sep="|", engine="python").dropna(axis=1, how="all")
-            st.write("Step 3: 엑셀 시트 파싱 완료")
-                            # 저장
-            excel_path = f"assets/data/{current_date}_trend_summary_en.xlsx"
-                            # 동시출현 및 연관어 분석
-            df_summary = df_sheet1.iloc[1:].reset_index(drop=True)
-            df_summary.columns = [col.strip() for col in df_summary.columns]
-            keywords_list = [kw.strip() for kw in df_summary["Keyword"].dropna().unique().tolist()]
-
-            cooccur_counter = defaultdict(int)
-            association_counter = defaultdict(int)
-            for _, row in df_summary.iterrows():
-                text = (str(row.get("Detailed Summary", "")) + " " + str(row.get("Short Summary", ""))).lower()
-                present_keywords = [kw for kw in keywords_list if kw.lower() in text]
-                for kw1, kw2 in combinations(sorted(set(present_keywords)), 2):
-                    cooccur_counter[(kw1, kw2)] += 1
-                for kw in present_keywords:
-                    association_counter[kw] += 1
-
-            df_cooccur = pd.DataFrame([{"source": k1, "target": k2, "count": v} for (k1, k2), v in cooccur_counter.items()])
-            df_association = pd.DataFrame([{"term": k, "count": v} for k, v in association_counter.items()])
-            st.write("Step 4: 동시출현 및 연관어 분석 완료")
-            with pd.ExcelWriter(excel_path, engine="openpyxl", mode="w") as writer:
-                df_summary.to_excel(writer, index=False, sheet_name="Summary Table")
-                df_sheet2.to_excel(writer, index=False, sheet_name="Sources")
-                pd.DataFrame({"Executive Summary": [executive_summary_text]}).to_excel(writer, index=False, sheet_name="Executive Summary")
-                df_cooccur.to_excel(writer, index=False, sheet_name="Cooccurrence")
-                df_association.to_excel(writer, index=False, sheet_name="Associations")
-
-            st.sidebar.success(f"{current_date} 기준 주간 글로벌 동향 수집 및 저장 완료!")
-
-        except Exception as e:
-            st.sidebar.error(f"❌ 수집 중 오류 발생: {e}")
-
-        from github import Github
-        repo_name = "kostec-stat/streamlit"
-        file_path = f"assets/data/{current_date}_trend_summary_en.xlsx"
-
-        try:
-            g = Github(github_token)
-            repo = g.get_repo(repo_name)
-
-            with open(file_path, "rb") as f:
-                content = f.read()
-                path_in_repo = f"assets/data/{current_date}_trend_summary_en.xlsx"
-
-            try:
-                existing_file = repo.get_contents(path_in_repo)
-                repo.update_file(existing_file.path, f"update {path_in_repo}", content, existing_file.sha)
-            except Exception:
-                repo.create_file(path_in_repo, f"add {path_in_repo}", content)
-
-            st.success(f" {current_date} 기준 주간 동향 수집, 저장 및 GitHub 업로드 완료!")
-        except Exception as upload_err:
-            st.warning(f"⚠️ 수집은 완료되었으나 GitHub 업로드 실패: {upload_err}")
-
-@st.cache_data
-def load_excel_data(path):
-    xls = pd.ExcelFile(path)
-    df_summary = pd.read_excel(xls, sheet_name="Summary Table")
-    df_sources = pd.read_excel(xls, sheet_name="Sources")
-    df_exec = pd.read_excel(xls, sheet_name="Executive Summary")
-    df_cooccur = pd.read_excel(xls, sheet_name="Cooccurrence")
-    df_assoc = pd.read_excel(xls, sheet_name="Associations")
-    return df_summary, df_sources, df_exec, df_cooccur, df_assoc
-
-# 모든 파일에서 시트 불러오기
-df_summary_all, df_sources_all, df_exec_all, df_cooccur_all, df_assoc_all = [], [], [], [], []
-
-for path in selected_files:
-    try:
-        df_s, df_src, df_exe, df_co, df_as = load_excel_data(path)
-        df_summary_all.append(df_s)
-        df_sources_all.append(df_src)
-        df_exec_all.append(df_exe)
-        df_cooccur_all.append(df_co)
-        df_assoc_all.append(df_as)
-    except Exception as e:
-        st.warning(f"⚠️ 파일 로딩 실패: {path}, 오류: {e}")
-
-# 하나의 DataFrame으로 통합
-if df_summary_all:
-    df_summary = pd.concat(df_summary_all, ignore_index=True)
-    df_sources = pd.concat(df_sources_all, ignore_index=True)
-    df_exec = pd.concat(df_exec_all, ignore_index=True)
-    df_cooccur = pd.concat(df_cooccur_all, ignore_index=True)
-    df_assoc = pd.concat(df_assoc_all, ignore_index=True)
-else:
+if run_locales:
+    if not api_token:
+        st.sidebar.error("❌ Claude API 토큰을 입력하세요.")
+    else:
+        # 한 번에 등록한 작업은 모두 끝난 뒤 한 커밋으로 업로드 (재배포 1회)
+        job_runner.submit_batch(run_locales, collect_dates, api_token, github_token or None, use_cache=use_response_cache)
+        st.sidebar.success(f"📡 {len(collect_dates) * len(run_locales)}건의 수집 작업을 등록했습니다. 건당 최대 3~5분 소요되며, 그동안 대시보드는 계속 사용할 수 있습니다.")
+
+job_status_icons = {"queued": "⏳", "running": "📡", "succeeded": "✅", "failed": "❌", "interrupted": "⚠️"}
+recent_jobs = job_runner.jobs(limit=10)
+if recent_jobs:
+    with st.sidebar.expander("📋 수집 작업 현황", expanded=any(j["status"] in ("queued", "running") for j in recent_jobs)):
+        st.button("🔄 상태 새로고침", key="refresh_jobs")
+        for job in recent_jobs:
+            st.markdown(f"{job_status_icons.get(job['status'], '•')} **{job['date']} {job['label']}** · {job['status']}")
+            if job["log"]:
+                st.caption(job["log"][-1])
+            if job["error"]:
+                st.caption(job["error"])
+            if job["publish"]:
+                st.caption(job["publish"])
+            if job.get("metrics") and job["status"] not in ("queued", "running"):
+                st.caption(f"⏱ {format_metrics(job['metrics'])}")
+
+# 스냅샷 시트는 SnapshotReader가 (파일, 시트, 컬럼) 단위로 처음 접근할 때만 읽고
+# 메모리 상한이 있는 LRU 캐시에 보관. 아래 함수들은 기간 단위 결과를 캐시.
+def show_load_failures(failures):
+    for path, err in failures:
+        st.warning(f"⚠️ 파일 로딩 실패: {path}, 오류: {err}")
+
+# 기간 단위 집계 캐시: (경로, sha256) 묶음이 같으면 합산/피벗/이동평균을 다시 계산하지 않음
+@profiled_cache(st.cache_data(max_entries=16))
+def load_range_aggregates(snapshot_key):
+    with profiling.section("부분 집계 로딩"):
+        partials, failures = SnapshotRange(snapshot_key).partials()
+    with profiling.section("부분 집계 합산"):
+        return (combine_partials(partials) if partials else None), failures
+
+@profiled_cache(st.cache_data(max_entries=16))
+def load_range_columns(snapshot_key):
+    snapshot_range = SnapshotRange(snapshot_key)
+    return {name: snapshot_range.columns(name) for name in ("Summary Table", "Sources", "Cooccurrence")}
+
+# 탭별로 필요한 시트/컬럼만 합쳐서 반환
+@profiled_cache(st.cache_data(max_entries=32))
+def load_range_sheet(snapshot_key, sheet_name, columns=None):
+    return SnapshotRange(snapshot_key).sheet(sheet_name, columns)
+
+# 동시출현 네트워크: 쌍별 합산/정리 + 서버 측 좌표 계산 결과를 캐시
+@profiled_cache(st.cache_data(max_entries=32))
+def load_network_payload(snapshot_key, layout, min_count, top_k, palette):
+    from kostec.network import network_payload
+
+    frames, _ = load_range_aggregates(snapshot_key)
+    return network_payload(frames["cooccur_edges"], layout, min_count=min_count, top_k=top_k, palette=list(palette))
+
+# 탭 3 추세: 이동평균(7/14/28일)·EWMA·주별/월별 합계의 달력 구간을 한 번에 계산 → 기준 전환은 선택 키워드만 계산
+@profiled_cache(st.cache_data(max_entries=16))
+def load_trend_views(snapshot_key):
+    frames, _ = load_range_aggregates(snapshot_key)
+    return frames["series"].trend_views()
+
+# 탭 4 드릴다운: 전체 키워드의 대표 요약 + 출처 링크 (Keyword Count 내림차순, 페이지는 화면에서 슬라이스)
+@profiled_cache(st.cache_data(max_entries=16))
+def load_keyword_drilldown(snapshot_key):
+    frames, _ = load_range_aggregates(snapshot_key)
+    df_summary, failures = load_range_sheet(
+        snapshot_key, "Summary Table", ("Keyword", "Short Summary", "Detailed Summary", "Source URL")
+    )
+    return keyword_drilldown(df_summary, frames["keyword_counts"]), failures
+
+# 탭 5 순위표: 중국(부분 집계 합계)과 글로벌(영문 키워드 → 중문 매핑 후 합산)
+@profiled_cache(st.cache_data(max_entries=16))
+def load_rank_tables(snapshot_key, global_snapshot_key):
+    frames, _ = load_range_aggregates(snapshot_key)
+    df_global_summary, failures = load_range_sheet(global_snapshot_key, "Summary Table", ("Keyword", "Keyword Count"))
+    if df_global_summary is None:
+        return None, None, failures
+
+    df_rank_china, df_rank_global = rank_tables(frames["keyword_counts"], df_global_summary, load_keyword_map())
+    return df_rank_china, df_rank_global, failures
+
+# 표 HTML 캐시: (화면, 기간, 페이지, 페이지 크기)마다 한 번만 생성 → 재실행 시 키워드 수와 무관하게 한 페이지 분량만 전송
+@profiled_cache(st.cache_data(max_entries=256))
+def load_table_html(view, range_key, page, page_size):
+    if view == "drilldown":
+        df_page = drilldown_display(drilldown_page(load_keyword_drilldown(range_key)[0], page, page_size))
+    else:
+        df_rank_china, df_rank_global, _ = load_rank_tables(*range_key)
+        df_page = drilldown_page(df_rank_china if view == "rank_china" else df_rank_global, page, page_size)
+    return df_page.to_html(escape=False, index=False)
+
+def page_controls(total, key, size_label, sizes, default_size):
+    """페이지 크기 선택 + 페이지 번호 입력. (page, page_size) 반환."""
+    size_col, page_col = st.columns(2)
+    page_size = size_col.selectbox(size_label, sizes, index=sizes.index(default_size), key=f"{key}_size")
+    pages = page_count(total, page_size)
+    page = page_col.number_input(f"📄 페이지 (1~{pages})", min_value=1, max_value=pages, value=1, key=f"{key}_page")
+    return int(page), page_size
+
+snapshot_key = tuple((e["path"], e["sha256"]) for e in selected_entries)
+global_snapshot_key = tuple((e["path"], e["sha256"]) for e in selected_entries_global)
+range_frames, load_failures = load_range_aggregates(snapshot_key)
+show_load_failures(load_failures)
+
+if not range_frames:
     st.error("❌ 선택한 기간에 해당하는 데이터를 찾을 수 없습니다.")
-    st.stop()
-
-df_summary.columns = [col.strip() for col in df_summary.columns]
-df_cooccur.columns = [col.strip() for col in df_cooccur.columns]
-df_sources.columns = [col.strip() for col in df_sources.columns]
+    stop_run()
 
-# 2. 존재 여부 확인
-required_cols = {"URL", "Publication Date"}
-missing_cols = required_cols - set(df_sources.columns)
+# 2. 존재 여부 확인 (데이터 대신 컬럼명만 조회)
+range_columns = load_range_columns(snapshot_key)
+missing_cols = REQUIRED_SOURCE_COLS - set(range_columns["Sources"])
 
 if missing_cols:
     st.error(f"❌ df_sources에 다음 컬럼이 없습니다: {missing_cols}")
-    st.write("📌 현재 컬럼 목록:", df_sources.columns.tolist())
-    st.stop()
-else:
-    df_merged = df_summary.merge(
-        df_sources[["URL", "Publication Date"]],
-        how="left",
-        left_on="Source URL",
-        right_on="URL"
-    )
+    st.write("📌 현재 컬럼 목록:", range_columns["Sources"])
+    stop_run()
     
-if "count" not in df_cooccur.columns:
+if "count" not in range_columns["Cooccurrence"]:
     st.error("❌ 'count' 컬럼이 존재하지 않습니다.")
-    st.write("📌 현재 컬럼:", df_cooccur.columns.tolist())
-    st.stop()
+    st.write("📌 현재 컬럼:", range_columns["Cooccurrence"])
+    stop_run()
 
 # 존재하는 컬럼인지 확인
-if "Keyword Count" not in df_summary.columns:
+if "Keyword Count" not in range_columns["Summary Table"]:
     st.error("❌ 'Keyword Count' 컬럼을 찾을 수 없습니다.")
-    st.write("🔎 현재 컬럼 목록:", df_summary.columns.tolist())
-    st.stop()
-
-# URL 기준으로 날짜 매핑
-df_merged = df_summary.merge(
-    df_sources[["URL", "Publication Date"]],
-    how="left",
-    left_on="Source URL",
-    right_on="URL"
-)
-# 날짜 정리
-df_merged["Publication Date"] = pd.to_datetime(df_merged["Publication Date"])
-df_merged["Keyword"] = df_merged["Keyword"].astype(str)
-
-# 일자별 키워드 등장 횟수 집계
-df_daily = df_merged.groupby(["Publication Date", "Keyword"]).size().reset_index(name="count")
+    st.write("🔎 현재 컬럼 목록:", range_columns["Summary Table"])
+    stop_run()
+
+# 탭 2 네트워크 설정 (미리 계산에서도 같은 기본값 사용)
+# 좌표는 서버에서 계산 (kostec.network) → 브라우저는 물리 시뮬레이션 없이 고정 좌표로 그림
+layout_options = {
+    "Static (좌표고정)": "shell",
+    "Circular (Centered)": "circular",
+    "Force-Directed (Spring)": "spring",
+    "Random": "random",
+    "Grid": "grid",
+    "Hierarchical - LR": "hierarchical-LR",
+    "Hierarchical - RL": "hierarchical-RL",
+    "Hierarchical - TB": "hierarchical-TB",
+    "Hierarchical - BT": "hierarchical-BT",
+}
 
-# 피벗 테이블로 일자 x 키워드 형태
-df_pivot = df_daily.pivot_table(index="Publication Date", columns="Keyword", values="count", fill_value=0).sort_index()
+altair_palettes = {
+    "viridis": [
+        "#440154", "#482777", "#3E4989", "#31688E", "#26828E",
+        "#1F9E89", "#35B779", "#6DCD59", "#B4DD2C", "#FDE725"
+    ],
+    "plasma": [
+        "#0d0887", "#6a00a8", "#b12a90", "#e16462", "#fca636", "#f0f921"
+    ],
+    "magma": [
+        "#000004", "#1b0c41", "#4f0c6b", "#781c6d", "#a52c60",
+        "#cf4446", "#ed6925", "#fb9b06", "#f7d13d", "#fcfdbf"
+    ],
+    "inferno": [
+        "#000004", "#1e0c48", "#57106e", "#87216b", "#ac375a",
+        "#cb504a", "#e97139", "#f89441", "#fdc328", "#fcffa4"
+    ],
+    "turbo": [
+        "#30123b", "#4143d3", "#4694e6", "#3ec4ac", "#3edd68",
+        "#a8eb39", "#f9f871", "#fecf3f", "#fb7d1d", "#d11807"
+    ],
+    "category10": [
+        "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
+        "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"
+    ],
+    "category20": [
+        "#1f77b4", "#aec7e8", "#ff7f0e", "#ffbb78", "#2ca02c",
+        "#98df8a", "#d62728", "#ff9896", "#9467bd", "#c5b0d5",
+        "#8c564b", "#c49c94", "#e377c2", "#f7b6d2", "#7f7f7f",
+        "#c7c7c7", "#bcbd22", "#dbdb8d", "#17becf", "#9edae5"
+    ],
+    "accent": [
+        "#7fc97f", "#beaed4", "#fdc086", "#ffff99",
+        "#386cb0", "#f0027f", "#bf5b17", "#666666"
+    ],
+    "dark2": [
+        "#1b9e77", "#d95f02", "#7570b3", "#e7298a",
+        "#66a61e", "#e6ab02", "#a6761d", "#666666"
+    ],
+    "set1": [
+        "#e41a1c", "#377eb8", "#4daf4a", "#984ea3",
+        "#ff7f00", "#ffff33", "#a65628", "#f781bf", "#999999"
+    ],
+    "set2": [
+        "#66c2a5", "#fc8d62", "#8da0cb", "#e78ac3",
+        "#a6d854", "#ffd92f", "#e5c494", "#b3b3b3"
+    ],
+    "set3": [
+        "#8dd3c7", "#ffffb3", "#bebada", "#fb8072",
+        "#80b1d3", "#fdb462", "#b3de69", "#fccde5",
+        "#d9d9d9", "#bc80bd", "#ccebc5", "#ffed6f"
+    ]
+}
 
-# 7일 이동 평균
-df_rolling = df_pivot.rolling(window=7, min_periods=1).mean()
+color_list = altair_palettes.get(selected_palette, ["#1f77b4", "#ff7f0e", "#2ca02c"])
 
 # --- 4. 탭 구성
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
+tab_labels = [
     "📊 요약과 다운로드", 
     "🕸 동시출현 네트워크", 
     "🔍 키워드 빈도수 추적", 
     "🏆 Top20과 드릴다운",
     "🌐 글로벌 비교"
-])
-# --- TAB 1: 빈도수 통계
-with tab1:
-    st.markdown("<div class='custom-subheader'>📌 주요 요약 </div>", unsafe_allow_html=True)
-    if not df_exec.empty and df_exec.shape[1] > 0:
-        df_exec.columns = [c.strip() for c in df_exec.columns]
-    # 모든 셀을 문자열로 합친 후, '1.' 이후 추출
-        # 전체 요약 텍스트 취합
-        full_text = "\n".join(df_exec.iloc[:, 0].astype(str).tolist())
-
-        # '1.'으로 시작하는 줄부터 추출
-        lines = full_text.splitlines()
-        start_index = next((i for i, line in enumerate(lines) if line.strip().startswith("1.")), -1)
-        
-        if start_index != -1:
-            # '1.' 이후 줄부터 요약 시작
-            summary_lines = lines[start_index:]
-        
-            # 조건에 맞는 줄 제거: 'Five Most ... Summaries:' 라인
-            summary_lines = [
-                line for line in summary_lines
-                if not (line.strip().startswith("Five Most") and line.strip().endswith("Summaries:"))
-            ]
-        
-            cleaned_summary = "\n".join(summary_lines).strip()
-            st.markdown(cleaned_summary)
-        else:
-            st.warning("⚠️ '1.'로 시작하는 본문 내용을 찾을 수 없습니다.")
-            #try:
-            #    parser = PlaintextParser.from_string(full_text, Tokenizer("chinese"))
-            #    summarizer = TextRankSummarizer()
-            #    summary_sentences = summarizer(parser.document, 5)  # 최대 5문장
-                
-            #    if summary_sentences:
-            #        for i, sentence in enumerate(summary_sentences, 1):
-            #            st.markdown(f"**{i}.** {sentence}")
-            #   else:
-            #        st.info("ℹ️ 요약할 내용이 충분하지 않습니다.")
-            #except Exception as e:
-            #    st.error(f"❌ 요약 처리 중 오류 발생: {e}")
-            
-    else:
-        st.warning("⚠️ Executive Summary 시트가 비어 있거나 형식이 올바르지 않습니다.")
+]
+# 선택된 탭을 추적 (탭 전환 시 재실행) → 아래에서 열린 탭의 내용만 계산/렌더링
+tab1, tab2, tab3, tab4, tab5 = st.tabs(tab_labels, key="active_tab", on_change="rerun")
+
+# 인접 탭 미리 계산: 각 탭의 기본 화면이 쓰는 캐시 함수를 백그라운드 스레드에서 채워 둠
+tab_prefetchers = {
+    tab_labels[0]: lambda: load_range_sheet(snapshot_key, "Executive Summary"),
+    tab_labels[1]: lambda: load_network_payload(
+        snapshot_key, next(iter(layout_options.values())), 1, NETWORK_TOP_K, tuple(color_list)
+    ),
+    tab_labels[2]: lambda: load_trend_views(snapshot_key),
+    tab_labels[3]: lambda: load_table_html("drilldown", snapshot_key, 1, 20),
+    tab_labels[4]: lambda: load_rank_tables(snapshot_key, global_snapshot_key),
+}
 
-    st.markdown("<div class='custom-subheader'>📁 다운로드할 스냅샷 선택</div>", unsafe_allow_html=True)
+@st.cache_resource
+def get_prefetch_pool():
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="tab-prefetch")
 
-    # 사용자가 선택할 수 있는 스냅샷 목록 구성 (기존 snapshot 파일 기준)
-    all_snapshot_files = glob.glob("assets/data/*_trend_summary.xlsx")
-    snapshot_options = sorted({os.path.basename(f).split("_trend_summary")[0] for f in all_snapshot_files}, reverse=True)
-    
+if prefetch_neighbor_tabs:
+    active_index = tab_labels.index(st.session_state.get("active_tab") or tab_labels[0])
+    for neighbor in (active_index - 1, active_index + 1):
+        if 0 <= neighbor < len(tab_labels) and tab_labels[neighbor] in tab_prefetchers:
+            get_prefetch_pool().submit(tab_prefetchers[tab_labels[neighbor]])
+
+# 다운로드 날짜를 바꾸면 이 부분만 다시 실행
+# 파일은 버튼을 누를 때만 읽음 (재실행마다 엑셀 전체를 메모리에 올리지 않음)
+@st.fragment
+def render_downloads(snapshot_options):
     selected_download_snapshot = st.selectbox("📅 다운로드할 날짜 선택", snapshot_options)
     
     col1, col2 = st.columns(2)
     with col1:
         china_file = f"assets/data/{selected_download_snapshot}_trend_summary.xlsx"
-        try:
-            with open(china_file, "rb") as f:
-                st.download_button(
-                    label=f"📥 {selected_download_snapshot} 중국 주간동향 엑셀 다운로드",
-                    data=f.read(),
-                    file_name=f"{selected_download_snapshot}_trend_summary.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
-        except Exception as e:
-            st.warning(f"⚠️ 중국 스냅샷 파일을 열 수 없습니다: {e}")
+        if os.path.exists(china_file):
+            st.download_button(
+                label=f"📥 {selected_download_snapshot} 중국 주간동향 엑셀 다운로드",
+                data=file_reader(china_file),
+                file_name=f"{selected_download_snapshot}_trend_summary.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                on_click="ignore"
+            )
+        else:
+            st.warning(f"⚠️ 중국 스냅샷 파일을 열 수 없습니다: {china_file}")
     
     with col2:
         global_file = f"assets/data/{selected_download_snapshot}_trend_summary_en.xlsx"
-        try:
-            with open(global_file, "rb") as f:
-                st.download_button(
-                    label=f"📥 {selected_download_snapshot} 글로벌 주간동향 엑셀 다운로드",
-                    data=f.read(),
-                    file_name=f"{selected_download_snapshot}_trend_summary_en.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
-        except Exception as e:
-            st.warning(f"⚠️ 글로벌 스냅샷 파일을 열 수 없습니다: {e}")
-      
-# --- TAB 2: 동시출현 네트워크
-with tab2:
-    if "graph_first_rendered" not in st.session_state:
-        st.session_state.graph_first_rendered = False
-
-    if not st.session_state.graph_first_rendered:
-        # 강제로 레이아웃을 한 번 바꿨다가 원래대로 돌림
-        st.session_state.graph_first_rendered = True
-        st.rerun()
+        if os.path.exists(global_file):
+            st.download_button(
+                label=f"📥 {selected_download_snapshot} 글로벌 주간동향 엑셀 다운로드",
+                data=file_reader(global_file),
+                file_name=f"{selected_download_snapshot}_trend_summary_en.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                on_click="ignore"
+            )
+        else:
+            st.warning(f"⚠️ 글로벌 스냅샷 파일을 열 수 없습니다: {global_file}")
+
+# 사이드바 기간의 중국/글로벌 스냅샷 일괄 다운로드
+# 버튼을 누르면 (처음이면 생성 후) assets/exports/의 결과물을 읽음 → 같은 기간은 세션이 달라도 다시 만들지 않음
+EXPORT_LABELS = {
+    "zip": "📦 원본 엑셀 ZIP",
+    "workbook": "📑 통합 엑셀 (시트별 합본)",
+    "parquet": "🗂 Parquet 묶음 (ZIP)",
+}
+
+def render_range_export(entries):
+    dates = sorted({e["date"] for e in entries})
+    n_china = sum(e["locale"] == "cn" for e in entries)
+    st.caption(f"{dates[0]} ~ {dates[-1]} · 중국 {n_china}개, 글로벌 {len(entries) - n_china}개 스냅샷 "
+               "(통합 엑셀/Parquet은 언어 x 시트별로 모든 스냅샷 행을 합치고 Snapshot Date 열 추가)")
+    pending = []
+    for col, (kind, label) in zip(st.columns(len(EXPORT_LABELS)), EXPORT_LABELS.items()):
+        extension, mime = EXPORT_KINDS[kind]
+        if not os.path.exists(export_path(kind, entries)):
+            pending.append(label)
+        col.download_button(
+            label=label,
+            data=export_reader(kind, entries),
+            file_name=f"kostec_{dates[0]}_{dates[-1]}{extension}",
+            mime=mime,
+            on_click="ignore",
+            key=f"range_export_{kind}",
+        )
+    if pending:
+        st.caption(f"⏳ {', '.join(pending)}: 이 기간은 처음 받을 때 생성되어 잠시 걸릴 수 있습니다.")
+
+# --- TAB 1: 빈도수 통계
+if tab1.open:
+    with tab1, profiling.section(tab_labels[0]):
+        st.markdown("<div class='custom-subheader'>📌 주요 요약 </div>", unsafe_allow_html=True)
+        df_exec, exec_failures = load_range_sheet(snapshot_key, "Executive Summary")
+        show_load_failures(exec_failures)
+        if df_exec is None:
+            df_exec = pd.DataFrame()
+        if not df_exec.empty and df_exec.shape[1] > 0:
+            df_exec.columns = [c.strip() for c in df_exec.columns]
+        # 모든 셀을 문자열로 합친 후, '1.' 이후 추출
+            # 전체 요약 텍스트 취합
+            full_text = "\n".join(df_exec.iloc[:, 0].astype(str).tolist())
+
+            # '1.'으로 시작하는 줄부터 추출
+            lines = full_text.splitlines()
+            start_index = next((i for i, line in enumerate(lines) if line.strip().startswith("1.")), -1)
         
-    st.markdown("<div class='custom-subheader'>🕸 동시출현 네트워크</div>", unsafe_allow_html=True)
-
-    layout_options = {
-        "Static (좌표고정)": {
-            "improvedLayout": False,
-            "physics": False,
-            "hierarchical": False,
-            "staticGraph": True
-        },
-        "Circular (Centered)": {
-            "improvedLayout": True,
-            "randomSeed": 42,
-            "physics": False,
-            "hierarchical": False,
-            "layout": {"hierarchical": {"enabled": False}},
-        },
-        "Force-Directed (Spring)": {
-            "improvedLayout": True,
-            "physics": False,
-            "hierarchical": False,
-        },
-        "Random": {
-            "improvedLayout": False,
-            "physics": False,
-            "hierarchical": False,
-            "layout": {"randomSeed": 42},
-        },
-        "Grid": {
-            "improvedLayout": False,
-            "physics": False,
-            "hierarchical": False,
-            "layout": {"grid": {"enabled": True}},
-        },
-        "Hierarchical - LR": {
-            "improvedLayout": True,
-            "randomSeed": 42,
-            "physics": False,
-            "hierarchical": True,
-            "layout": {"hierarchical": {"enabled": True, "direction": "LR"}}
-        },
-        "Hierarchical - RL": {
-            "improvedLayout": True,
-            "randomSeed": 42,
-            "physics": False,
-            "hierarchical": True,
-            "layout": {"hierarchical": {"enabled": True, "direction": "RL"}}
-        },
-        "Hierarchical - TB": {
-            "improvedLayout": True,
-            "randomSeed": 42,
-            "physics": False,
-            "hierarchical": True,
-            "layout": {"hierarchical": {"enabled": True, "direction": "TB"}}
-        },
-        "Hierarchical - BT": {
-            "improvedLayout": True,
-            "randomSeed": 42,
-            "physics": False,
-            "hierarchical": True,
-            "layout": {"hierarchical": {"enabled": True, "direction": "BT"}}
-        }
-    }
+            if start_index != -1:
+                # '1.' 이후 줄부터 요약 시작
+                summary_lines = lines[start_index:]
+        
+                # 조건에 맞는 줄 제거: 'Five Most ... Summaries:' 라인
+                summary_lines = [
+                    line for line in summary_lines
+                    if not (line.strip().startswith("Five Most") and line.strip().endswith("Summaries:"))
+                ]
+        
+                cleaned_summary = "\n".join(summary_lines).strip()
+                st.markdown(cleaned_summary)
+            else:
+                st.warning("⚠️ '1.'로 시작하는 본문 내용을 찾을 수 없습니다.")
+                #try:
+                #    parser = PlaintextParser.from_string(full_text, Tokenizer("chinese"))
+                #    summarizer = TextRankSummarizer()
+                #    summary_sentences = summarizer(parser.document, 5)  # 최대 5문장
+                
+                #    if summary_sentences:
+                #        for i, sentence in enumerate(summary_sentences, 1):
+                #            st.markdown(f"**{i}.** {sentence}")
+                #   else:
+                #        st.info("ℹ️ 요약할 내용이 충분하지 않습니다.")
+                #except Exception as e:
+                #    st.error(f"❌ 요약 처리 중 오류 발생: {e}")
+            
+        else:
+            st.warning("⚠️ Executive Summary 시트가 비어 있거나 형식이 올바르지 않습니다.")
 
-    altair_palettes = {
-        "viridis": [
-            "#440154", "#482777", "#3E4989", "#31688E", "#26828E",
-            "#1F9E89", "#35B779", "#6DCD59", "#B4DD2C", "#FDE725"
-        ],
-        "plasma": [
-            "#0d0887", "#6a00a8", "#b12a90", "#e16462", "#fca636", "#f0f921"
-        ],
-        "magma": [
-            "#000004", "#1b0c41", "#4f0c6b", "#781c6d", "#a52c60",
-            "#cf4446", "#ed6925", "#fb9b06", "#f7d13d", "#fcfdbf"
-        ],
-        "inferno": [
-            "#000004", "#1e0c48", "#57106e", "#87216b", "#ac375a",
-            "#cb504a", "#e97139", "#f89441", "#fdc328", "#fcffa4"
-        ],
-        "turbo": [
-            "#30123b", "#4143d3", "#4694e6", "#3ec4ac", "#3edd68",
-            "#a8eb39", "#f9f871", "#fecf3f", "#fb7d1d", "#d11807"
-        ],
-        "category10": [
-            "#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd",
-            "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"
-        ],
-        "category20": [
-            "#1f77b4", "#aec7e8", "#ff7f0e", "#ffbb78", "#2ca02c",
-            "#98df8a", "#d62728", "#ff9896", "#9467bd", "#c5b0d5",
-            "#8c564b", "#c49c94", "#e377c2", "#f7b6d2", "#7f7f7f",
-            "#c7c7c7", "#bcbd22", "#dbdb8d", "#17becf", "#9edae5"
-        ],
-        "accent": [
-            "#7fc97f", "#beaed4", "#fdc086", "#ffff99",
-            "#386cb0", "#f0027f", "#bf5b17", "#666666"
-        ],
-        "dark2": [
-            "#1b9e77", "#d95f02", "#7570b3", "#e7298a",
-            "#66a61e", "#e6ab02", "#a6761d", "#666666"
-        ],
-        "set1": [
-            "#e41a1c", "#377eb8", "#4daf4a", "#984ea3",
-            "#ff7f00", "#ffff33", "#a65628", "#f781bf", "#999999"
-        ],
-        "set2": [
-            "#66c2a5", "#fc8d62", "#8da0cb", "#e78ac3",
-            "#a6d854", "#ffd92f", "#e5c494", "#b3b3b3"
-        ],
-        "set3": [
-            "#8dd3c7", "#ffffb3", "#bebada", "#fb8072",
-            "#80b1d3", "#fdb462", "#b3de69", "#fccde5",
-            "#d9d9d9", "#bc80bd", "#ccebc5", "#ffed6f"
-        ]
-    }
-    
-    color_list = altair_palettes.get(selected_palette, ["#1f77b4", "#ff7f0e", "#2ca02c"])
-    color_cycle = itertools.cycle(color_list)
-    
-    # 1. 레이아웃 구성
-    selected_layout = st.selectbox("📐 네트워크 레이아웃 선택", list(layout_options.keys()))
-    layout_config = layout_options[selected_layout]
-    
-    # 2. 노드 구성
-    unique_nodes = set(df_cooccur["source"]).union(set(df_cooccur["target"]))
-    node_color_map = {node: next(color_cycle) for node in unique_nodes}
-    
-    nodes = [
-        Node(id=node, label=node, color=node_color_map[node], font={"color": "darkgray"})
-        for node in unique_nodes
-    ]
-    
-    # 4. 엣지 구성
-    edges = [
-        Edge(source=row.source, target=row.target, label=str(row.count))
-        for row in df_cooccur.itertuples()
-    ]
+        st.markdown("<div class='custom-subheader'>📁 다운로드할 스냅샷 선택</div>", unsafe_allow_html=True)
+
+        # 사용자가 선택할 수 있는 스냅샷 목록 구성 (카탈로그의 중국 스냅샷 기준)
+        snapshot_options = catalog.dates("cn")[::-1]
     
-    # 5. 그래프 구성 옵션
+        render_downloads(snapshot_options)
+
+        st.markdown("<div class='custom-subheader'>📦 기간 일괄 다운로드</div>", unsafe_allow_html=True)
+        render_range_export(selected_entries + selected_entries_global)
+
+# 레이아웃/엣지 기준을 바꾸면 이 부분만 다시 실행
+@st.fragment
+def render_network(snapshot_key, df_cooccur_edges, layout_options, color_list):
+    from streamlit_agraph import agraph, Node, Edge, Config
+
+    # 1. 레이아웃 / 엣지 정리 기준
+    layout_col, min_col, top_col = st.columns([2, 1, 1])
+    selected_layout = layout_col.selectbox("📐 네트워크 레이아웃 선택", list(layout_options.keys()))
+    max_edge_count = int(df_cooccur_edges["count"].max()) if not df_cooccur_edges.empty else 1
+    min_edge_count = min_col.number_input("🔗 최소 동시출현 수", min_value=1, max_value=max(max_edge_count, 1), value=1)
+    top_k_edges = top_col.number_input("✂️ 상위 엣지 수 (0=전체)", min_value=0, value=NETWORK_TOP_K, step=10)
+
+    # 2. 노드/엣지 + 좌표 (기간·레이아웃·기준·팔레트별 캐시)
+    node_payload, edge_payload = load_network_payload(
+        snapshot_key, layout_options[selected_layout], int(min_edge_count), int(top_k_edges) or None, tuple(color_list)
+    )
+    st.caption(f"노드 {len(node_payload)}개 · 엣지 {len(edge_payload)}개 (기간 내 쌍별 합산, 전체 {len(df_cooccur_edges)}쌍)")
+
+    nodes = [Node(**node) for node in node_payload]
+    edges = [Edge(**edge) for edge in edge_payload]
+
+    # 3. 그래프 구성 옵션: 좌표가 정해져 있으므로 물리/자동 배치 끔
     config = Config(
-        layout=layout_config,
-        physics=True,
-        staticGraph=False
+        height=750,
+        width=750,
+        physics=False,
+        layout={"improvedLayout": False, "hierarchical": {"enabled": False}},
     )
-    
-    # 6. 렌더링
+
+    # 4. 렌더링
     try:
         agraph(nodes=nodes, edges=edges, config=config)
     except Exception as e:
         st.error(f"❌ 네트워크 그래프 렌더링 실패: {e}")
 
-# --- TAB 3: 빈도수 추적
-with tab3:
-    st.markdown("<div class='custom-subheader'>📈 7일 이동 평균 기반 키워드 트렌드</div>", unsafe_allow_html=True)
-
-    chart_type = st.selectbox("🎨 그래프 유형 선택", ["막대그래프", "선그래프", "도넛형 그래프"])
-    selected_keywords = st.multiselect("📌 키워드 선택", df_rolling.columns.tolist(), default=df_rolling.columns[:5])
+# --- TAB 2: 동시출현 네트워크
+if tab2.open:
+    with tab2, profiling.section(tab_labels[1]):
+        st.markdown("<div class='custom-subheader'>🕸 동시출현 네트워크</div>", unsafe_allow_html=True)
+
+        render_network(snapshot_key, range_frames["cooccur_edges"], layout_options, color_list)
+
+# 그래프 유형/키워드를 바꾸면 이 부분만 다시 실행 (전체 스크립트와 다른 탭은 그대로)
+@st.fragment
+def render_trend_chart(trend_views, selected_palette, header):
+    import altair as alt
+
+    view_col, type_col = st.columns(2)
+    trend_view = view_col.selectbox("📐 추세 기준", list(TREND_VIEW_LABELS), format_func=TREND_VIEW_LABELS.get)
+    chart_type = type_col.selectbox("🎨 그래프 유형 선택", ["막대그래프", "선그래프", "도넛형 그래프"])
+    header.markdown(f"<div class='custom-subheader'>📈 {TREND_VIEW_LABELS[trend_view]} 기반 키워드 트렌드</div>", unsafe_allow_html=True)
+    selected_keywords = st.multiselect("📌 키워드 선택", trend_views.keywords, default=trend_views.keywords[:5])
     color_scheme = alt.Scale(scheme=selected_palette)
+    value_axis = alt.Y("value:Q", title=TREND_VIEW_LABELS[trend_view])
     
     if selected_keywords:
-      df_long = df_rolling[selected_keywords].reset_index().melt(
+      # 모든 기준은 기간별로 미리 계산되어 있어 선택한 키워드 열만 꺼냄
+      df_long = trend_views.frame(trend_view, selected_keywords).reset_index().melt(
         id_vars="Publication Date",
         var_name="Keyword",
-        value_name="7d_avg"
+        value_name="value"
       )
 
       if chart_type == "선그래프":
         chart = alt.Chart(df_long).mark_line(point=True).encode(
             x="Publication Date:T",
-            y="7d_avg:Q",
+            y=value_axis,
             color=alt.Color("Keyword:N", scale=color_scheme)
         ).properties(width=800)
         st.altair_chart(chart, use_container_width=True)
@@ -760,9 +645,9 @@ with tab3:
       elif chart_type == "막대그래프":
         chart = alt.Chart(df_long).mark_bar(size=30).encode(
             x=alt.X("Publication Date:T", axis=alt.Axis(labelAngle=-45)),
-            y="7d_avg:Q",
+            y=value_axis,
             color=alt.Color("Keyword:N", scale=color_scheme),
-            tooltip=["Publication Date:T", "Keyword:N", "7d_avg:Q"]
+            tooltip=["Publication Date:T", "Keyword:N", alt.Tooltip("value:Q", title=TREND_VIEW_LABELS[trend_view])]
         ).properties(width=800)
         st.altair_chart(chart, use_container_width=True)
 
@@ -774,7 +659,7 @@ with tab3:
         #recent_data = df_long[df_long["Publication Date"] >= start_date]
 
         # 키워드별 총합
-        keyword_totals = df_long.groupby("Keyword")["7d_avg"].sum()
+        keyword_totals = df_long.groupby("Keyword")["value"].sum()
         keyword_totals = keyword_totals[keyword_totals > 0]
 
         if keyword_totals.empty:
@@ -796,128 +681,68 @@ with tab3:
                 tooltip=[alt.Tooltip("Keyword"), alt.Tooltip("Value")]
             )
             st.altair_chart(donut, use_container_width=True)
-            
-# --- TAB 4: 키워드 Top 20 상세 보기 포함
-with tab4:
-    st.markdown("<div class='custom-subheader'>📌 키워드 Top 20 (상세 보기)</div>", unsafe_allow_html=True)
-
-    df_summary.columns = [col.strip() for col in df_summary.columns]
-
-    # ✅ groupby로 Count 집계 + 대표 요약 + 링크 모음
-    grouped = (
-        df_summary
-        .groupby("Keyword")
-        .agg({
-            "Keyword Count": "sum",
-            "Short Summary": lambda x: x.dropna().iloc[0] if not x.dropna().empty else "",
-            "Detailed Summary": lambda x: x.dropna().iloc[0] if not x.dropna().empty else "",
-            "Source URL": lambda urls: list(set(filter(lambda u: isinstance(u, str), urls)))
-        })
-        .reset_index()
-        .sort_values("Keyword Count", ascending=False)
-        .head(20)
-    )
 
-    table_data = []
-    for i, row in grouped.iterrows():
-        index = i + 1
-        keyword = row["Keyword"]
-        count = row["Keyword Count"]
+# --- TAB 3: 빈도수 추적
+if tab3.open:
+    with tab3, profiling.section(tab_labels[2]):
+        trend_header = st.empty()
 
-        summary_html = f'<span title="{html.escape(row["Detailed Summary"])}">{html.escape(row["Short Summary"])}' \
-                       f'</span>'
+        render_trend_chart(load_trend_views(snapshot_key), selected_palette, trend_header)
 
-        # 여러 링크 모아서 한 줄에 표시
-        urls = row["Source URL"]
+# 페이지 크기(N)/페이지를 바꾸면 이 부분만 다시 실행
+@st.fragment
+def render_drilldown(snapshot_key, total, header):
+    page, page_size = page_controls(total, "drilldown", "📏 페이지당 키워드 수 (N)", DRILLDOWN_PAGE_SIZES, 20)
+    start = (page - 1) * page_size
+    title = f"키워드 Top {page_size}" if page == 1 else f"키워드 {start + 1}~{min(start + page_size, total)}위"
+    header.markdown(f"<div class='custom-subheader'>📌 {title} (상세 보기)</div>", unsafe_allow_html=True)
+    st.caption(f"전체 {total}개 키워드 · 요약에 마우스를 올리면 상세 요약, 🔗는 키워드의 출처 링크 전체")
 
-        # 문자열인 경우 (단일 URL), 리스트로 감쌈
-        if isinstance(urls, str):
-            urls = [urls]
-        elif not isinstance(urls, list):
-            urls = []
-        
-        # 링크 HTML 생성
-        link_html = f'<a href="{urls[0]}" target="_blank">🔗 link</a>'
-        table_data.append((keyword, count, summary_html, link_html))
-        
-    df_display = pd.DataFrame(table_data, columns=["Keyword", "Count", "Summary", "Sources"])
-    st.markdown(df_display.to_html(escape=False, index=False), unsafe_allow_html=True)
-    
-with tab5:
-    st.markdown("<div class='custom-subheader'>🏅 중국 vs 글로벌 키워드 순위 비교</div>", unsafe_allow_html=True)
-
-    # 1. 키워드 매핑 테이블 생성
-    with open("assets/input/keywords.txt", "r", encoding="utf-8") as f:
-        zh_keywords = [line.strip() for line in f if line.strip()]
-    with open("assets/input/en_keywords.txt", "r", encoding="utf-8") as f:
-        en_keywords = [line.strip() for line in f if line.strip()]
-
-    df_map = pd.DataFrame({
-        "zh_keyword": zh_keywords,
-        "en_keyword": en_keywords
-    })
-    #st.write(df_map)
-    # 2. 국내 Summary Table
-    df_summary.columns = [col.strip() for col in df_summary.columns]
-    zh_set = set(df_summary["Keyword"])
-
-    # 3. 글로벌 Summary Table
-    df_summary_global_all = []
-
-    for path in selected_files_global:
-        try:
-            xls = pd.ExcelFile(path)
-            df_s = pd.read_excel(xls, sheet_name="Summary Table")
-            df_summary_global_all.append(df_s)
-        except Exception as e:
-            st.warning(f"⚠️ 파일 로딩 실패: {path}, 오류: {e}")
-    
-    # 하나의 DataFrame으로 통합
-    if df_summary_global_all:
-        df_global_summary = pd.concat(df_summary_global_all, ignore_index=True)
-    else:
-        st.error("❌ 선택한 기간에 해당하는 데이터를 찾을 수 없습니다.")
-        st.stop()
-    
-    df_global_summary.columns = [col.strip() for col in df_global_summary.columns]
+    # ✅ 요약/링크 HTML은 현재 페이지 행만 생성해 캐시
+    st.markdown(load_table_html("drilldown", snapshot_key, page, page_size), unsafe_allow_html=True)
 
-    # 4. 글로벌 키워드 매핑 (영문 → 중문)
-    map_dict = {
-        en.strip().lower(): zh.strip()
-        for en, zh in zip(df_map["en_keyword"], df_map["zh_keyword"])
-    }
-    
-    # df_global_summary의 Keyword도 정규화해서 매핑
-    df_global_summary["zh_keyword"] = df_global_summary["Keyword"].str.strip().str.lower().map(map_dict)
-    
-    matched_zh = set(df_global_summary["zh_keyword"].dropna())
-    # 1. 국내 순위표
-    df_rank_china = (
-        df_summary
-        .groupby("Keyword", as_index=False)["Keyword Count"].sum()
-        .assign(Rank_China=lambda df: df["Keyword Count"].rank(ascending=False, method="min").astype(int))
-        .sort_values("Rank_China")
-        [["Rank_China", "Keyword", "Keyword Count"]]
-    )
-    
-    # 2. 글로벌 순위표 (zh_keyword 기준)
-    df_rank_global = (
-        df_global_summary
-        .groupby("zh_keyword", as_index=False)["Keyword Count"].sum()
-        .assign(Rank_Global=lambda df: df["Keyword Count"].rank(ascending=False, method="min").astype(int))
-        .sort_values("Rank_Global")
-        .rename(columns={"zh_keyword": "Keyword"})
-        [["Rank_Global", "Keyword", "Keyword Count"]]
-    )
-    
+# --- TAB 4: 키워드 Top 20 상세 보기 포함
+if tab4.open:
+    with tab4, profiling.section(tab_labels[3]):
+        drilldown_header = st.empty()
+
+        df_drilldown, summary_failures = load_keyword_drilldown(snapshot_key)
+        show_load_failures(summary_failures)
+
+        render_drilldown(snapshot_key, len(df_drilldown), drilldown_header)
+
+# 순위표 페이지를 바꾸면 이 부분만 다시 실행 (두 표가 같은 순위 구간을 표시)
+@st.fragment
+def render_rank_tables(rank_key, total_china, total_global):
+    page, page_size = page_controls(max(total_china, total_global), "ranks", "📏 페이지당 순위 수", RANK_PAGE_SIZES, 50)
     col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("#### 🇨🇳 중국 키워드 순위 (Rank_China)")
-        html_china = df_rank_china.reset_index(drop=True).to_html(index=False, escape=False)
-        st.markdown(html_china, unsafe_allow_html=True)
 
-    with col2:
-        st.markdown("#### 🌍 글로벌 키워드 순위 (Rank_Global)")
-        html_global = df_rank_global.reset_index(drop=True).to_html(index=False, escape=False)
-        st.markdown(html_global, unsafe_allow_html=True)
+    for col, view, total, title in [
+        (col1, "rank_china", total_china, "#### 🇨🇳 중국 키워드 순위 (Rank_China)"),
+        (col2, "rank_global", total_global, "#### 🌍 글로벌 키워드 순위 (Rank_Global)"),
+    ]:
+        with col:
+            st.markdown(title)
+            if (page - 1) * page_size < total:
+                st.markdown(load_table_html(view, rank_key, page, page_size), unsafe_allow_html=True)
+            else:
+                st.caption("이 페이지에 해당하는 순위가 없습니다.")
+
+# --- TAB 5: 중국 vs 글로벌 순위 비교
+if tab5.open:
+    with tab5, profiling.section(tab_labels[4]):
+        st.markdown("<div class='custom-subheader'>🏅 중국 vs 글로벌 키워드 순위 비교</div>", unsafe_allow_html=True)
+
+        # 글로벌 Summary Table은 순위 계산에 필요한 컬럼만 읽음
+        df_rank_china, df_rank_global, global_failures = load_rank_tables(snapshot_key, global_snapshot_key)
+        show_load_failures(global_failures)
+
+        if df_rank_global is None:
+            st.error("❌ 선택한 기간에 해당하는 데이터를 찾을 수 없습니다.")
+            stop_run()
+
+        render_rank_tables((snapshot_key, global_snapshot_key), len(df_rank_china), len(df_rank_global))
+
+
+# --- 5. 프로파일링 패널
+render_profiling_panel()
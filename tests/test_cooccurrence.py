@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Description : 벡터화한 analyze_cooccurrence가 기존 행 단위 루프와 같은 결과인지 (행 순서 포함)
+#   - 기준 구현: 기존 대시보드 수집 코드의 iterrows + combinations 루프를 그대로 옮김
+#   - assets/data의 모든 스냅샷 요약표 + 무작위 표 300개 (결측 텍스트, Short Summary 없음, 공백 뒤 중복 키워드)
+# Usage : python -m pytest tests
+# License : MIT
+
+import glob
+import os
+import random
+from collections import defaultdict
+from itertools import combinations
+
+import pandas as pd
+import pytest
+
+from kostec.cooccurrence import analyze_cooccurrence
+from kostec.snapshot_store import DATA_DIR, read_excel_sheets
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAPSHOTS = sorted(glob.glob(os.path.join(REPO_ROOT, DATA_DIR, "*_trend_summary*.xlsx")))
+
+
+def reference_cooccurrence(df_summary):
+    keywords_list = [kw.strip() for kw in df_summary["Keyword"].dropna().unique().tolist()]
+
+    cooccur_counter = defaultdict(int)
+    association_counter = defaultdict(int)
+    for _, row in df_summary.iterrows():
+        text = (str(row.get("Detailed Summary", "")) + " " + str(row.get("Short Summary", ""))).lower()
+        present_keywords = [kw for kw in keywords_list if kw.lower() in text]
+        for kw1, kw2 in combinations(sorted(set(present_keywords)), 2):
+            cooccur_counter[(kw1, kw2)] += 1
+        for kw in present_keywords:
+            association_counter[kw] += 1
+
+    df_cooccur = pd.DataFrame([{"source": k1, "target": k2, "count": v} for (k1, k2), v in cooccur_counter.items()])
+    df_association = pd.DataFrame([{"term": k, "count": v} for k, v in association_counter.items()])
+    return df_cooccur, df_association
+
+
+def assert_same(df_summary):
+    for expected, actual in zip(reference_cooccurrence(df_summary), analyze_cooccurrence(df_summary)):
+        pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize("path", SNAPSHOTS, ids=os.path.basename)
+def test_matches_loop_on_stored_snapshots(path):
+    df_summary = read_excel_sheets(path, ["Summary Table"])["Summary Table"]
+    df_summary.columns = [str(col).strip() for col in df_summary.columns]
+    assert_same(df_summary)
+
+
+def test_matches_loop_on_random_frames():
+    rng = random.Random(0)
+    words = ["ai", "chip", "ai chip", "robot", "nan", "data", "cloud", "5g", "ev", "battery", " ai ", "반도체"]
+    for case in range(300):
+        rows = rng.randint(0, 30)
+        df = pd.DataFrame({
+            "Keyword": [rng.choice(words + [None]) for _ in range(rows)],
+            "Detailed Summary": [
+                " ".join(rng.choice(words) for _ in range(rng.randint(0, 5))) if rng.random() > 0.1 else None
+                for _ in range(rows)
+            ],
+            "Short Summary": [rng.choice(words).upper() for _ in range(rows)],
+        })
+        if case % 7 == 0:
+            df = df.drop(columns=["Short Summary"])
+        assert_same(df)
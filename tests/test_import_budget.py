@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+# Description : 대시보드 시작 시 무거운 모듈이 로드되지 않는지 (bench.import_budget.DEFERRED_MODULES)
+#   - 새 인터프리터에서 streamlitdashboard.py의 최상위 import 문을 실행한 뒤 sys.modules 확인
+#   - 시간 측정은 기계마다 흔들리므로 테스트에서는 하지 않음 (python -m bench.import_budget)
+# Usage : python -m pytest tests
+# License : MIT
+
+from bench.import_budget import eager_modules
+
+
+def test_deferred_modules_not_loaded_at_startup():
+    assert eager_modules() == []
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Description : 서버 측 네트워크 데이터(network_payload)가 기존 탭 2 그래프와 같은 노드/엣지를 담는지
+#   - 기준: 기존 탭 2처럼 스냅샷별 Cooccurrence 시트를 이어 붙여 행마다 엣지, source/target 합집합을 노드로
+#   - 정리 없이(min_count=1, top_k 없음) 노드 집합이 같고, 쌍별 엣지 수가 기존 엣지의 쌍별 합과 같아야 함
+#   - min_count/top_k 정리는 단순 정렬 구현과, 좌표는 모든 레이아웃에서 유한하고 실행마다 같은지 확인
+# Usage : python -m pytest tests
+# License : MIT
+
+import glob
+import math
+import os
+import random
+
+import pandas as pd
+import pytest
+
+from kostec.aggregates import build_snapshot_partials, combine_partials
+from kostec.network import LAYOUTS, network_payload
+from kostec.snapshot_store import DATA_DIR, SHEET_NAMES, read_excel_sheets
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CN_SNAPSHOTS = sorted(glob.glob(os.path.join(REPO_ROOT, DATA_DIR, "*_trend_summary.xlsx")))
+
+
+def reference_graph(df_cooccur):
+    # 기존 탭 2: 노드는 source/target 합집합, 엣지는 Cooccurrence 행마다 하나
+    nodes = set(df_cooccur["source"]).union(set(df_cooccur["target"]))
+    edges = [(row.source, row.target, row.count) for row in df_cooccur.itertuples()]
+    return nodes, edges
+
+
+def pair_sums(edges):
+    sums = {}
+    for source, target, count in edges:
+        sums[(source, target)] = sums.get((source, target), 0) + int(count)
+    return sums
+
+
+def assert_same_graph(df_cooccur, df_edges):
+    ref_nodes, ref_edges = reference_graph(df_cooccur)
+    nodes, edges = network_payload(df_edges, "shell")
+    assert {node["id"] for node in nodes} == ref_nodes
+    assert len(edges) == len({(e["source"], e["target"]) for e in edges})
+    assert {(e["source"], e["target"]): int(e["label"]) for e in edges} == pair_sums(ref_edges)
+
+
+@pytest.mark.skipif(not CN_SNAPSHOTS, reason="저장된 스냅샷 없음")
+def test_payload_matches_concatenated_sheets_on_stored_snapshots():
+    cooccur_sheets, partials = [], []
+    for path in CN_SNAPSHOTS:
+        sheets = read_excel_sheets(path)
+        df_co = sheets["Cooccurrence"].rename(columns=lambda c: str(c).strip())
+        cooccur_sheets.append(df_co)
+        partials.append(build_snapshot_partials(*(sheets[name] for name in SHEET_NAMES)))
+    assert_same_graph(pd.concat(cooccur_sheets, ignore_index=True), combine_partials(partials)["cooccur_edges"])
+
+
+def _random_edges(rng, rows):
+    words = [f"k{i}" for i in range(rng.randint(2, 15))]
+    pairs = [tuple(sorted(rng.sample(words, 2))) for _ in range(rows)]
+    return pd.DataFrame({"source": [a for a, _ in pairs], "target": [b for _, b in pairs],
+                         "count": [rng.randint(1, 6) for _ in range(rows)]})
+
+
+def test_payload_matches_row_edges_on_random_frames():
+    rng = random.Random(0)
+    for _ in range(100):
+        df = _random_edges(rng, rng.randint(1, 60))
+        assert_same_graph(df, df)
+
+
+def test_pruning_keeps_top_pairs():
+    rng = random.Random(1)
+    for _ in range(100):
+        df = _random_edges(rng, rng.randint(1, 60))
+        min_count, top_k = rng.randint(1, 8), rng.choice([None, 1, 3, 10])
+        ranked = sorted(((-c, s, t) for (s, t), c in pair_sums(df.itertuples(index=False)).items() if c >= min_count))
+        expected = [(s, t, str(-c)) for c, s, t in ranked[:top_k]]
+        _, edges = network_payload(df, "shell", min_count=min_count, top_k=top_k)
+        assert [(e["source"], e["target"], e["label"]) for e in edges] == expected
+
+
+@pytest.mark.parametrize("layout", sorted(LAYOUTS))
+def test_positions_are_finite_and_stable(layout):
+    df = _random_edges(random.Random(2), 40)
+    first, _ = network_payload(df, layout)
+    again, _ = network_payload(df, layout)
+    assert first == again
+    assert all(math.isfinite(node["x"]) and math.isfinite(node["y"]) for node in first)
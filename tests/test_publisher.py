@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Description : publish_files 재시도 규칙 (LocalGitAPI 대역 저장소)
+#   - 브랜치가 동시에 움직이면 최신 head 기준으로 다시 커밋
+#   - 다시 계산했을 때 바뀐 파일이 없으면 커밋하지 않음
+#   - 인증 오류는 재시도하지 않고 바로 올림
+# Usage : python -m pytest tests
+# License : MIT
+
+import subprocess
+
+import pytest
+from github import BadCredentialsException
+
+from kostec import publisher
+from kostec.publisher import LocalGitAPI, publish_files
+
+
+@pytest.fixture
+def remote(tmp_path, monkeypatch):
+    # 원격 역할의 bare 저장소 + 작업 디렉토리(업로드할 파일)
+    repo = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "-q", "--bare", "-b", "main", str(repo)], check=True)
+    api = LocalGitAPI(str(repo))
+    api._git("update-ref", "refs/heads/main", _root_commit(api, api._git("mktree", data=b"")))
+    work = tmp_path / "work"
+    (work / "assets").mkdir(parents=True)
+    monkeypatch.chdir(work)
+    monkeypatch.setattr(publisher, "BACKOFF_SECONDS", 0)
+    return api
+
+
+def _root_commit(api, tree):
+    return api._git("commit-tree", tree, "-m", "root", env={
+        "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@localhost",
+        "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@localhost",
+    })
+
+
+def _write(path, content):
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+def _push(api, files):
+    # 다른 업로더가 먼저 올린 커밋
+    head_sha, tree_sha = api.head("main")
+    blobs = {path: api.create_blob(content) for path, content in files.items()}
+    commit_sha = api.create_commit("concurrent", api.create_tree(tree_sha, blobs), head_sha)
+    LocalGitAPI.update_branch(api, "main", commit_sha, head_sha)
+    return commit_sha
+
+
+class RacingAPI(LocalGitAPI):
+    """첫 update_branch 직전에 다른 커밋이 브랜치를 옮김."""
+
+    def __init__(self, api, files):
+        super().__init__(api.repo_dir)
+        self.files = files
+        self.updates = 0
+
+    def update_branch(self, branch, commit_sha, expected_sha):
+        self.updates += 1
+        if self.updates == 1:
+            _push(self, self.files)
+        return super().update_branch(branch, commit_sha, expected_sha)
+
+
+def test_branch_moved_retries_on_new_head(remote):
+    path = _write("assets/a.txt", b"mine")
+    api = RacingAPI(remote, {"assets/other.txt": b"theirs"})
+    messages = []
+
+    result = publish_files([path], api, "update", progress=messages.append)
+
+    assert api.updates == 2
+    assert len(messages) == 1 and "브랜치가 갱신" in messages[0]
+    assert result["commit"] == remote.head("main")[0]
+    assert set(remote.blob_shas(remote.head("main")[1])) == {"assets/a.txt", "assets/other.txt"}
+    parent = remote._git("rev-parse", f"{result['commit']}^")
+    assert remote._git("log", "-1", "--format=%s", parent) == "concurrent"
+
+
+def test_retry_skipped_when_files_already_uploaded(remote):
+    path = _write("assets/a.txt", b"same")
+    api = RacingAPI(remote, {"assets/a.txt": b"same"})
+
+    result = publish_files([path], api, "update", progress=lambda m: None)
+
+    assert api.updates == 1
+    assert result == {"commit": None, "changed": [], "unchanged": 1}
+    assert remote._git("log", "-1", "--format=%s", "main") == "concurrent"
+
+
+def test_auth_error_is_not_retried(remote):
+    path = _write("assets/a.txt", b"mine")
+    before = remote.head("main")[0]
+
+    class DeniedAPI(LocalGitAPI):
+        updates = 0
+
+        def update_branch(self, branch, commit_sha, expected_sha):
+            DeniedAPI.updates += 1
+            raise BadCredentialsException(401, {"message": "Bad credentials"}, None)
+
+    with pytest.raises(BadCredentialsException):
+        publish_files([path], DeniedAPI(remote.repo_dir), "update", progress=lambda m: None)
+    assert DeniedAPI.updates == 1
+    assert remote.head("main")[0] == before
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Description : 스트리밍 파서(ReportStreamParser)와 표 파서(parse_markdown_table)의 구분선 규칙 일치
+# Usage : python -m pytest tests
+# License : MIT
+
+import pytest
+
+from kostec.markdown_table import parse_markdown_table
+from kostec.report_parser import ReportStreamParser
+
+SEPARATORS = [
+    "|---|---|---|",
+    "| --- | --- | --- |",
+    "|:---|:---:|---:|",
+    "| :-- | :-: | --: |",
+]
+
+
+def _report(separator):
+    table = "\n".join([
+        "| Keyword | Keyword Count | Summary |",
+        separator,
+        "| AI | 3 | 칩 \\| 반도체 |",
+        "| 로봇 | 1 | 휴머노이드 |",
+        "",
+    ])
+    return f"개요\n<excel_report>\n<sheet1>\n{table}</sheet1>\n<sheet2>\n{table}</sheet2>\n" \
+           "<executive_summary>요약</executive_summary>\n</excel_report>"
+
+
+@pytest.mark.parametrize("separator", SEPARATORS)
+@pytest.mark.parametrize("chunk_size", [1, 7, 10_000])
+def test_stream_rows_match_table_parser(separator, chunk_size):
+    text = _report(separator)
+    streamed = []
+    parser = ReportStreamParser(on_row=lambda section, cells: streamed.append((section, cells)))
+    for i in range(0, len(text), chunk_size):
+        parser.feed(text[i:i + chunk_size])
+    sheet1, sheet2, summary = parser.finish()
+
+    assert parser.rows == {"sheet1": 2, "sheet2": 2}
+    assert summary == "요약"
+    for section, sheet_text in (("sheet1", sheet1), ("sheet2", sheet2)):
+        df, problems = parse_markdown_table(sheet_text)
+        assert problems == []
+        expected = [[str(v).strip() for v in row] for row in df.itertuples(index=False)]
+        assert [cells for name, cells in streamed if name == section] == expected
+
+
+@pytest.mark.parametrize("separator", SEPARATORS)
+def test_truncated_stream_keeps_completed_rows(separator):
+    text = _report(separator)
+    parser = ReportStreamParser()
+    parser.feed(text[:text.index("| 로봇")] + "| 로봇 | 1 | 휴머")
+    sheet1, _, _ = parser.finish()
+
+    assert parser.rows["sheet1"] == 1
+    df, _ = parse_markdown_table(sheet1)
+    assert df.iloc[:, 0].str.strip().tolist() == ["AI"]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Description : 누적합 시계열 저장소(KeywordSeries/TrendViews)가 pandas 밀집 피벗 계산과 같은지
+#   - 기준: 일자 x 키워드 피벗을 달력(첫 게재일~마지막 게재일)으로 채운 뒤 rolling/ewm/주별·월별 합계
+#   - 저장된 중국 스냅샷 전체의 부분 집계 + 무작위 일별 표 100개
+# Usage : python -m pytest tests
+# License : MIT
+
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kostec.aggregates import build_snapshot_partials, combine_partials
+from kostec.snapshot_store import DATA_DIR, read_excel_sheets
+from kostec.timeseries import DATE_COLUMN, KeywordSeries
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CN_SNAPSHOTS = sorted(glob.glob(os.path.join(REPO_ROOT, DATA_DIR, "*_trend_summary.xlsx")))
+
+
+def dense_pivot(df_daily):
+    # 기존 대시보드의 피벗을 실제 달력으로 다시 색인 (게재가 없는 날은 0)
+    df_pivot = df_daily.pivot_table(index=DATE_COLUMN, columns="Keyword", values="count", fill_value=0).sort_index()
+    calendar = pd.date_range(df_pivot.index.min(), df_pivot.index.max(), freq="D", name=DATE_COLUMN)
+    return df_pivot.reindex(calendar, fill_value=0).astype(np.int64)
+
+
+def reference_views(df_pivot):
+    def period_sums(freq):
+        sums = df_pivot.groupby(df_pivot.index.to_period(freq)).sum()
+        sums.index = pd.DatetimeIndex(sums.index.start_time, name=DATE_COLUMN)
+        return sums
+
+    return {
+        "rolling7": df_pivot.rolling(window=7, min_periods=1).mean(),
+        "rolling14": df_pivot.rolling(window=14, min_periods=1).mean(),
+        "rolling28": df_pivot.rolling(window=28, min_periods=1).mean(),
+        "ewm7": df_pivot.ewm(span=7, adjust=False).mean(),
+        "weekly": period_sums("W"),
+        "monthly": period_sums("M"),
+    }
+
+
+def assert_views_match(df_daily, keywords):
+    views = KeywordSeries.from_daily(df_daily).trend_views()
+    expected = reference_views(dense_pivot(df_daily))
+    assert views.keywords == sorted(expected["rolling7"].columns)
+    for name, df_expected in expected.items():
+        actual = views.frame(name, keywords)
+        pd.testing.assert_frame_equal(actual, df_expected[keywords], check_dtype=False, check_index_type=False,
+                                      check_column_type=False, check_freq=False, check_names=False)
+
+
+def _cn_daily():
+    partials = []
+    for path in CN_SNAPSHOTS:
+        sheets = read_excel_sheets(path, ["Summary Table", "Sources"])
+        partials.append(build_snapshot_partials(sheets["Summary Table"], sheets["Sources"]))
+    return combine_partials(partials)["daily"]
+
+
+@pytest.mark.skipif(not CN_SNAPSHOTS, reason="저장된 스냅샷 없음")
+def test_views_match_dense_pivot_on_stored_snapshots():
+    df_daily = _cn_daily()
+    keywords = sorted(df_daily["Keyword"].unique())
+    assert_views_match(df_daily, keywords[:5] + keywords[-3:])
+
+
+def test_views_match_dense_pivot_on_random_series():
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        rows = int(rng.integers(1, 200))
+        df = pd.DataFrame({
+            DATE_COLUMN: pd.Timestamp("2024-12-20") + pd.to_timedelta(rng.integers(0, int(rng.integers(1, 120)), rows), "D"),
+            "Keyword": [f"k{i}" for i in rng.integers(0, int(rng.integers(1, 30)), rows)],
+            "count": rng.integers(1, 5, rows),
+        })
+        df_daily = df.groupby([DATE_COLUMN, "Keyword"], as_index=False)["count"].sum()
+        keywords = sorted(df_daily["Keyword"].unique())
+        picked = [keywords[i] for i in rng.choice(len(keywords), size=min(4, len(keywords)), replace=False)]
+        assert_views_match(df_daily, picked)
+
+
+def test_empty_series_has_empty_views():
+    views = KeywordSeries.from_daily(pd.DataFrame(columns=[DATE_COLUMN, "Keyword", "count"])).trend_views()
+    assert views.keywords == []
+    for name in ["rolling7", "ewm7", "weekly", "monthly"]:
+        assert views.frame(name, []).empty